@@ -1,5 +1,6 @@
 from django.conf import settings
 
+from apps.api_authentication.api.async_views import AsyncAuthApiView
 from apps.api_authentication.api.views import AuthApiView
 from apps.utils.router import DefaultApiRouter, SimpleApiRouter
 
@@ -10,4 +11,4 @@ else:
 
 URL_VERSION = r"^(?P<version>v[1])"
 
-router.register("v1/auth", AuthApiView, basename="auth")
+router.register("v1/auth", AsyncAuthApiView if settings.API_ASYNC_VIEWS else AuthApiView, basename="auth")
@@ -0,0 +1,40 @@
+from asgiref.sync import sync_to_async
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+
+from apps.api_authentication.api.views import AuthApiView
+from apps.base.api.async_views import AsyncApiViewMixin, async_action
+
+
+class AsyncAuthApiView(AsyncApiViewMixin, AuthApiView):
+    """Async version of AuthApiView for ASGI server, enabled by settings.API_ASYNC_VIEWS.
+    Token obtain loads user with async ORM and checks password in password hashing pool.
+    Refresh and verify run in thread: check of revoked tokens may read shared revocation store.
+    """
+
+    @async_action(
+        AuthApiView.token, _serializer_class="apps.api_authentication.api.serializers.AsyncTokenObtainPairSerializer"
+    )
+    async def token(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+
+        try:
+            await serializer.ais_valid(raise_exception=True)
+        except TokenError as e:
+            raise InvalidToken(e.args[0])
+
+        return Response(serializer.validated_data, status=status.HTTP_200_OK)
+
+    @async_action(AuthApiView.refresh)
+    async def refresh(self, request, *args, **kwargs):
+        return await sync_to_async(self.process_token_base_action)(request, *args, **kwargs)
+
+    @async_action(AuthApiView.verify)
+    async def verify(self, request, *args, **kwargs):
+        return await sync_to_async(self.process_token_base_action)(request, *args, **kwargs)
+
+    @async_action(AuthApiView.logout)
+    async def logout(self, request, *args, **kwargs):
+        # Revocation is written to shared store
+        return await sync_to_async(super().logout)(request, *args, **kwargs)
@@ -0,0 +1,93 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import router
+from django.utils.crypto import salted_hmac
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+User = get_user_model()
+
+USER_CACHE_KEY_FORMAT = "auth_user_%s"
+# Fields of user that are cached for authentication, other fields are loaded from database on first access
+SLIM_USER_FIELDS = ("id", "is_active", "is_verified", "is_staff", "is_superuser")
+# Claim of tokens with stamp of user password, tokens are not accepted after password change
+PASSWORD_STAMP_CLAIM = "pwd"
+
+
+def get_password_stamp(password: str) -> str:
+    """Short stamp of password hash, it changes when password is changed"""
+    return salted_hmac("apps.api_authentication.password_stamp", password, algorithm="sha256").hexdigest()[:16]
+
+
+def get_user_cache_key(user_id) -> str:
+    return USER_CACHE_KEY_FORMAT % user_id
+
+
+def invalidate_cached_user(user_id):
+    caches[settings.AUTH_USER_CACHE_ALIAS].delete(get_user_cache_key(user_id))
+
+
+def get_user_record(user_id) -> dict | None:
+    """Slim record of user from cache, it's loaded from database on miss
+
+    Returns:
+        dict|None: SLIM_USER_FIELDS and password stamp, None if user doesn't exist
+    """
+    cache = caches[settings.AUTH_USER_CACHE_ALIAS]
+    key = get_user_cache_key(user_id)
+
+    record = cache.get(key)
+    if record is not None:
+        return record
+
+    row = User.objects.filter(pk=user_id).values_list(*SLIM_USER_FIELDS, "password").first()
+    if row is None:
+        return None
+
+    record = dict(zip(SLIM_USER_FIELDS, row))
+    record["password_stamp"] = get_password_stamp(row[-1])
+    cache.set(key, record, settings.AUTH_USER_CACHE_TIMEOUT)
+    return record
+
+
+def build_slim_user(record: dict) -> User:
+    """User instance with fields of record, like from only() query. Other fields are deferred"""
+    # from_db() expects values in order of model fields
+    field_names = [field.attname for field in User._meta.concrete_fields if field.attname in SLIM_USER_FIELDS]
+    return User.from_db(router.db_for_read(User), field_names, [record[name] for name in field_names])
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication that resolves users from short time cache instead of query per request.
+
+    Request user has only id, is_active, is_verified, is_staff and is_superuser fields, other fields
+    are loaded on access and save() updates only loaded fields. Cached user is invalidated on save and
+    delete of user, so deactivation and password change are applied at once, other changes in
+    settings.AUTH_USER_CACHE_TIMEOUT. Tokens with password stamp are rejected after password change.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        if api_settings.USER_ID_FIELD != "id":
+            return super().get_user(validated_token)
+
+        record = get_user_record(user_id)
+        if record is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if not record["is_active"]:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        password_stamp = validated_token.get(PASSWORD_STAMP_CLAIM)
+        if password_stamp is not None and password_stamp != record["password_stamp"]:
+            raise AuthenticationFailed(_("Password was changed"), code="password_changed")
+
+        return build_slim_user(record)
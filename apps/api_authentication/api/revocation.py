@@ -0,0 +1,184 @@
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework_simplejwt.settings import api_settings
+
+logger = logging.getLogger(__name__)
+
+REVOKED_TOKENS_KEY = "revoked_tokens"
+# Revocations are read again with overlap, clocks of workers that add revocations can differ a bit
+SYNC_OVERLAP = 5
+# Seconds between removals of expired tokens from process registry
+PRUNE_INTERVAL = 60
+
+
+def get_max_token_lifetime() -> float:
+    return max(api_settings.ACCESS_TOKEN_LIFETIME, api_settings.REFRESH_TOKEN_LIFETIME).total_seconds()
+
+
+def pack_jti(jti: str) -> bytes:
+    """Token id as 16 bytes instead of 32 chars of hex uuid, other ids are kept as is"""
+    try:
+        return bytes.fromhex(jti) if len(jti) == 32 else jti.encode()
+    except ValueError:
+        return jti.encode()
+
+
+class RevocationStore:
+    """Base class for shared log of revoked tokens. Every revocation has time, token id and token expiration time"""
+
+    def revoke(self, jti: str, exp: int, now: float):
+        """Add token to revoked tokens
+
+        Args:
+            jti (str): token id
+            exp (int): expiration timestamp of token
+            now (float): current timestamp
+        """
+        raise NotImplementedError(".revoke() must be overridden")
+
+    def get_revoked(self, since: float) -> list[tuple[float, str, int]]:
+        """Tokens revoked after given time
+
+        Returns:
+            list[tuple[float, str, int]]: time of revocation, token id and expiration timestamp of token
+        """
+        raise NotImplementedError(".get_revoked() must be overridden")
+
+
+class RedisRevocationStore(RevocationStore):
+    """Revoked tokens in Redis sorted set by revocation time, shared between all workers.
+    Revocations older than max token lifetime are removed, their tokens are expired.
+    """
+
+    def __init__(self, cache_alias: str):
+        from django_redis import get_redis_connection
+
+        self.client = get_redis_connection(cache_alias)
+        self.key = caches[cache_alias].make_key(REVOKED_TOKENS_KEY)
+
+    def revoke(self, jti: str, exp: int, now: float):
+        from redis.exceptions import RedisError
+
+        max_lifetime = get_max_token_lifetime()
+        pipeline = self.client.pipeline()
+        pipeline.zadd(self.key, {f"{jti}:{exp}": now})
+        pipeline.zremrangebyscore(self.key, "-inf", now - max_lifetime)
+        pipeline.expire(self.key, int(max_lifetime) + 1)
+        try:
+            pipeline.execute()
+        except RedisError:
+            # Same behaviour as cache with IGNORE_EXCEPTIONS: logout succeeds, token is revoked in current process
+            logger.warning(
+                "Revoked tokens store is unavailable, token %s is revoked only in this process", jti, exc_info=True
+            )
+
+    def get_revoked(self, since: float) -> list[tuple[float, str, int]]:
+        revoked = []
+        for member, score in self.client.zrangebyscore(self.key, f"({since}", "+inf", withscores=True):
+            jti, __, exp = member.decode().rpartition(":")
+            revoked.append((score, jti, int(exp)))
+        return revoked
+
+
+class CacheRevocationStore(RevocationStore):
+    """Revoked tokens in any Django cache backend as one list.
+    Atomic only inside one process, so use it for LocMem cache in tests and local development.
+    """
+
+    lock = threading.Lock()
+
+    def __init__(self, cache_alias: str):
+        self.cache = caches[cache_alias]
+
+    def revoke(self, jti: str, exp: int, now: float):
+        max_lifetime = get_max_token_lifetime()
+        with self.lock:
+            revoked = [item for item in self.cache.get(REVOKED_TOKENS_KEY, []) if item[0] > now - max_lifetime]
+            revoked.append((now, jti, exp))
+            self.cache.set(REVOKED_TOKENS_KEY, revoked, int(max_lifetime) + 1)
+
+    def get_revoked(self, since: float) -> list[tuple[float, str, int]]:
+        return [item for item in self.cache.get(REVOKED_TOKENS_KEY, []) if item[0] > since]
+
+
+def get_revocation_store(cache_alias: str) -> RevocationStore:
+    """Pick revocation store for cache, like get_token_bucket_store()"""
+    if caches[cache_alias].__class__.__module__.startswith("django_redis"):
+        return RedisRevocationStore(cache_alias)
+    return CacheRevocationStore(cache_alias)
+
+
+class RevokedTokens:
+    """Revoked tokens of current process, token id -> expiration timestamp.
+
+    Check is a lookup in dict, without database or cache call. Registry reads new revocations
+    from shared store not more often than once per sync_interval seconds, so token revoked by other worker
+    is rejected after sync_interval at most. Expired tokens are removed from registry.
+
+    Args:
+        store (RevocationStore): shared log of revocations
+        sync_interval (float): seconds between reads of shared store
+    """
+
+    def __init__(self, store: RevocationStore, sync_interval: float):
+        self.store = store
+        self.sync_interval = sync_interval
+        self.tokens: dict[bytes, int] = {}
+        self.synced_until = 0.0
+        self.next_sync = 0.0
+        self.next_prune = 0.0
+        self.lock = threading.Lock()
+
+    def is_revoked(self, jti: str) -> bool:
+        if time.monotonic() >= self.next_sync:
+            self.sync()
+        return pack_jti(jti) in self.tokens
+
+    def revoke(self, jti: str, exp: int):
+        self.store.revoke(jti, exp, time.time())
+        with self.lock:
+            self.tokens[pack_jti(jti)] = exp
+
+    def sync(self):
+        # One thread reads store, others use current registry
+        if not self.lock.acquire(blocking=False):
+            return
+
+        try:
+            now = time.time()
+            try:
+                revoked = self.store.get_revoked(self.synced_until - SYNC_OVERLAP)
+            except Exception:
+                logger.warning("Revoked tokens store is unavailable, registry is not updated", exc_info=True)
+                revoked = []
+
+            for revoked_at, jti, exp in revoked:
+                if exp > now:
+                    self.tokens[pack_jti(jti)] = exp
+                self.synced_until = max(self.synced_until, revoked_at)
+
+            monotonic = time.monotonic()
+            if monotonic >= self.next_prune:
+                self.tokens = {jti: exp for jti, exp in self.tokens.items() if exp > now}
+                self.next_prune = monotonic + PRUNE_INTERVAL
+            self.next_sync = monotonic + self.sync_interval
+        finally:
+            self.lock.release()
+
+
+_revoked_tokens: RevokedTokens | None = None
+
+
+def get_revoked_tokens() -> RevokedTokens:
+    """Registry of revoked tokens of current process"""
+    global _revoked_tokens
+
+    if _revoked_tokens is None:
+        _revoked_tokens = RevokedTokens(
+            get_revocation_store(settings.JWT_REVOCATION_CACHE_ALIAS), settings.JWT_REVOCATION_SYNC_INTERVAL
+        )
+    return _revoked_tokens
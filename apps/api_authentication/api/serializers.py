@@ -1,6 +1,52 @@
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model, user_login_failed
+from django.contrib.auth.models import update_last_login
 from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions, serializers
 from rest_framework.exceptions import ValidationError
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer,
+    TokenVerifySerializer,
+)
+from rest_framework_simplejwt.settings import api_settings
+
+from apps.api_authentication.api.authentication import PASSWORD_STAMP_CLAIM, get_password_stamp
+from apps.api_authentication.api.tokens import RevocableRefreshToken, RevocableUntypedToken
+from apps.utils import passwords
+
+User = get_user_model()
+
+
+async def aauthenticate(request, username: str | None, password: str | None) -> User | None:
+    """Async version of django.contrib.auth.authenticate() with ModelBackend rules.
+    Password is checked in password hashing pool, unknown users also cost one hashing, like in ModelBackend.
+
+    Args:
+        request (Request|None): request of login
+        username (str|None): value of User.USERNAME_FIELD
+        password (str|None): raw password
+
+    Returns:
+        User|None: active user with given credentials
+    """
+    if username is None or password is None:
+        return None
+
+    try:
+        user = await User._default_manager.aget_by_natural_key(username)
+    except User.DoesNotExist:
+        # Run the default password hasher once to reduce the timing difference between existing and
+        # nonexistent users (#20760)
+        await passwords.amake_password(password)
+    else:
+        if await user.acheck_password(password) and user.is_active:
+            return user
+
+    await sync_to_async(user_login_failed.send)(
+        sender=__name__, credentials={User.USERNAME_FIELD: username}, request=request
+    )
+    return None
 
 
 class TokenObtainPairSerializerIfUserVerified(TokenObtainPairSerializer):
@@ -22,3 +68,77 @@ class TokenObtainPairSerializerIfUserVerified(TokenObtainPairSerializer):
             raise ValidationError(_("Please verify email first"))
 
         return data
+
+
+class PasswordStampTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """Tokens have stamp of user password, see CachedJWTAuthentication"""
+
+    token_class = RevocableRefreshToken
+
+    @classmethod
+    def get_token(cls, user: User):
+        token = super().get_token(user)
+        token[PASSWORD_STAMP_CLAIM] = get_password_stamp(user.password)
+        return token
+
+
+class AsyncTokenObtainPairSerializer(PasswordStampTokenObtainPairSerializer):
+    """TokenObtainPairSerializer with async validation, see ais_valid()"""
+
+    async def avalidate(self, attrs: dict) -> dict:
+        """Async version of validate()"""
+        self.user = await aauthenticate(self.context.get("request"), attrs[self.username_field], attrs["password"])
+
+        if not api_settings.USER_AUTHENTICATION_RULE(self.user):
+            raise exceptions.AuthenticationFailed(
+                self.error_messages["no_active_account"],
+                "no_active_account",
+            )
+
+        refresh = self.get_token(self.user)
+        data = {"refresh": str(refresh), "access": str(refresh.access_token)}
+
+        if api_settings.UPDATE_LAST_LOGIN:
+            await sync_to_async(update_last_login)(None, self.user)
+
+        return data
+
+    async def ais_valid(self, raise_exception: bool = False) -> bool:
+        """Async version of is_valid(). Fields are validated in event loop, credentials are checked with avalidate()"""
+        try:
+            self._validated_data = await self.avalidate(self.to_internal_value(self.initial_data))
+        except ValidationError as exc:
+            self._validated_data = {}
+            self._errors = exc.detail
+        else:
+            self._errors = {}
+
+        if self._errors and raise_exception:
+            raise ValidationError(self.errors)
+
+        return not bool(self._errors)
+
+
+class RevocableTokenRefreshSerializer(TokenRefreshSerializer):
+    """Revoked refresh token can't be refreshed"""
+
+    token_class = RevocableRefreshToken
+
+
+class RevocableTokenVerifySerializer(TokenVerifySerializer):
+    """Revoked token is not valid"""
+
+    def validate(self, attrs: dict) -> dict:
+        RevocableUntypedToken(attrs["token"])
+        return {}
+
+
+class LogoutSerializer(serializers.Serializer):
+    """Refresh token to revoke on logout, access token of request is revoked too"""
+
+    refresh = serializers.CharField(required=False)
+
+    def validate(self, attrs: dict) -> dict:
+        if "refresh" in attrs:
+            attrs["refresh"] = RevocableRefreshToken(attrs["refresh"])
+        return attrs
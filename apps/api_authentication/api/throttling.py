@@ -1,5 +1,6 @@
-from rest_framework.throttling import AnonRateThrottle
+from apps.base.api.throttling import AnonTokenBucketRateThrottle
 
 
-class LoginAttemptsThrottling(AnonRateThrottle):
+class LoginAttemptsThrottling(AnonTokenBucketRateThrottle):
+    scope = "login"
     rate = "10/minute"
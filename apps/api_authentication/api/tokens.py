@@ -0,0 +1,38 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken, Token, UntypedToken
+
+from apps.api_authentication.api.revocation import get_revoked_tokens
+
+
+def revoke_token(token: Token):
+    """Revoke token until it expires, see RevokedTokens"""
+    get_revoked_tokens().revoke(token[api_settings.JTI_CLAIM], token["exp"])
+
+
+class RevocableTokenMixin:
+    """Token is not valid after revoke_token()"""
+
+    def verify(self):
+        super().verify()
+
+        jti = self.payload.get(api_settings.JTI_CLAIM)
+        if jti is not None and get_revoked_tokens().is_revoked(jti):
+            raise TokenError(_("Token is revoked"))
+
+
+class RevocableAccessToken(RevocableTokenMixin, AccessToken):
+    pass
+
+
+class RevocableUntypedToken(RevocableTokenMixin, UntypedToken):
+    pass
+
+
+class RevocableRefreshToken(RevocableTokenMixin, RefreshToken):
+    access_token_class = RevocableAccessToken
+
+    def blacklist(self):
+        """Revoke refresh token after rotation, with settings.SIMPLE_JWT["BLACKLIST_AFTER_ROTATION"]"""
+        revoke_token(self)
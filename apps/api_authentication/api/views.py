@@ -1,10 +1,16 @@
+from django.utils.translation import gettext_lazy as _
 from rest_framework import status
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
+from rest_framework.views import APIView
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
 from rest_framework_simplejwt.views import TokenViewBase
 
+from apps.api_authentication.api.tokens import revoke_token
+from apps.base.api.transactions import NONE
 from apps.base.api.views import ApiGenericViewSet
 from apps.core.constants import HttpMethods
 
@@ -24,6 +30,13 @@ class TokenActionViewBase(ApiGenericViewSet, TokenViewBase):
 
 
 class AuthApiView(TokenActionViewBase):
+    # Token actions read user or only check token, password hash update on login is one query
+    transaction_policy = NONE
+
+    messages = {
+        "logged_out": _("Logged out"),
+    }
+
     @action(methods=[HttpMethods.POST.value], detail=False, _serializer_class=api_settings.TOKEN_OBTAIN_SERIALIZER)
     def token(self, request, *args, **kwargs):
         return self.process_token_base_action(request, *args, **kwargs)
@@ -36,6 +49,35 @@ class AuthApiView(TokenActionViewBase):
     def verify(self, request, *args, **kwargs):
         return self.process_token_base_action(request, *args, **kwargs)
 
-    @action(methods=[HttpMethods.GET.value], detail=False)
+    @action(
+        methods=[HttpMethods.POST.value],
+        detail=False,
+        authentication_classes=APIView.authentication_classes,
+        _serializer_class="apps.api_authentication.api.serializers.LogoutSerializer",
+    )
     def logout(self, request, *args, **kwargs):
-        return Response(data="OLO")
+        """Revoke refresh token from request body and access token of request until they expire.
+        Revoked tokens can't be used for authentication, refresh and verify in all workers.
+
+        Args:
+            request (Request): Django request object
+
+        Returns:
+            Response: Django Response object
+        """
+        serializer = self.get_serializer(data=request.data)
+
+        try:
+            serializer.is_valid(raise_exception=True)
+        except TokenError as e:
+            raise InvalidToken(e.args[0])
+
+        tokens = [serializer.validated_data.get("refresh"), request.auth]
+        tokens = [token for token in tokens if isinstance(token, Token)]
+        if not tokens:
+            raise ValidationError({"refresh": _("Refresh token is required")})
+
+        for token in tokens:
+            revoke_token(token)
+
+        return self.create_successful_response(status_code=status.HTTP_200_OK, message_code="logged_out")
@@ -4,3 +4,21 @@ from django.apps import AppConfig
 class AuthenticationConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.api_authentication"
+
+    def ready(self):
+        import functools
+
+        from django.contrib.auth import get_user_model
+        from django.db import transaction
+        from django.db.models.signals import post_delete, post_save
+
+        from apps.api_authentication.api.authentication import invalidate_cached_user
+
+        def invalidate(sender, instance, using, **kwargs):
+            invalidate_cached_user(instance.pk)
+            # Concurrent request can cache old row until transaction of change is committed, delete it again
+            transaction.on_commit(functools.partial(invalidate_cached_user, instance.pk), using=using)
+
+        # Save covers password change and deactivation
+        post_save.connect(invalidate, sender=get_user_model(), weak=False, dispatch_uid="auth_user_cache")
+        post_delete.connect(invalidate, sender=get_user_model(), weak=False, dispatch_uid="auth_user_cache")
@@ -0,0 +1,96 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIRequestFactory
+
+from apps.api_authentication.api.authentication import CachedJWTAuthentication, get_user_cache_key, get_user_record
+from apps.api_authentication.api.serializers import PasswordStampTokenObtainPairSerializer
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+class TestCachedJWTAuthentication:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        cache.clear()
+
+    def authenticate(self, user: User) -> User:
+        token = PasswordStampTokenObtainPairSerializer.get_token(user).access_token
+        request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+        authenticated_user, __ = CachedJWTAuthentication().authenticate(request)
+        return authenticated_user
+
+    def test_user_resolved_from_cache(self, user: User):
+        token = PasswordStampTokenObtainPairSerializer.get_token(user).access_token
+        request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+        CachedJWTAuthentication().authenticate(request)
+
+        with CaptureQueriesContext(connection) as queries:
+            authenticated_user, __ = CachedJWTAuthentication().authenticate(request)
+
+        assert not queries.captured_queries
+        assert authenticated_user.pk == user.pk
+        assert authenticated_user.is_verified == user.is_verified
+        assert authenticated_user.get_deferred_fields() >= {"email", "password"}
+        # Deferred field is loaded on access
+        assert authenticated_user.email == user.email
+
+    def test_deactivated_user(self, user: User):
+        self.authenticate(user)
+
+        user.is_active = False
+        user.save()
+
+        with pytest.raises(AuthenticationFailed) as error:
+            self.authenticate(user)
+        assert error.value.get_codes() == "user_inactive"
+
+    def test_user_cached_before_commit_invalidated(self, user: User, django_capture_on_commit_callbacks):
+        self.authenticate(user)
+        stale_record = get_user_record(user.pk)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            with transaction.atomic():
+                user.is_active = False
+                user.save()
+                # Concurrent request reads row before commit and caches it again
+                cache.set(get_user_cache_key(user.pk), stale_record)
+
+        with pytest.raises(AuthenticationFailed) as error:
+            self.authenticate(user)
+        assert error.value.get_codes() == "user_inactive"
+
+    def test_token_rejected_after_password_change(self, user: User):
+        token = PasswordStampTokenObtainPairSerializer.get_token(user).access_token
+        request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+        CachedJWTAuthentication().authenticate(request)
+
+        user.update_password("cGf!9Wj2O*36")
+        user.save()
+
+        with pytest.raises(AuthenticationFailed) as error:
+            CachedJWTAuthentication().authenticate(request)
+        assert error.value.get_codes() == "password_changed"
+        assert self.authenticate(user).pk == user.pk
+
+    def test_deleted_user(self, user: User):
+        self.authenticate(user)
+        user_pk = user.pk
+        user.delete()
+        user.pk = user_pk
+
+        with pytest.raises(AuthenticationFailed):
+            self.authenticate(user)
+
+    def test_save_of_slim_user(self, user: User):
+        authenticated_user = self.authenticate(user)
+        authenticated_user.is_staff = True
+        authenticated_user.save()
+
+        user.refresh_from_db()
+        assert user.is_staff
+        assert user.email
@@ -0,0 +1,104 @@
+import time
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from redis.exceptions import ConnectionError as RedisConnectionError
+from rest_framework import status
+from rest_framework.reverse import reverse
+
+from apps.api_authentication.api.revocation import CacheRevocationStore, RedisRevocationStore, RevokedTokens, pack_jti
+from apps.conftest import TEST_USER_PASSWORD
+from apps.test_utils.api_client import JwtAPIClient
+from apps.users.models import User
+
+JTI = "5d9e4b0c3a6f4e1d8b2a7c9f0e1d2c3b"
+
+
+class TestRevokedTokens:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        cache.clear()
+
+    def test_revocation_shared_by_store(self):
+        store = CacheRevocationStore("default")
+        worker, other_worker = RevokedTokens(store, sync_interval=0), RevokedTokens(store, sync_interval=3600)
+        assert not other_worker.is_revoked(JTI)
+
+        worker.revoke(JTI, int(time.time()) + 60)
+        assert worker.is_revoked(JTI)
+        # Registry reads store once per sync interval
+        assert not other_worker.is_revoked(JTI)
+
+        other_worker.sync()
+        assert other_worker.is_revoked(JTI)
+        assert RevokedTokens(store, sync_interval=0).is_revoked(JTI)
+
+    def test_expired_tokens_removed(self):
+        store = CacheRevocationStore("default")
+        store.revoke(JTI, int(time.time()) - 1, time.time())
+
+        revoked_tokens = RevokedTokens(store, sync_interval=0)
+        revoked_tokens.tokens[pack_jti("expired")] = int(time.time()) - 1
+        assert not revoked_tokens.is_revoked(JTI)
+        assert revoked_tokens.tokens == {}
+
+    def test_revoke_when_redis_unavailable(self, caplog):
+        client = mock.MagicMock()
+        client.pipeline.return_value.execute.side_effect = RedisConnectionError()
+        with mock.patch("django_redis.get_redis_connection", return_value=client):
+            store = RedisRevocationStore("default")
+
+        revoked_tokens = RevokedTokens(store, sync_interval=3600)
+        revoked_tokens.next_sync = time.monotonic() + 3600
+        revoked_tokens.revoke(JTI, int(time.time()) + 60)
+
+        assert revoked_tokens.is_revoked(JTI)
+        assert "Revoked tokens store is unavailable" in caplog.text
+
+    def test_pack_jti(self):
+        assert pack_jti(JTI) == bytes.fromhex(JTI)
+        assert pack_jti("custom-id") == b"custom-id"
+        assert pack_jti("x" * 32) == b"x" * 32
+
+
+@pytest.mark.django_db
+class TestLogout:
+    @pytest.fixture
+    def api_client(self, user: User) -> JwtAPIClient:
+        user.is_verified = True
+        user.save()
+        api_client = JwtAPIClient()
+        api_client.jwt_login(email=user.email, password=TEST_USER_PASSWORD)
+        return api_client
+
+    def test_logout_revokes_tokens(self, api_client: JwtAPIClient):
+        access_header = api_client._credentials["HTTP_AUTHORIZATION"]
+        access_token = access_header.split()[1]
+        refresh_token = api_client.refresh_token
+
+        response = api_client.jwt_logout()
+        assert response.status_code == status.HTTP_200_OK
+
+        response = api_client.post(reverse("v1:auth-refresh"), data={"refresh": refresh_token})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+        response = api_client.post(reverse("v1:auth-verify"), data={"token": access_token})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+        response = api_client.post(reverse("v1:user-change-password"), HTTP_AUTHORIZATION=access_header)
+        # First authentication class is SessionAuthentication, so failed authentication is 403
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.data.errors[0].code == "token_not_valid"
+
+    def test_refresh_before_logout(self, api_client: JwtAPIClient):
+        response = api_client.post(reverse("v1:auth-refresh"), data={"refresh": api_client.refresh_token})
+        assert response.status_code == status.HTTP_200_OK
+
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+        response = api_client.post(reverse("v1:user-change-password"))
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_logout_without_tokens(self):
+        response = JwtAPIClient().jwt_logout()
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,11 @@
+from django.conf import settings
+
+from apps.base.api.stats_views import StatsViewSet
+from apps.utils.router import DefaultApiRouter, SimpleApiRouter
+
+if settings.DEBUG:
+    router = DefaultApiRouter()
+else:
+    router = SimpleApiRouter()
+
+router.register("v1/stats", StatsViewSet, basename="stats")
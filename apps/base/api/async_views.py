@@ -0,0 +1,145 @@
+import asyncio
+import functools
+from collections.abc import Callable
+
+from asgiref.sync import sync_to_async
+from django.db import connections
+from django.http import Http404
+
+from apps.base.api.views import ApiGenericViewSet
+
+
+def async_action(sync_action: Callable, **kwargs) -> Callable:
+    """Declare async version of viewset action with the same routing as sync action.
+
+    Args:
+        sync_action (Callable): action of sync viewset, decorated with @action
+        **kwargs: extra action kwargs, override kwargs of sync action
+
+    Examples:
+        class AsyncUserViewSet(AsyncApiViewMixin, UserViewSet):
+            @async_action(UserViewSet.verify)
+            async def verify(self, request, uid64, token):
+                ...
+    """
+
+    def decorator(handler: Callable) -> Callable:
+        handler.mapping = sync_action.mapping
+        handler.detail = sync_action.detail
+        handler.url_path = sync_action.url_path
+        handler.url_name = sync_action.url_name
+        handler.kwargs = {**sync_action.kwargs, **kwargs}
+        return handler
+
+    return decorator
+
+
+class AsyncApiViewMixin:
+    """Run viewset natively under ASGI.
+
+    View is a coroutine function, so Django calls it in event loop without thread hop.
+    Async handlers are awaited, sync handlers run in thread with sync_to_async().
+    Authentication runs in thread (authenticators load users with sync ORM), throttles with `aallow_request()`
+    are awaited, others run in thread.
+
+    Async views can't be wrapped in transaction, so ATOMIC_REQUESTS is off for them. Sync handlers run
+    in transaction by policy of action, like in ApiGenericViewSet.dispatch(). Async handlers run in autocommit
+    mode whatever is the policy: every query commits by itself, so several writes that must be atomic
+    should be done in one sync function with transaction.atomic(), called by sync_to_async().
+    Mixin is used with ApiGenericViewSet.
+    """
+
+    @classmethod
+    def as_view(cls, actions=None, **initkwargs):
+        view = super().as_view(actions, **initkwargs)
+
+        async def async_view(request, *args, **kwargs):
+            return await view(request, *args, **kwargs)
+
+        functools.update_wrapper(async_view, view)
+        async_view._non_atomic_requests = set(connections)
+        return async_view
+
+    async def dispatch(self, request, *args, **kwargs):
+        """Async version of APIView.dispatch()"""
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await self.ainitial(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            if asyncio.iscoroutinefunction(handler):
+                response = await handler(request, *args, **kwargs)
+            else:
+                response = await sync_to_async(self.run_sync_handler)(handler, request, *args, **kwargs)
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    def run_sync_handler(self, handler: Callable, request, *args, **kwargs):
+        """Run sync handler in thread, in transaction by policy of action.
+        Exception of handler rolls back transaction, it's handled later in event loop
+        """
+        if self.is_transaction_deferred(self.action):
+            return handler(request, *args, **kwargs)
+        return self.run_in_transaction_policy(handler, request, *args, **kwargs)
+
+    async def ainitial(self, request, *args, **kwargs):
+        """Async version of APIView.initial()"""
+        self.format_kwarg = self.get_format_suffix(**kwargs)
+
+        neg = self.perform_content_negotiation(request)
+        request.accepted_renderer, request.accepted_media_type = neg
+
+        version, scheme = self.determine_version(request, *args, **kwargs)
+        request.version, request.versioning_scheme = version, scheme
+
+        await sync_to_async(self.perform_authentication)(request)
+        self.check_permissions(request)
+        await self.acheck_throttles(request)
+
+    async def acheck_throttles(self, request):
+        """Async version of APIView.check_throttles()"""
+        throttle_durations = []
+        for throttle in self.get_throttles():
+            if hasattr(throttle, "aallow_request"):
+                allowed = await throttle.aallow_request(request, self)
+            else:
+                allowed = await sync_to_async(throttle.allow_request)(request, self)
+
+            if not allowed:
+                throttle_durations.append(throttle.wait())
+
+        if throttle_durations:
+            durations = [duration for duration in throttle_durations if duration is not None]
+            self.throttled(request, max(durations, default=None))
+
+    async def aget_object(self):
+        """Async version of GenericAPIView.get_object()"""
+        queryset = self.filter_queryset(self.get_queryset())
+
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        filter_kwargs = {self.lookup_field: self.kwargs[lookup_url_kwarg]}
+
+        try:
+            obj = await queryset.aget(**filter_kwargs)
+        except (queryset.model.DoesNotExist, TypeError, ValueError):
+            raise Http404
+
+        self.check_object_permissions(self.request, obj)
+        return obj
+
+
+class AsyncApiGenericViewSet(AsyncApiViewMixin, ApiGenericViewSet):
+    """Async version of ApiGenericViewSet"""
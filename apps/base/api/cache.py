@@ -0,0 +1,214 @@
+import functools
+import hashlib
+import secrets
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Model
+from django.db.models.signals import post_delete, post_save
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+VERSION_KEY_FORMAT = "response_cache_version_%s"
+CACHE_KEY_FORMAT = "response_cache_%(view)s_%(user)s_%(versions)s_%(params)s"
+# Headers of response that are stored together with data
+CACHED_HEADERS = ("ETag", "Last-Modified", "Vary")
+CACHE_HEADER = "X-Response-Cache"
+
+response_cache_stats = Counter()
+response_cache_stats_lock = threading.Lock()
+# Models and cache aliases with connected invalidation signals
+_connected_invalidations: set[tuple[str, str]] = set()
+
+
+def get_model_label(model: type[Model] | str) -> str:
+    return model.lower() if isinstance(model, str) else model._meta.label_lower
+
+
+def count_response_cache(name: str, result: str):
+    with response_cache_stats_lock:
+        response_cache_stats[(name, result)] += 1
+
+
+def get_response_cache_stats() -> dict[str, dict[str, int]]:
+    """Hit and miss counters of cached actions in current process
+
+    Returns:
+        dict: like {"users.api.views.UserViewSet.list": {"hits": 10, "misses": 1}}
+    """
+    stats = {}
+    with response_cache_stats_lock:
+        for (name, result), value in response_cache_stats.items():
+            stats.setdefault(name, {"hits": 0, "misses": 0})[result] = value
+    return stats
+
+
+def new_model_version() -> str:
+    """Unique version of model. Versions are not counters, so version key lost by restart, flush or eviction
+    of cache gets new value, that never matches cache keys and ETags of old versions
+    """
+    return f"{time.time_ns():x}{secrets.token_hex(4)}"
+
+
+def get_models_versions(cache, labels: Iterable[str]) -> list[str] | None:
+    """Current versions of models, versions are created on first use.
+    None if cache can't be read, then versions are unknown and nothing may depend on them
+    """
+    keys = [VERSION_KEY_FORMAT % label for label in labels]
+    versions = cache.get_many(keys)
+
+    for key in keys:
+        if key not in versions:
+            cache.add(key, new_model_version(), timeout=None)
+            version = cache.get(key)
+            if version is None:
+                return None
+            versions[key] = version
+
+    return [versions[key] for key in keys]
+
+
+def invalidate_model_responses(label: str, cache_alias: str = "default"):
+    """Invalidate cached responses that depend on model. All old entries have stale version in key and expire"""
+    caches[cache_alias].set(VERSION_KEY_FORMAT % label, new_model_version(), timeout=None)
+
+
+def connect_invalidation(model: type[Model] | str, cache_alias: str):
+    """Increment version of model on post_save and post_delete, once per model and cache alias"""
+    label = get_model_label(model)
+    if (label, cache_alias) in _connected_invalidations:
+        return
+
+    def invalidate(sender, **kwargs):
+        invalidate_model_responses(sender._meta.label_lower, cache_alias)
+
+    dispatch_uid = f"response_cache_{label}_{cache_alias}"
+    # Sender can be lazy "app_label.ModelName" reference
+    post_save.connect(invalidate, sender=model, weak=False, dispatch_uid=dispatch_uid)
+    post_delete.connect(invalidate, sender=model, weak=False, dispatch_uid=dispatch_uid)
+    _connected_invalidations.add((label, cache_alias))
+
+
+def get_model_version(model: type[Model], cache_alias: str = "default") -> str | None:
+    """Version of model in cache, it changes on every save and delete of model objects.
+    Bulk changes without signals (QuerySet.update(), bulk_create()) must call invalidate_model_responses().
+    None if cache can't be read
+    """
+    connect_invalidation(model, cache_alias)
+    versions = get_models_versions(caches[cache_alias], [get_model_label(model)])
+    return None if versions is None else versions[0]
+
+
+def get_response_cache_key(
+    view, request: Request, dependencies: tuple[str, ...], versions: list[str], vary_on_user: bool
+) -> str:
+    params = sorted((key, value) for key in request.query_params for value in request.query_params.getlist(key))
+    # Headers of response (ETag) depend on negotiated media type
+    media_type = getattr(request, "accepted_media_type", None)
+    params_hash = hashlib.md5(repr((request.path, params, media_type)).encode(), usedforsecurity=False).hexdigest()
+    if vary_on_user:
+        user = request.user.pk if request.user.is_authenticated else "anon"
+    else:
+        user = "all"
+
+    return CACHE_KEY_FORMAT % {
+        "view": f"{view.__class__.__qualname__}.{view.action}",
+        "user": user,
+        "versions": ".".join(f"{label}:{version}" for label, version in zip(dependencies, versions)),
+        "params": params_hash,
+    }
+
+
+def cache_response(
+    timeout: int | None = 60,
+    dependencies: Iterable[type[Model] | str] = (),
+    vary_on_user: bool = True,
+    cache_alias: str = "default",
+) -> Callable:
+    """Decorator for read only actions of ApiGenericViewSet, that caches successful responses.
+
+    Cache key covers view action, user, request path and query params (with `fields` selection),
+    so different users and projections never share entries. Entries are invalidated by post_save and
+    post_delete signals of user model and declared dependency models: every model has version in cache,
+    signal replaces version with new unique one, and entries with old version in key are not used anymore.
+    Hit and miss counters of process are returned by get_response_cache_stats() and api stats endpoint.
+
+    On hit, handler is not called at all, so queryset, filters and serializer are skipped.
+    Transaction by policy of action is started only on miss, around handler.
+    ETag and Vary headers are stored with data, conditional requests get 304 from cache too.
+
+    Args:
+        timeout (int|None): time to live of entry in seconds
+        dependencies (Iterable[type[Model]|str]): models or "app_label.ModelName" labels which changes
+            invalidate cached responses, user model is always included
+        vary_on_user (bool): separate entries for every user
+        cache_alias (str): alias of cache from CACHES setting
+
+    Examples:
+        class UserViewSet(ApiGenericViewSet):
+            @cache_response(timeout=300, dependencies=["auth.Group"])
+            def list(self, request):
+                return self.create_list_response()
+    """
+    models = (settings.AUTH_USER_MODEL, *dependencies)
+    labels = tuple(dict.fromkeys(get_model_label(model) for model in models))
+
+    for model in models:
+        connect_invalidation(model, cache_alias)
+
+    def decorator(handler: Callable) -> Callable:
+        @functools.wraps(handler)
+        def wrapper(self, request: Request, *args, **kwargs):
+            run_handler = functools.partial(self.run_in_transaction_policy, functools.partial(handler, self))
+            if request.method not in ("GET", "HEAD"):
+                return run_handler(request, *args, **kwargs)
+
+            cache = caches[cache_alias]
+            name = f"{self.__class__.__module__}.{self.__class__.__qualname__}.{self.action}"
+            versions = get_models_versions(cache, labels)
+            if versions is None:
+                # Cache is not available, entries can't be checked for invalidation
+                count_response_cache(name, "misses")
+                return run_handler(request, *args, **kwargs)
+            key = get_response_cache_key(self, request, labels, versions, vary_on_user)
+
+            cached = cache.get(key)
+            if cached is not None:
+                count_response_cache(name, "hits")
+                data, status_code, headers = cached
+
+                not_modified_response = get_conditional_response(
+                    request,
+                    etag=headers.get("ETag"),
+                    last_modified=parse_http_date_safe(headers.get("Last-Modified") or ""),
+                )
+                if not_modified_response is not None:
+                    for header, value in headers.items():
+                        not_modified_response[header] = value
+                    return not_modified_response
+
+                response = Response(data=data, status=status_code, headers=headers)
+                response[CACHE_HEADER] = "hit"
+                return response
+
+            count_response_cache(name, "misses")
+            response = run_handler(request, *args, **kwargs)
+
+            if isinstance(response, Response) and response.status_code == 200:
+                headers = {header: response[header] for header in CACHED_HEADERS if response.has_header(header)}
+                cache.set(key, (response.data, response.status_code, headers), timeout)
+                response[CACHE_HEADER] = "miss"
+
+            return response
+
+        # Cache is read before transaction of action, hit makes no database queries
+        wrapper.deferred_transaction = True
+        return wrapper
+
+    return decorator
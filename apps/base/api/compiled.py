@@ -0,0 +1,134 @@
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model, QuerySet
+from django.db.models.constants import LOOKUP_SEP
+from rest_framework import serializers
+from rest_framework.relations import PrimaryKeyRelatedField
+
+# Fields which to_representation() does not change values loaded from database by values_list()
+IDENTITY_FIELDS = (
+    serializers.CharField,
+    serializers.EmailField,
+    serializers.SlugField,
+    serializers.IntegerField,
+    serializers.BooleanField,
+    serializers.FloatField,
+)
+
+
+@dataclass(frozen=True)
+class CompiledSerializer:
+    """Read only serializer that works with rows of values_list() instead of model instances.
+
+    Skips model instance construction and generic Field.to_representation() dispatch,
+    every column is converted by converter that was chosen once for serializer field.
+    """
+
+    # Output keys, in serializer order
+    names: tuple[str, ...]
+    # Lookups for values_list(), same order as names
+    columns: tuple[str, ...]
+    # (column index, converter) for columns which values should be converted
+    converters: tuple[tuple[int, Callable], ...]
+
+    def to_representation(self, rows: Iterable[tuple]) -> list[dict]:
+        names = self.names
+        converters = self.converters
+
+        if not converters:
+            return [dict(zip(names, row)) for row in rows]
+
+        data = []
+        for row in rows:
+            row = list(row)
+            for index, convert in converters:
+                value = row[index]
+                if value is not None:
+                    row[index] = convert(value)
+            data.append(dict(zip(names, row)))
+        return data
+
+    def get_rows(self, queryset: QuerySet, extra_columns: Iterable[str] = ()) -> QuerySet:
+        """Rows of selected columns, extra columns are added to the end of every row"""
+        return queryset.prefetch_related(None).values_list(*self.columns, *extra_columns)
+
+    def serialize(self, queryset: QuerySet) -> list[dict]:
+        """Fetch selected columns from queryset and convert rows to output dicts
+
+        Args:
+            queryset (QuerySet): queryset of serializer model
+
+        Returns:
+            list[dict]: same data as serializer(queryset, many=True).data
+        """
+        return self.to_representation(self.get_rows(queryset))
+
+
+def get_field_column(model: type[Model], field: serializers.Field) -> str | None:
+    """Lookup of column for serializer field, None if field can't be read from one column"""
+    if field.source == "*" or isinstance(field, (serializers.BaseSerializer, serializers.ManyRelatedField)):
+        return None
+
+    names = field.source_attrs
+    for name in names[:-1]:
+        try:
+            relation = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return None
+        if not (relation.concrete and (relation.many_to_one or relation.one_to_one)):
+            return None
+        model = relation.related_model
+
+    try:
+        model_field = model._meta.get_field(names[-1])
+    except FieldDoesNotExist:
+        return None
+
+    if not model_field.concrete or model_field.many_to_many:
+        return None
+
+    if model_field.is_relation and not isinstance(field, PrimaryKeyRelatedField):
+        return None
+
+    return LOOKUP_SEP.join(names)
+
+
+def get_field_converter(field: serializers.Field) -> Callable | None:
+    """Converter for column value of field. None if value from database can be used as is"""
+    if type(field) in IDENTITY_FIELDS:
+        return None
+
+    if isinstance(field, PrimaryKeyRelatedField) and field.pk_field is None:
+        # values_list() returns pk of related object
+        return None
+
+    return field.to_representation
+
+
+def compile_serializer(serializer: serializers.ModelSerializer) -> CompiledSerializer | None:
+    """Compile serializer instance into CompiledSerializer.
+
+    Args:
+        serializer (ModelSerializer): serializer with already selected fields
+
+    Returns:
+        CompiledSerializer | None: compiled serializer, None if some field can't be read from one column
+    """
+    model = serializer.Meta.model
+    names, columns, converters = [], [], []
+
+    for field in serializer._readable_fields:
+        column = get_field_column(model, field)
+        if column is None:
+            return None
+
+        converter = get_field_converter(field)
+        if converter is not None:
+            converters.append((len(columns), converter))
+
+        names.append(field.field_name)
+        columns.append(column)
+
+    return CompiledSerializer(names=tuple(names), columns=tuple(columns), converters=tuple(converters))
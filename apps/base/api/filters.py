@@ -1,7 +1,10 @@
 import json
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Model
 from django.template import loader
 from django.utils.encoding import force_str
 from django.utils.translation import gettext_lazy as _
@@ -9,6 +12,8 @@ from rest_framework.compat import coreapi, coreschema
 from rest_framework.exceptions import ValidationError
 from rest_framework.filters import BaseFilterBackend
 
+from apps.base.api.projection import QueryPlan, build_query_plan, get_serializer_field_paths
+
 
 class JsonFilterBase:
     expected_type = list
@@ -53,6 +58,67 @@ class JsonFilterBase:
         return data
 
 
+@dataclass(frozen=True, eq=False)
+class SelectFieldsRegistryEntry:
+    """Fields that can be selected for one (view, serializer, model).
+    Compared and hashed by identity, every entry is created once and reused for all requests.
+    """
+
+    model: type[Model]
+    # (field name, label) in serializer order
+    fields: tuple[tuple[str, str], ...]
+    names: frozenset[str]
+    # Model lookups that serializer field reads, by field name
+    paths: dict[str, tuple[str, ...]]
+
+    def select(self, fields: list[str]) -> tuple[str, ...]:
+        """Keep only fields that can be selected, in serializer order
+
+        Args:
+            fields (list[str]): fields from query
+
+        Returns:
+            tuple[str, ...]: valid fields
+        """
+        requested = {field for field in fields if field in self.names}
+        return tuple(name for name, __ in self.fields if name in requested)
+
+    @lru_cache(maxsize=256)
+    def get_query_plan(self, selected_fields: tuple[str, ...]) -> QueryPlan:
+        """Access plan for selected fields, cached for every set of selected fields
+
+        Args:
+            selected_fields (tuple[str, ...]): valid selected fields
+
+        Returns:
+            QueryPlan: plan for queryset
+        """
+        return build_query_plan(self.model, (path for name in selected_fields for path in self.paths[name]))
+
+
+# Registry of selectable fields by (view class, serializer class, model class)
+select_fields_registry: dict[tuple[type, type, type], SelectFieldsRegistryEntry] = {}
+
+
+@lru_cache(maxsize=1024)
+def parse_selected_fields(
+    filter_class: type["JsonSelectFilter"], registry_entry: SelectFieldsRegistryEntry, params: str
+) -> tuple[str, ...]:
+    """Parse and validate `fields` query param. Cached, so same query spec is parsed once.
+    Invalid params raise ValidationError and are not cached.
+
+    Args:
+        filter_class (type[JsonSelectFilter]): filter class that parse query
+        registry_entry (SelectFieldsRegistryEntry): fields that can be selected
+        params (str): raw query param
+
+    Returns:
+        tuple[str, ...]: selected fields
+    """
+    fields = filter_class().parse_query_data(params)
+    return registry_entry.select(fields)
+
+
 class JsonSelectFilter(JsonFilterBase, BaseFilterBackend):
     select_param = "fields"
 
@@ -60,7 +126,7 @@ class JsonSelectFilter(JsonFilterBase, BaseFilterBackend):
     select_description = _("Which field to use in response.")
     template = "base/filters/json_select.html"
 
-    def get_default_valid_fields(self, queryset, view, context={}):
+    def get_serializer_class(self, view):
         # If `ordering_fields` is not specified, then we determine a default
         # based on the serializer class, if one exists on the view.
         if hasattr(view, "get_serializer_class"):
@@ -81,33 +147,50 @@ class JsonSelectFilter(JsonFilterBase, BaseFilterBackend):
             )
             raise ImproperlyConfigured(msg % self.__class__.__name__)
 
-        model_class = queryset.model
-        model_property_names = [
+        return serializer_class
+
+    def build_registry_entry(self, serializer_class, model_class) -> SelectFieldsRegistryEntry:
+        model_property_names = {
             # 'pk' is a property added in Django's Model class, however it is valid for ordering.
             attr
             for attr in dir(model_class)
             if isinstance(getattr(model_class, attr), property) and attr != "pk"
-        ]
+        }
 
-        return [
-            (field.source.replace(".", "__") or field_name, field.label)
-            for field_name, field in serializer_class(context=context).fields.items()
-            if (
-                not getattr(field, "write_only", False)
-                and not field.source == "*"
-                and field.source not in model_property_names
-            )
-        ]
+        fields, paths = [], {}
+        for field_name, field in serializer_class().fields.items():
+            if getattr(field, "write_only", False) or field.source == "*" or field.source in model_property_names:
+                continue
+
+            name = field.source.replace(".", "__") or field_name
+            fields.append((name, field.label))
+            paths[name] = get_serializer_field_paths(field, name)
+
+        return SelectFieldsRegistryEntry(
+            model=model_class,
+            fields=tuple(fields),
+            names=frozenset(name for name, __ in fields),
+            paths=paths,
+        )
+
+    def get_registry_entry(self, queryset, view) -> SelectFieldsRegistryEntry:
+        """Get selectable fields for view from registry. Entry is built on first use from serializer
+        without context, so it's the same for every request.
+        """
+        serializer_class = self.get_serializer_class(view)
+        key = (view.__class__, serializer_class, queryset.model)
 
-    def remove_invalid_fields(self, queryset, fields, view, request):
-        default_fields = self.get_default_valid_fields(queryset, view, {"request": request})
-        valid_fields = []
+        registry_entry = select_fields_registry.get(key)
+        if registry_entry is None:
+            registry_entry = self.build_registry_entry(serializer_class, queryset.model)
+            select_fields_registry[key] = registry_entry
+        return registry_entry
 
-        for field_name, __ in default_fields:
-            if field_name in fields:
-                valid_fields.append(field_name)
+    def get_default_valid_fields(self, queryset, view, context={}):
+        return list(self.get_registry_entry(queryset, view).fields)
 
-        return valid_fields
+    def remove_invalid_fields(self, queryset, fields, view, request):
+        return list(self.get_registry_entry(queryset, view).select(fields))
 
     def get_fields(self, request, queryset, view):
         """ """
@@ -117,21 +200,25 @@ class JsonSelectFilter(JsonFilterBase, BaseFilterBackend):
         if params is None:
             return None
 
-        fields = self.parse_query_data(params)
-
-        selected_fields = self.remove_invalid_fields(queryset, fields, view, request)
+        registry_entry = self.get_registry_entry(queryset, view)
+        selected_fields = parse_selected_fields(self.__class__, registry_entry, params)
 
         if selected_fields:
-            return selected_fields
+            return list(selected_fields)
 
         return None
 
     def filter_queryset(self, request, queryset, view):
+        """Restrict queryset to selected fields.
+        Columns are restricted with only(), relations of nested serializer fields are loaded
+        with select_related() and narrow Prefetch(), so number of queries does not depend on page size.
+        """
         selected_fields = self.get_fields(request, queryset, view)
         view.selected_fields = selected_fields
 
         if selected_fields:
-            return queryset.only(*selected_fields)
+            registry_entry = self.get_registry_entry(queryset, view)
+            return registry_entry.get_query_plan(tuple(selected_fields)).apply(queryset)
 
         return queryset
 
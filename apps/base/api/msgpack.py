@@ -0,0 +1,48 @@
+from dataclasses import fields, is_dataclass
+
+import msgpack
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+json_default = JSONEncoder().default
+
+
+def encode_default(obj):
+    """Convert objects that msgpack can't pack. Dataclasses are converted one level at a time, without deep copy,
+    other types are converted the same way as for JSON, so both formats have equal data.
+    """
+    if is_dataclass(obj):
+        return {field.name: getattr(obj, field.name) for field in fields(obj)}
+    return json_default(obj)
+
+
+class MessagePackRenderer(BaseRenderer):
+    """MessagePack renderer for internal clients, negotiated with `Accept: application/msgpack`.
+
+    Renders the same data as ORJSONRenderer, including ActionResponse and ErrorResponse envelopes.
+    """
+
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=encode_default, use_bin_type=True)
+
+
+class MessagePackParser(BaseParser):
+    """MessagePack parser for request body with `Content-Type: application/msgpack`"""
+
+    media_type = "application/msgpack"
+    renderer_class = MessagePackRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return msgpack.unpackb(stream.read(), raw=False)
+        except (ValueError, msgpack.UnpackException) as exc:
+            raise ParseError(f"MessagePack parse error - {exc}")
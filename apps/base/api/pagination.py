@@ -0,0 +1,241 @@
+import datetime
+import json
+from collections.abc import Callable
+from typing import Any
+
+from django.core import signing
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q, QuerySet
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination, _positive_int
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from apps.base.api.compiled import CompiledSerializer
+from apps.base.paginator import EstimatedCountPaginator
+
+
+class CursorJSONEncoder(DjangoJSONEncoder):
+    """DjangoJSONEncoder cuts microseconds of time to milliseconds, cursor position must be exact"""
+
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+class CursorSerializer(signing.JSONSerializer):
+    """Signing serializer that supports dates, decimals and UUIDs in cursor position"""
+
+    def dumps(self, obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), cls=CursorJSONEncoder).encode("latin-1")
+
+
+class KeysetPagination(BasePagination):
+    """Keyset (cursor) pagination.
+
+    Page is selected by position of last object from previous page, `WHERE (date_joined, id) > (%s, %s)`,
+    instead of OFFSET. With index on ordering columns every page costs the same as the first one.
+    Cursor is signed, so clients can't craft positions.
+
+    Ordering columns should be not null and together unique, last one usually is primary key.
+    Ordering can be set on view with `keyset_ordering` attribute.
+
+    Examples:
+        class UserViewSet(ApiGenericViewSet):
+            pagination_class = KeysetPagination
+            keyset_ordering = ("date_joined", "id")
+    """
+
+    page_size = 50
+    max_page_size = 500
+    page_size_query_param = "page_size"
+    cursor_query_param = "cursor"
+    ordering = ("date_joined", "id")
+    cursor_salt = "apps.base.api.pagination.KeysetPagination"
+    invalid_cursor_message = _("Invalid cursor")
+
+    def get_ordering(self, view=None) -> tuple[tuple[str, bool], ...]:
+        """Ordering as tuple of (field name, descending)"""
+        ordering = getattr(view, "keyset_ordering", None) or self.ordering
+        return tuple((name.lstrip("-"), name.startswith("-")) for name in ordering)
+
+    def get_page_size(self, request) -> int:
+        if self.page_size_query_param:
+            try:
+                return _positive_int(
+                    request.query_params[self.page_size_query_param], strict=True, cutoff=self.max_page_size
+                )
+            except (KeyError, ValueError):
+                pass
+        return self.page_size
+
+    def encode_cursor(self, position: list) -> str:
+        return signing.dumps(position, salt=self.cursor_salt, serializer=CursorSerializer, compress=True)
+
+    def decode_cursor(self, request, queryset: QuerySet, ordering: tuple) -> list | None:
+        """Decode position from cursor query param
+
+        Raises:
+            NotFound: if cursor is not valid
+
+        Returns:
+            list|None: values of ordering fields, None for the first page
+        """
+        cursor = request.query_params.get(self.cursor_query_param)
+        if not cursor:
+            return None
+
+        try:
+            position = signing.loads(cursor, salt=self.cursor_salt, serializer=CursorSerializer)
+        except (signing.BadSignature, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if not isinstance(position, list) or len(position) != len(ordering):
+            raise NotFound(self.invalid_cursor_message)
+
+        opts = queryset.model._meta
+        try:
+            return [opts.get_field(name).to_python(value) for (name, __), value in zip(ordering, position)]
+        except ValidationError:
+            raise NotFound(self.invalid_cursor_message)
+
+    @staticmethod
+    def get_position_filter(ordering: tuple, position: list) -> Q:
+        """Filter for objects after position, (a, b) > (x, y) expanded to `a >= x AND (a > x OR (a = x AND b > y))`.
+        First condition lets database use index range scan on the leading column.
+        """
+        after = Q()
+        for index, (name, descending) in enumerate(ordering):
+            condition = Q(**{f"{name}__{'lt' if descending else 'gt'}": position[index]})
+            for previous_index, (previous_name, __) in enumerate(ordering[:index]):
+                condition &= Q(**{previous_name: position[previous_index]})
+            after |= condition
+
+        first_name, first_descending = ordering[0]
+        return Q(**{f"{first_name}__{'lte' if first_descending else 'gte'}": position[0]}) & after
+
+    def get_page_queryset(self, queryset: QuerySet, request, view=None) -> QuerySet:
+        """Ordered queryset of objects after cursor position"""
+        self.request = request
+        self.ordering_fields = self.get_ordering(view)
+        self.page_size_value = self.get_page_size(request)
+
+        position = self.decode_cursor(request, queryset, self.ordering_fields)
+        if position is not None:
+            queryset = queryset.filter(self.get_position_filter(self.ordering_fields, position))
+
+        order_by = [f"-{name}" if descending else name for name, descending in self.ordering_fields]
+        return queryset.order_by(*order_by)
+
+    def include_ordering_fields(self, queryset: QuerySet) -> QuerySet:
+        """Make sure that ordering fields are loaded, when queryset is restricted by only() or defer()"""
+        names = {name for name, __ in self.ordering_fields}
+        fields, defer = queryset.query.deferred_loading
+
+        if defer and fields & names:
+            return queryset.defer(None).defer(*(fields - names))
+        if not defer and fields:
+            return queryset.only(*fields, *names)
+        return queryset
+
+    def set_page(self, objects: list, get_position: Callable[[Any], list]) -> list:
+        """Cut extra object from page and remember position of the last object for next cursor
+
+        Args:
+            objects (list): objects or rows from page queryset
+            get_position (Callable): returns values of ordering fields for object
+
+        Returns:
+            list: objects on page
+        """
+        self.has_next = len(objects) > self.page_size_value
+        objects = objects[: self.page_size_value]
+        self.next_position = get_position(objects[-1]) if self.has_next else None
+        return objects
+
+    def paginate_queryset(self, queryset: QuerySet, request, view=None) -> list:
+        queryset = self.include_ordering_fields(self.get_page_queryset(queryset, request, view))
+        names = [name for name, __ in self.ordering_fields]
+        # One more object to know if there is next page
+        objects = list(queryset[: self.page_size_value + 1])
+        return self.set_page(objects, lambda obj: [getattr(obj, name) for name in names])
+
+    def paginate_compiled(
+        self, queryset: QuerySet, request, compiled_serializer: CompiledSerializer, view=None
+    ) -> list[dict]:
+        """Paginate and serialize page with compiled serializer, ordering columns are loaded in the same query"""
+        queryset = self.get_page_queryset(queryset, request, view)
+        size = len(compiled_serializer.columns)
+
+        rows = compiled_serializer.get_rows(queryset, [name for name, __ in self.ordering_fields])
+        rows = list(rows[: self.page_size_value + 1])
+        rows = self.set_page(rows, lambda row: list(row[size:]))
+        return compiled_serializer.to_representation(row[:size] for row in rows)
+
+    def get_next_link(self) -> str | None:
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.next_position))
+
+    def get_paginated_data(self, data: list) -> dict[str, Any]:
+        return {"next": self.get_next_link(), "results": data}
+
+    def get_paginated_response(self, data: list) -> Response:
+        return Response(self.get_paginated_data(data))
+
+    def get_paginated_response_schema(self, schema: dict) -> dict:
+        return {
+            "type": "object",
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view) -> list[dict]:
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": str(_("The pagination cursor value.")),
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": str(_("Number of results to return per page.")),
+                "schema": {"type": "integer"},
+            },
+        ]
+
+
+class EstimatedCountPagination(PageNumberPagination):
+    """Page number pagination that doesn't count big lists, count is estimated by database.
+    See EstimatedCountPaginator. For big lists without need of page numbers prefer KeysetPagination.
+
+    Examples:
+        class GroupViewSet(ApiGenericViewSet):
+            pagination_class = EstimatedCountPagination
+    """
+
+    django_paginator_class = EstimatedCountPaginator
+    page_size = 50
+    max_page_size = 500
+    page_size_query_param = "page_size"
+
+    def get_paginated_data(self, data: list) -> dict[str, Any]:
+        return {
+            "count": self.page.paginator.count,
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        }
+
+    def get_paginated_response(self, data: list) -> Response:
+        return Response(self.get_paginated_data(data))
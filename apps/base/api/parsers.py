@@ -0,0 +1,25 @@
+import orjson
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+from apps.base.api.renderers import ORJSONRenderer
+
+
+class ORJSONParser(JSONParser):
+    """JSON parser based on orjson. Like strict DRF JSONParser, NaN and Infinity are not accepted"""
+
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+
+        data = stream.read()
+        if encoding.lower().replace("-", "") != "utf8":
+            data = data.decode(encoding)
+
+        try:
+            return orjson.loads(data)
+        except (orjson.JSONDecodeError, UnicodeDecodeError) as exc:
+            raise ParseError(f"JSON parse error - {exc}")
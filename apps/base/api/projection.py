@@ -0,0 +1,172 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model, Prefetch, QuerySet
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.fields.reverse_related import ForeignObjectRel
+from rest_framework import serializers
+from rest_framework.relations import ManyRelatedField, SlugRelatedField
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    """Access plan for queryset: which columns to load, which relations to join and which to prefetch.
+
+    Examples:
+        plan = build_query_plan(User, ["email", "groups__name"])
+        plan.apply(User.objects.all())
+        # User.objects.only("email").prefetch_related(Prefetch("groups", queryset=Group.objects.only("name")))
+    """
+
+    model: type[Model]
+    # None - load all columns of model
+    only: tuple[str, ...] | None
+    select_related: tuple[str, ...] = ()
+    prefetch: tuple[tuple[str, "QueryPlan | None"], ...] = ()
+
+    def apply(self, queryset: QuerySet) -> QuerySet:
+        """Apply plan to queryset
+
+        Args:
+            queryset (QuerySet): queryset of plan model
+
+        Returns:
+            QuerySet: queryset with only(), select_related() and prefetch_related() from plan
+        """
+        if self.only is not None:
+            queryset = queryset.only(*self.only)
+
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+
+        if self.prefetch:
+            queryset = queryset.prefetch_related(
+                *(
+                    Prefetch(lookup, queryset=plan.apply(plan.model._default_manager.all())) if plan else lookup
+                    for lookup, plan in self.prefetch
+                )
+            )
+
+        return queryset
+
+
+def get_serializer_field_paths(field: serializers.Field, path: str) -> tuple[str, ...]:
+    """Get model lookups that serializer field reads. Nested serializers are walked down to their fields.
+
+    Args:
+        field (Field): serializer field
+        path (str): lookup of field source from root model
+
+    Returns:
+        tuple[str, ...]: model lookups, like ("email", "groups__name")
+    """
+    if isinstance(field, serializers.ListSerializer):
+        field = field.child
+
+    if isinstance(field, ManyRelatedField):
+        field = field.child_relation
+
+    if isinstance(field, SlugRelatedField):
+        return (f"{path}{LOOKUP_SEP}{field.slug_field}",)
+
+    if not isinstance(field, serializers.Serializer):
+        return (path,)
+
+    paths = []
+    for field_name, child in field.fields.items():
+        if getattr(child, "write_only", False):
+            continue
+
+        if child.source == "*":
+            # Field reads whole object, so we can not restrict loaded columns of relation
+            paths.append(f"{path}{LOOKUP_SEP}*")
+            continue
+
+        child_path = f"{path}{LOOKUP_SEP}{child.source.replace('.', LOOKUP_SEP)}"
+        paths.extend(get_serializer_field_paths(child, child_path))
+
+    return tuple(paths) or (path,)
+
+
+def build_query_plan(model: type[Model], paths: Iterable[str]) -> QueryPlan:
+    """Build access plan for model lookups.
+
+    Forward FK and one to one relations are joined with select_related(),
+    reverse FK and many to many relations are loaded with Prefetch() that loads only needed columns.
+    If lookup is not a model field (property, method), all columns of its model are loaded.
+
+    Args:
+        model (type[Model]): root model
+        paths (Iterable[str]): model lookups
+
+    Returns:
+        QueryPlan: plan for queryset
+    """
+    tree = {}
+    for path in paths:
+        node = tree
+        for name in path.split(LOOKUP_SEP):
+            node = node.setdefault(name, {})
+
+    return build_model_plan(model, tree)
+
+
+def build_model_plan(model: type[Model], tree: dict, related_field: ForeignObjectRel | None = None) -> QueryPlan:
+    only, select_related, prefetch = [], [], []
+    complete = collect_model_lookups(model, tree, "", only, select_related, prefetch)
+
+    if complete and related_field is not None and not related_field.many_to_many:
+        # Prefetch of reverse relation matches objects by FK to parent, it must be loaded
+        only.append(related_field.field.name)
+
+    return QueryPlan(
+        model=model,
+        only=tuple(only or [model._meta.pk.name]) if complete else None,
+        select_related=tuple(select_related),
+        prefetch=tuple(prefetch),
+    )
+
+
+def collect_model_lookups(
+    model: type[Model], tree: dict, prefix: str, only: list, select_related: list, prefetch: list
+) -> bool:
+    """Walk tree of lookups for model and fill only, select_related and prefetch lists.
+
+    Returns:
+        bool: False if all columns of model should be loaded
+    """
+    complete = True
+
+    for name, subtree in tree.items():
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            complete = False
+            continue
+
+        path = f"{prefix}{name}"
+
+        if not field.is_relation:
+            only.append(path)
+
+        elif field.concrete and (field.many_to_one or field.one_to_one):
+            only.append(path)
+            if subtree:
+                select_related.append(path)
+                related_only = []
+                if collect_model_lookups(
+                    field.related_model, subtree, f"{path}{LOOKUP_SEP}", related_only, select_related, prefetch
+                ):
+                    only.extend(related_only)
+
+        elif field.related_model is None:
+            # Generic foreign key, it needs content type and object id columns of model
+            complete = False
+            prefetch.append((path, None))
+
+        else:
+            related_field = field if isinstance(field, ForeignObjectRel) else None
+            prefetch.append((path, build_model_plan(field.related_model, subtree, related_field)))
+
+    return complete
@@ -0,0 +1,34 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# Escaped by DRF JSONRenderer, so JSON stays a strict javascript subset
+LINE_SEPARATOR = "\u2028".encode()
+PARAGRAPH_SEPARATOR = "\u2029".encode()
+
+
+class ORJSONRenderer(JSONRenderer):
+    """JSON renderer based on orjson.
+
+    orjson serializes dataclasses, so ActionResponse and ErrorResponse envelopes are written directly,
+    without intermediate dicts. Types that orjson does not know (lazy translations, decimals, querysets)
+    are converted the same way as in DRF JSONEncoder.
+    """
+
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+    default = staticmethod(JSONEncoder().default)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:
+        if data is None:
+            return b""
+
+        options = self.options
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            # orjson supports only indent of 2 spaces
+            options |= orjson.OPT_INDENT_2
+
+        ret = orjson.dumps(data, default=self.default, option=options)
+
+        if LINE_SEPARATOR in ret or PARAGRAPH_SEPARATOR in ret:
+            ret = ret.replace(LINE_SEPARATOR, b"\\u2028").replace(PARAGRAPH_SEPARATOR, b"\\u2029")
+        return ret
@@ -1,12 +1,53 @@
+from functools import lru_cache
+
 from rest_framework import serializers
 
+from apps.base.api.compiled import CompiledSerializer, compile_serializer
+
 
 class DynamicFieldModelSerializer(serializers.ModelSerializer):
+    """Model serializer that returns only fields selected by `selected_fields` in context.
+
+    By default, serializer builds all fields and drops not selected ones.
+    With `cache_selected_fields_classes = True` serializer is created from subclass that declares only
+    selected fields. Subclass is created once for every set of selected fields and cached, so
+    building of serializer costs proportionally to the number of selected fields, not the whole model.
+    Selection comes from clients, so unknown names are dropped from cache key and cache keeps only
+    recently used sets of fields.
+
+    Examples:
+        class UserSerializer(DynamicFieldModelSerializer):
+            cache_selected_fields_classes = True
+
+            class Meta:
+                model = User
+                fields = ["id", "email", "name"]
+
+        UserSerializer(user, context={"selected_fields": ["email"]}).data  # {"id": 1, "email": "..."}
+
+    With `compiled_read = True` read only list responses can be built by CompiledSerializer
+    from values_list() rows, see get_compiled_serializer().
+    """
+
+    cache_selected_fields_classes = False
+    compiled_read = False
+    # Set for subclasses created for selected fields
+    selected_fields_class = False
+
+    def __new__(cls, *args, **kwargs):
+        context = kwargs.get("context")
+        selected_fields = context.get("selected_fields") if context else None
+
+        if selected_fields and cls.cache_selected_fields_classes and not cls.selected_fields_class:
+            cls = cls.get_selected_fields_class(cls.get_selected_fields_key(selected_fields))
+
+        return super().__new__(cls, *args, **kwargs)
+
     def __init__(self, *args, **kwargs):
         context = kwargs.get("context")
         selected_fields = None
 
-        if context:
+        if context and not self.selected_fields_class:
             selected_fields = context.get("selected_fields", [])
 
         super().__init__(*args, **kwargs)
@@ -18,3 +59,66 @@ class DynamicFieldModelSerializer(serializers.ModelSerializer):
 
             for field_name in remove_fields:
                 self.fields.pop(field_name)
+
+    @classmethod
+    def get_all_field_names(cls) -> tuple[str, ...]:
+        """Names of all fields of serializer, computed once per class"""
+        if "_all_field_names" not in cls.__dict__:
+            cls._all_field_names = tuple(cls().fields.keys())
+        return cls._all_field_names
+
+    @classmethod
+    def get_selected_fields_key(cls, selected_fields) -> frozenset[str]:
+        """Cache key of selected fields: names of fields of serializer, in any order"""
+        return frozenset(cls.get_all_field_names()).intersection(selected_fields)
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def get_selected_fields_class(cls, selected_fields: frozenset[str]) -> type["DynamicFieldModelSerializer"]:
+        """Get subclass of serializer with only selected fields. Subclass is created on first use and cached.
+
+        Args:
+            selected_fields (frozenset[str]): names of fields to keep, "id" is always kept
+
+        Returns:
+            type[DynamicFieldModelSerializer]: serializer class
+        """
+        field_names = [name for name in cls.get_all_field_names() if name in selected_fields or name == "id"]
+        meta = type("Meta", (cls.Meta,), {"fields": field_names, "exclude": None})
+        selected_fields_class = type(
+            cls.__name__, (cls,), {"Meta": meta, "selected_fields_class": True, "__module__": cls.__module__}
+        )
+        # Declared fields are deep copied on every instantiation, keep only selected ones
+        selected_fields_class._declared_fields = {
+            name: field for name, field in cls._declared_fields.items() if name in field_names
+        }
+        return selected_fields_class
+
+    @classmethod
+    def get_compiled_serializer(cls, selected_fields: list[str] | None = None) -> CompiledSerializer | None:
+        """Get compiled read only serializer for selected fields. Compiled once for every set of selected fields.
+
+        Args:
+            selected_fields (list[str]|None): names of fields to keep, None - all fields
+
+        Returns:
+            CompiledSerializer | None: None if compiled mode is off or some selected field can't be compiled
+        """
+        if not cls.compiled_read:
+            return None
+
+        return cls.compile_selected_fields(cls.get_selected_fields_key(selected_fields) if selected_fields else None)
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def compile_selected_fields(cls, selected_fields: frozenset[str] | None) -> CompiledSerializer | None:
+        """Compile serializer for selected fields, cached for recently used sets of selected fields
+
+        Args:
+            selected_fields (frozenset[str]|None): cache key of selected fields, None - all fields
+
+        Returns:
+            CompiledSerializer | None: None if some selected field can't be compiled
+        """
+        context = {"selected_fields": None if selected_fields is None else ["id", *selected_fields]}
+        return compile_serializer(cls(context=context))
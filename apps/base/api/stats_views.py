@@ -0,0 +1,20 @@
+from rest_framework.permissions import IsAdminUser
+
+from apps.base.api.cache import get_response_cache_stats
+from apps.base.api.transactions import NONE
+from apps.base.api.views import ApiGenericViewSet
+from apps.base.db.pool import get_pools_stats
+
+
+class StatsViewSet(ApiGenericViewSet):
+    """Runtime counters for admins: hits and misses of response cache, usage of database pools.
+    Counters are kept in memory of every process, response has counters of process that served request.
+    """
+
+    permission_classes = [IsAdminUser]
+    transaction_policy = NONE
+
+    def list(self, request):
+        return self.create_successful_response(
+            data={"response_cache": get_response_cache_stats(), "db_pools": get_pools_stats()}
+        )
@@ -0,0 +1,36 @@
+from collections.abc import Iterable, Iterator
+from itertools import islice
+
+from apps.base.api.renderers import ORJSONRenderer
+from apps.base.response import ActionResponse
+
+
+def iter_chunks(iterable: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def stream_json_envelope(envelope: ActionResponse, chunks: Iterable[list]) -> Iterator[bytes]:
+    """Render envelope with list data as JSON piece by piece. Only one chunk of data is in memory at a time.
+
+    Args:
+        envelope (ActionResponse): response envelope, its data is replaced by items of chunks
+        chunks (Iterable[list]): chunks of serialized objects
+
+    Yields:
+        bytes: parts of JSON document
+    """
+    renderer = ORJSONRenderer()
+    envelope = ActionResponse(message=envelope.message, status=envelope.status, data=[])
+    # Data is the last field of envelope, so rendered envelope ends with `[]}`
+    head, tail = renderer.render(envelope).rsplit(b"[]", 1)
+
+    yield head + b"["
+    separator = b""
+    for chunk in chunks:
+        if chunk:
+            # Chunk rendered as array, without brackets
+            yield separator + renderer.render(chunk)[1:-1]
+            separator = b","
+    yield b"]" + tail
@@ -0,0 +1,243 @@
+import asyncio
+import logging
+import threading
+import weakref
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.throttling import SimpleRateThrottle
+
+logger = logging.getLogger(__name__)
+
+# Atomic token bucket refill and take. Bucket is stored as a hash {tokens, ts} and expires after full refill,
+# so an idle client costs nothing in the store.
+TOKEN_BUCKET_LUA = """
+local capacity = tonumber(ARGV[1])
+local refill_rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local ttl = tonumber(ARGV[4])
+
+local bucket = redis.call("HMGET", KEYS[1], "tokens", "ts")
+local tokens = tonumber(bucket[1])
+local ts = tonumber(bucket[2])
+if tokens == nil or ts == nil then
+    tokens = capacity
+    ts = now
+end
+
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * refill_rate)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+
+redis.call("HSET", KEYS[1], "tokens", tostring(tokens), "ts", tostring(now))
+redis.call("EXPIRE", KEYS[1], ttl)
+return {allowed, tostring(tokens)}
+"""
+
+
+class TokenBucketStore:
+    """Base class for token bucket storages.
+    Each bucket holds up to `capacity` tokens and refills with `capacity / duration` tokens per second.
+    """
+
+    def consume(self, key: str, capacity: int, duration: int, now: float) -> tuple[bool, float]:
+        """Take one token from bucket
+
+        Args:
+            key (str): bucket key, unique for scope and client
+            capacity (int): max number of tokens in bucket
+            duration (int): seconds for a full refill of bucket
+            now (float): current timestamp
+
+        Returns:
+            tuple[bool, float]: if token was taken, and number of tokens left in bucket
+        """
+        raise NotImplementedError(".consume() must be overridden")
+
+    async def aconsume(self, key: str, capacity: int, duration: int, now: float) -> tuple[bool, float]:
+        """Async version of consume(), by default consume() runs in thread"""
+        return await sync_to_async(self.consume)(key, capacity, duration, now)
+
+    @staticmethod
+    def refill(tokens: float, last_update: float, capacity: int, duration: int, now: float) -> float:
+        return min(capacity, tokens + max(0.0, now - last_update) * capacity / duration)
+
+
+# Async Redis clients with token bucket script, by event loop and cache alias
+async_redis_scripts = weakref.WeakKeyDictionary()
+
+
+def get_async_token_bucket_script(cache_alias: str):
+    """Token bucket script registered in async Redis client of current event loop.
+    Async connections can't be shared between event loops, so every loop gets own client.
+    """
+    import redis.asyncio
+
+    scripts = async_redis_scripts.setdefault(asyncio.get_running_loop(), {})
+    if cache_alias not in scripts:
+        location = settings.CACHES[cache_alias]["LOCATION"]
+        if isinstance(location, str):
+            location = location.split(",")
+        scripts[cache_alias] = redis.asyncio.Redis.from_url(location[0]).register_script(TOKEN_BUCKET_LUA)
+    return scripts[cache_alias]
+
+
+class RedisTokenBucketStore(TokenBucketStore):
+    """Token buckets shared between all workers. Refill and take are done in one Lua script, so it is atomic."""
+
+    def __init__(self, cache_alias: str):
+        from django_redis import get_redis_connection
+
+        self.cache_alias = cache_alias
+        self.cache = caches[cache_alias]
+        self.script = get_redis_connection(cache_alias).register_script(TOKEN_BUCKET_LUA)
+
+    def consume(self, key: str, capacity: int, duration: int, now: float) -> tuple[bool, float]:
+        from redis.exceptions import RedisError
+
+        try:
+            allowed, tokens = self.script(
+                keys=[self.cache.make_key(key)],
+                args=[capacity, capacity / duration, now, duration],
+            )
+        except RedisError:
+            # Same behaviour as cache with IGNORE_EXCEPTIONS: do not lock out users when store is down
+            logger.warning("Token bucket store is unavailable, request for %s is not throttled", key, exc_info=True)
+            return True, float(capacity)
+
+        return bool(allowed), float(tokens)
+
+    async def aconsume(self, key: str, capacity: int, duration: int, now: float) -> tuple[bool, float]:
+        """Same as consume(), with async Redis client, so event loop is not blocked by Redis call"""
+        from redis.exceptions import RedisError
+
+        try:
+            allowed, tokens = await get_async_token_bucket_script(self.cache_alias)(
+                keys=[self.cache.make_key(key)],
+                args=[capacity, capacity / duration, now, duration],
+            )
+        except RedisError:
+            logger.warning("Token bucket store is unavailable, request for %s is not throttled", key, exc_info=True)
+            return True, float(capacity)
+
+        return bool(allowed), float(tokens)
+
+
+class CacheTokenBucketStore(TokenBucketStore):
+    """Token buckets in any Django cache backend.
+    Atomic only inside one process, so use it for LocMem cache in tests and local development.
+    """
+
+    lock = threading.Lock()
+
+    def __init__(self, cache_alias: str):
+        self.cache = caches[cache_alias]
+
+    def consume(self, key: str, capacity: int, duration: int, now: float) -> tuple[bool, float]:
+        with self.lock:
+            tokens, last_update = self.cache.get(key, (capacity, now))
+            tokens = self.refill(tokens, last_update, capacity, duration, now)
+
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+
+            self.cache.set(key, (tokens, now), duration)
+
+        return allowed, tokens
+
+
+# Token bucket stores by cache alias, so Lua script is registered once per process and not on every request
+token_bucket_stores: dict[str, TokenBucketStore] = {}
+
+
+def get_token_bucket_store(cache_alias: str = "default") -> TokenBucketStore:
+    """Pick token bucket store for cache. Redis cache gets atomic shared store, others get in-process store.
+    Store is created on first use and shared by all requests of process.
+
+    Args:
+        cache_alias (str): alias of cache in settings.CACHES
+
+    Returns:
+        TokenBucketStore: store for token buckets
+    """
+    store = token_bucket_stores.get(cache_alias)
+    if store is None:
+        if caches[cache_alias].__class__.__module__.startswith("django_redis"):
+            store = RedisTokenBucketStore(cache_alias)
+        else:
+            store = CacheTokenBucketStore(cache_alias)
+        token_bucket_stores[cache_alias] = store
+    return store
+
+
+class TokenBucketRateThrottle(SimpleRateThrottle):
+    """Rate throttle based on token bucket.
+    Unlike DRF SimpleRateThrottle it keeps two numbers per client instead of history of request timestamps,
+    so every check is O(1) and, with Redis cache, limits are shared between all workers.
+
+    Rate format is the same as for SimpleRateThrottle: "10/minute" gives bucket of 10 tokens
+    that fully refills in one minute.
+    """
+
+    cache_alias = "default"
+    cache_format = "throttle_bucket_%(scope)s_%(ident)s"
+
+    def allow_request(self, request, view) -> bool:
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.now = self.timer()
+        store = get_token_bucket_store(self.cache_alias)
+        allowed, self.tokens = store.consume(self.key, self.num_requests, self.duration, self.now)
+
+        if allowed:
+            return self.throttle_success()
+        return self.throttle_failure()
+
+    async def aallow_request(self, request, view) -> bool:
+        """Async version of allow_request() for async views"""
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.now = self.timer()
+        store = get_token_bucket_store(self.cache_alias)
+        allowed, self.tokens = await store.aconsume(self.key, self.num_requests, self.duration, self.now)
+
+        if allowed:
+            return self.throttle_success()
+        return self.throttle_failure()
+
+    def throttle_success(self) -> bool:
+        return True
+
+    def wait(self) -> float:
+        """Seconds until next token will be available in bucket"""
+        return max(0.0, 1 - self.tokens) * self.duration / self.num_requests
+
+
+class AnonTokenBucketRateThrottle(TokenBucketRateThrottle):
+    """Token bucket version of AnonRateThrottle. Only unauthenticated requests are throttled, by client ip."""
+
+    scope = "anon"
+
+    def get_cache_key(self, request, view) -> str | None:
+        if request.user and request.user.is_authenticated:
+            return None
+
+        return self.cache_format % {
+            "scope": self.scope,
+            "ident": self.get_ident(request),
+        }
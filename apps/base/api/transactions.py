@@ -0,0 +1,121 @@
+import logging
+from collections.abc import Callable
+from contextlib import ExitStack, contextmanager
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.transaction import TransactionManagementError
+
+logger = logging.getLogger(__name__)
+
+# Action runs in autocommit mode, every query is committed by itself
+NONE = "none"
+# Action runs in read only transaction with one snapshot for all queries, writes are rejected
+READ_ONLY = "read_only"
+# Action runs in transaction, like with ATOMIC_REQUESTS
+ATOMIC = "atomic"
+TRANSACTION_POLICIES = (NONE, READ_ONLY, ATOMIC)
+
+WRITE_STATEMENTS = ("INSERT", "UPDATE", "DELETE", "MERGE")
+
+
+def transaction_policy(policy: str) -> Callable:
+    """Declare transaction policy of viewset action, see ApiGenericViewSet.get_transaction_policy()
+
+    Examples:
+        @transaction_policy(NONE)
+        @action(methods=[HttpMethods.GET], detail=False)
+        def ping(self, request):
+            return Response(data="pong")
+    """
+    if policy not in TRANSACTION_POLICIES:
+        raise ValueError(f"Unknown transaction policy {policy!r}, use one of {TRANSACTION_POLICIES}")
+
+    def decorator(handler: Callable) -> Callable:
+        handler.transaction_policy = policy
+        return handler
+
+    return decorator
+
+
+def is_write_query(sql: str) -> bool:
+    words = sql.split(None, 1)
+    return bool(words) and words[0].upper() in WRITE_STATEMENTS
+
+
+@contextmanager
+def read_only_atomic(using: str | None = None):
+    """Transaction for read only action. On PostgreSQL it's REPEATABLE READ READ ONLY transaction:
+    all queries see the same snapshot (like count and page of list) and database rejects writes.
+    Nested in other transaction, it's savepoint of outer transaction
+    """
+    connection = transaction.get_connection(using)
+    is_outermost = not connection.in_atomic_block
+
+    with transaction.atomic(using=using):
+        if is_outermost and connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY")
+        yield
+
+
+class WriteQueryGuard:
+    """Database execute wrapper that flags writes of non-atomic actions.
+
+    Write in read only action raises TransactionManagementError. Action without transaction may issue one write,
+    it's atomic by itself, second write is logged: failure between writes leaves partial changes.
+    With settings.API_TRANSACTION_WRITE_CHECK_STRICT second write raises TransactionManagementError too.
+    Writes in transactions that action opens itself with transaction.atomic() are not counted.
+    """
+
+    def __init__(self, action: str, policy: str, connection):
+        self.action = action
+        self.policy = policy
+        self.strict = settings.API_TRANSACTION_WRITE_CHECK_STRICT
+        self.writes = 0
+        # Atomic blocks opened before action, like transaction of test case
+        self.atomic_depth = len(connection.atomic_blocks)
+
+    def __call__(self, execute, sql, params, many, context):
+        in_action_atomic = len(context["connection"].atomic_blocks) > self.atomic_depth
+        if is_write_query(sql) and not (self.policy == NONE and in_action_atomic):
+            self.writes += 1
+            if self.policy == READ_ONLY:
+                raise TransactionManagementError(f"Write query in read only action {self.action}: {sql}")
+            if self.writes == 2 and self.strict:
+                raise TransactionManagementError(f"Several writes in action {self.action} without transaction: {sql}")
+            if self.writes == 2:
+                logger.warning(
+                    "Action %s without transaction issued several writes, use atomic transaction policy", self.action
+                )
+        return execute(sql, params, many, context)
+
+
+@contextmanager
+def transaction_policy_context(policy: str, action: str, using: str | None = None):
+    """Run action with transaction policy. Writes of non-atomic actions are checked
+    when settings.API_TRANSACTION_WRITE_CHECK is on
+
+    Args:
+        policy (str): "none", "read_only" or "atomic"
+        action (str): name of action for messages
+        using (str|None): database alias of transaction
+
+    Yields:
+        bool: action runs in transaction or savepoint
+    """
+    connection = connections[using or DEFAULT_DB_ALIAS]
+
+    with ExitStack() as stack:
+        if policy == ATOMIC:
+            stack.enter_context(transaction.atomic(using=using))
+        elif policy == READ_ONLY:
+            stack.enter_context(read_only_atomic(using=using))
+        elif connection.in_atomic_block:
+            # Action is called in outer transaction (like test case), savepoint keeps rollback
+            # of failed action from rolling back outer transaction
+            stack.enter_context(transaction.atomic(using=using))
+
+        if policy != ATOMIC and settings.API_TRANSACTION_WRITE_CHECK:
+            stack.enter_context(connection.execute_wrapper(WriteQueryGuard(action, policy, connection)))
+        yield connection.in_atomic_block
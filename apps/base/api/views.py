@@ -1,9 +1,19 @@
+import hashlib
+from collections.abc import Callable, Iterator
 from typing import Any
 
+from django.db import connections, transaction
+from django.db.models import QuerySet
+from django.http import HttpResponseBase, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers, quote_etag
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
+from apps.base.api.cache import get_model_version
+from apps.base.api.compiled import CompiledSerializer
+from apps.base.api.streaming import iter_chunks, stream_json_envelope
+from apps.base.api.transactions import ATOMIC, NONE, transaction_policy_context
 from apps.base.response import ActionResponse, transform_status_code_to_message
 
 
@@ -11,6 +21,70 @@ class ApiGenericViewSet(GenericViewSet):
     """Modified view for unification of response messages"""
 
     messages = {}
+    # List responses have ETag by version of model in cache, that is replaced on save and delete of objects
+    # (see apps.base.api.cache). Conditional GET requests are answered with 304 without database queries
+    conditional_list = False
+    conditional_cache_alias = "default"
+    # Allow list actions to stream all objects as JSON without pagination, requested by `?stream=true`
+    streaming_list = False
+    stream_query_param = "stream"
+    stream_chunk_size = 2000
+    # Transaction policy of actions without @transaction_policy(): "none", "read_only" or "atomic".
+    # It replaces ATOMIC_REQUESTS for viewset, only actions that write should run in transaction.
+    transaction_policy = ATOMIC
+    # Database alias of action transactions, None - default database
+    transaction_using: str | None = None
+
+    @classmethod
+    def as_view(cls, actions=None, **initkwargs):
+        view = super().as_view(actions, **initkwargs)
+        # Transaction is started by dispatch() by policy of action
+        view._non_atomic_requests = set(connections)
+        return view
+
+    def get_transaction_policy(self, action: str | None) -> str:
+        """Transaction policy of action, set by @transaction_policy() or by transaction_policy attribute
+
+        Args:
+            action (str|None): name of action
+
+        Returns:
+            str: "none", "read_only" or "atomic"
+        """
+        handler = getattr(self, action, None) if action else None
+        return getattr(handler, "transaction_policy", self.transaction_policy)
+
+    def is_transaction_deferred(self, action: str | None) -> bool:
+        """Transaction of action is started by handler decorator with run_in_transaction_policy(),
+        like @cache_response() after cache miss, and not by dispatch()
+        """
+        handler = getattr(self, action, None) if action else None
+        return getattr(handler, "deferred_transaction", False)
+
+    def dispatch(self, request, *args, **kwargs):
+        # self.action is set later by initialize_request()
+        action = getattr(self, "action_map", {}).get(request.method.lower())
+        policy = NONE if self.is_transaction_deferred(action) else self.get_transaction_policy(action)
+        with transaction_policy_context(
+            policy, f"{self.__class__.__name__}.{action}", using=self.transaction_using
+        ) as in_transaction:
+            response = super().dispatch(request, *args, **kwargs)
+            if in_transaction and getattr(response, "exception", False):
+                # Error response rolls back changes of action, like with ATOMIC_REQUESTS
+                transaction.set_rollback(True, using=self.transaction_using)
+            return response
+
+    def run_in_transaction_policy(self, handler: Callable, request, *args, **kwargs):
+        """Run handler of current action in transaction by policy of action"""
+        with transaction_policy_context(
+            self.get_transaction_policy(self.action),
+            f"{self.__class__.__name__}.{self.action}",
+            using=self.transaction_using,
+        ) as in_transaction:
+            response = handler(request, *args, **kwargs)
+            if in_transaction and getattr(response, "exception", False):
+                transaction.set_rollback(True, using=self.transaction_using)
+            return response
 
     def get_message(self, message_code: str) -> str:
         """Method return translated message for detail description of response data
@@ -50,10 +124,171 @@ class ApiGenericViewSet(GenericViewSet):
             data=ActionResponse(status=action_response_status, message=message, data=data), status=status_code
         )
 
+    def get_compiled_serializer(self) -> CompiledSerializer | None:
+        """Compiled serializer for selected fields, if serializer class supports compiled read mode"""
+        get_compiled_serializer = getattr(self.get_serializer_class(), "get_compiled_serializer", None)
+        if get_compiled_serializer is None:
+            return None
+        return get_compiled_serializer(getattr(self, "selected_fields", None))
+
+    def get_list_data(self, queryset: QuerySet) -> list:
+        """Serialize list of objects for read only response.
+        If serializer supports compiled read mode, data is built from values_list() rows without model instances.
+
+        Args:
+            queryset (QuerySet): filtered queryset
+
+        Returns:
+            list: serialized data
+        """
+        compiled_serializer = self.get_compiled_serializer()
+        if compiled_serializer is not None:
+            return compiled_serializer.serialize(queryset)
+
+        return self.get_serializer(queryset, many=True).data
+
+    def get_paginated_list_data(self, queryset: QuerySet) -> Any:
+        """Serialize page of objects, or all objects if view has no pagination.
+
+        Args:
+            queryset (QuerySet): filtered queryset
+
+        Returns:
+            Any: paginated data
+        """
+        paginator = self.paginator
+        if paginator is None:
+            return self.get_list_data(queryset)
+
+        compiled_serializer = self.get_compiled_serializer()
+        if compiled_serializer is not None and hasattr(paginator, "paginate_compiled"):
+            data = paginator.paginate_compiled(queryset, self.request, compiled_serializer, view=self)
+        else:
+            page = self.paginate_queryset(queryset)
+            data = self.get_serializer(page, many=True).data
+
+        return paginator.get_paginated_data(data)
+
+    def get_conditional_etag(self, queryset: QuerySet) -> str | None:
+        """Compute ETag of list from version of model, without queries to database.
+        Version changes after every save and delete of model objects, so ETag changes after create, update
+        and delete. Query params, selected fields, user and media type of response are part of ETag,
+        so different projections, pages and renderers do not collide.
+
+        Args:
+            queryset (QuerySet): filtered queryset
+
+        Returns:
+            str|None: quoted ETag, None if version of model can't be read from cache
+        """
+        model = queryset.model
+        version = get_model_version(model, self.conditional_cache_alias)
+        if version is None:
+            return None
+
+        etag_key = "|".join(
+            [
+                model._meta.label,
+                version,
+                ",".join(getattr(self, "selected_fields", None) or []),
+                str(self.request.user.pk),
+                self.request.accepted_media_type,
+                self.request.get_full_path(),
+            ]
+        )
+        return quote_etag(hashlib.md5(etag_key.encode(), usedforsecurity=False).hexdigest())
+
+    @staticmethod
+    def set_conditional_headers(response: HttpResponseBase, etag: str) -> HttpResponseBase:
+        response["ETag"] = etag
+        # ETag depends on media type of response
+        patch_vary_headers(response, ["Accept"])
+        return response
+
+    def is_streaming_list_request(self) -> bool:
+        """Streaming is enabled on view, requested by query param and response is JSON"""
+        if not self.streaming_list:
+            return False
+        if self.request.query_params.get(self.stream_query_param, "").lower() not in ("1", "true"):
+            return False
+        return getattr(self.request.accepted_renderer, "format", None) == "json"
+
+    def iter_list_data(self, queryset: QuerySet) -> Iterator[list]:
+        """Serialize objects by chunks. Queryset is read with iterator(), so objects are not cached in queryset.
+
+        Args:
+            queryset (QuerySet): filtered queryset
+
+        Yields:
+            list: serialized objects of one chunk
+        """
+        chunk_size = self.stream_chunk_size
+        compiled_serializer = self.get_compiled_serializer()
+
+        if compiled_serializer is not None:
+            rows = compiled_serializer.get_rows(queryset).iterator(chunk_size=chunk_size)
+            for chunk in iter_chunks(rows, chunk_size):
+                yield compiled_serializer.to_representation(chunk)
+            return
+
+        serializer = self.get_serializer()
+        for chunk in iter_chunks(queryset.iterator(chunk_size=chunk_size), chunk_size):
+            yield [serializer.to_representation(instance) for instance in chunk]
+
+    def create_streaming_list_response(self, queryset: QuerySet, message_code: str = None) -> StreamingHttpResponse:
+        """Stream all objects of queryset in unified Api response, without pagination.
+        Peak memory is bounded by `stream_chunk_size` objects, not by number of objects in queryset.
+
+        Args:
+            queryset (QuerySet): filtered queryset
+            message_code (str): Key for message in response
+
+        Returns:
+            StreamingHttpResponse: JSON response
+        """
+        envelope = ActionResponse(
+            status=transform_status_code_to_message(status.HTTP_200_OK),
+            message=self.get_message(message_code) if message_code else None,
+        )
+        return StreamingHttpResponse(
+            stream_json_envelope(envelope, self.iter_list_data(queryset)),
+            content_type=self.request.accepted_renderer.media_type,
+        )
+
+    def create_list_response(self, message_code: str = None) -> HttpResponseBase:
+        """Method helper for list actions. Filter queryset, paginate and serialize it in unified Api response.
+        With `conditional_list` set, conditional requests are supported.
+        With `streaming_list` set, all objects can be streamed by chunks, see create_streaming_list_response().
+
+        Args:
+            message_code (str): Key for message in response
+
+        Returns:
+            HttpResponseBase: Django Response object
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+
+        etag = self.get_conditional_etag(queryset) if self.conditional_list else None
+        if etag is not None:
+            not_modified_response = get_conditional_response(self.request, etag=etag)
+            if not_modified_response is not None:
+                return self.set_conditional_headers(not_modified_response, etag)
+
+        if self.is_streaming_list_request():
+            response = self.create_streaming_list_response(queryset, message_code)
+        else:
+            response = self.create_successful_response(
+                message_code=message_code, data=self.get_paginated_list_data(queryset)
+            )
+
+        if etag is not None:
+            self.set_conditional_headers(response, etag)
+        return response
+
 
 class DynamicFieldApiViewMixin:
     def __init__(self, **kwargs):
-        super(DynamicFieldApiViewMixin).__init__(**kwargs)
+        super().__init__(**kwargs)
         self.selected_fields = None
 
     def get_serializer_context(self):
@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class AuthenticationConfig(AppConfig):
     name = "apps.base"
+
+    def ready(self):
+        from apps.base import checks  # noqa: F401
@@ -0,0 +1,64 @@
+from collections.abc import Iterator
+
+from django.core.checks import Error, Tags, Warning, register
+from django.urls import URLPattern, URLResolver, get_resolver
+
+from apps.base.api.transactions import READ_ONLY, TRANSACTION_POLICIES
+
+UNSAFE_METHODS = ("post", "put", "patch", "delete")
+
+
+def iter_viewset_views(patterns) -> Iterator:
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from iter_viewset_views(pattern.url_patterns)
+        elif isinstance(pattern, URLPattern) and getattr(pattern.callback, "actions", None):
+            yield pattern.callback
+
+
+@register(Tags.urls)
+def check_transaction_policies(app_configs, **kwargs) -> list:
+    """Check transaction policies of routed ApiGenericViewSet actions:
+    policy must be known, actions for POST, PUT, PATCH and DELETE requests can't be read only.
+
+    Check is static, it doesn't know what action does. Writes of non-atomic actions are found at runtime
+    by settings.API_TRANSACTION_WRITE_CHECK, on by DEBUG and in tests, where several writes without
+    transaction fail (settings.API_TRANSACTION_WRITE_CHECK_STRICT), in production only the first is logged.
+    Views that are not ApiGenericViewSet still run in ATOMIC_REQUESTS transaction and are not checked.
+    Async handlers of AsyncApiViewMixin run in autocommit whatever is the policy, only sync handlers are covered.
+    """
+    from apps.base.api.views import ApiGenericViewSet
+
+    errors = []
+    checked = set()
+    for view in iter_viewset_views(get_resolver().url_patterns):
+        if not issubclass(view.cls, ApiGenericViewSet):
+            continue
+
+        viewset = view.cls(**view.initkwargs)
+        for method, action in view.actions.items():
+            if (view.cls, action) in checked:
+                continue
+            checked.add((view.cls, action))
+
+            policy = viewset.get_transaction_policy(action)
+            name = f"{view.cls.__module__}.{view.cls.__qualname__}.{action}"
+            if policy not in TRANSACTION_POLICIES:
+                errors.append(
+                    Error(
+                        f"Unknown transaction policy {policy!r} of {name}.",
+                        hint=f"Use one of {TRANSACTION_POLICIES}.",
+                        obj=view.cls,
+                        id="base.E001",
+                    )
+                )
+            elif policy == READ_ONLY and method in UNSAFE_METHODS:
+                errors.append(
+                    Warning(
+                        f"Action {name} handles {method.upper()} requests in read only transaction.",
+                        hint="Writes of action are rejected, use atomic or none transaction policy.",
+                        obj=view.cls,
+                        id="base.W001",
+                    )
+                )
+    return errors
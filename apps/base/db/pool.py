@@ -0,0 +1,313 @@
+import os
+import threading
+import time
+from collections import Counter, deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from psycopg2 import OperationalError
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE, TRANSACTION_STATUS_UNKNOWN
+
+WEB = "web"
+CELERY = "celery"
+
+# Type of current process, selects pool size from settings.DATABASE_POOL_SIZES
+process_type = WEB
+
+_pools: dict[tuple, "ConnectionPool"] = {}
+_pools_lock = threading.Lock()
+# Connections of parent process, inherited by fork. Child never uses or closes them,
+# psycopg2 would send terminate message to server on close and break connection of parent.
+_inherited: list = []
+
+
+class PoolTimeout(OperationalError):
+    """No free connection in pool during timeout"""
+
+
+@dataclass
+class PooledConnection:
+    connection: object
+    created_at: float
+    returned_at: float
+
+
+class ConnectionPool:
+    """Thread safe pool of database connections of one process.
+
+    Connections are opened on demand up to max_size, caller waits for returned connection when all are in use.
+    Connections are checked and reset when returned: connection in transaction is rolled back,
+    broken connection is closed. Connections older than max_lifetime are replaced, idle connections above
+    min_size are closed after max_idle seconds.
+
+    Args:
+        connect (Callable): opens new connection
+        min_size (int): idle connections that are kept open
+        max_size (int): max connections of process
+        timeout (float): seconds to wait for connection before PoolTimeout
+        max_lifetime (float): seconds after which connection is closed when returned to pool
+        max_idle (float): seconds after which idle connection above min_size is closed
+        check (bool): check idle connection with query before it's given out, after server restart
+            broken connections are replaced instead of failing first request
+    """
+
+    def __init__(
+        self,
+        connect: Callable,
+        min_size: int = 1,
+        max_size: int = 10,
+        timeout: float = 30,
+        max_lifetime: float = 3600,
+        max_idle: float = 600,
+        check: bool = False,
+    ):
+        self.connect = connect
+        self.min_size = min_size
+        self.max_size = max(max_size, min_size, 1)
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.max_idle = max_idle
+        self.check = check
+
+        self.idle: deque[PooledConnection] = deque()
+        self.in_use: dict[int, PooledConnection] = {}
+        # Connections that are being opened
+        self.opening = 0
+        self.waiting = 0
+        self.condition = threading.Condition()
+        self.stats = Counter()
+
+    @property
+    def size(self) -> int:
+        return len(self.idle) + len(self.in_use) + self.opening
+
+    def getconn(self):
+        """Take connection from pool
+
+        Raises:
+            PoolTimeout: all max_size connections are in use during timeout
+        """
+        start = time.monotonic()
+        deadline = start + self.timeout
+
+        with self.condition:
+            self.stats["requests"] += 1
+            waited = False
+            while True:
+                pooled = self._take_idle()
+                if pooled is not None:
+                    self.in_use[id(pooled.connection)] = pooled
+                    break
+
+                if self.size < self.max_size:
+                    self.opening += 1
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.stats["timeouts"] += 1
+                    raise PoolTimeout(f"Couldn't get connection from pool in {self.timeout} seconds")
+
+                waited = True
+                self.waiting += 1
+                try:
+                    self.condition.wait(remaining)
+                finally:
+                    self.waiting -= 1
+
+            if waited:
+                wait_ms = (time.monotonic() - start) * 1000
+                self.stats["waits"] += 1
+                self.stats["wait_ms"] += wait_ms
+                self.stats["wait_ms_max"] = max(self.stats["wait_ms_max"], wait_ms)
+
+        if pooled is not None and self.check and not self._is_usable(pooled.connection):
+            with self.condition:
+                del self.in_use[id(pooled.connection)]
+                self.opening += 1
+                self.stats["connections_closed"] += 1
+            self._close(pooled.connection)
+            pooled = None
+
+        if pooled is None:
+            pooled = self._open()
+        return pooled.connection
+
+    def putconn(self, connection):
+        """Return connection to pool, connection that is not from pool is closed"""
+        with self.condition:
+            pooled = self.in_use.pop(id(connection), None)
+
+        if pooled is None:
+            if not any(connection is inherited for inherited in _inherited):
+                self._close(connection)
+            return
+
+        now = time.monotonic()
+        if now - pooled.created_at > self.max_lifetime or not self._reset(connection):
+            self._discard(connection)
+            return
+
+        pooled.returned_at = now
+        with self.condition:
+            self.idle.append(pooled)
+            self.condition.notify()
+
+    def close(self):
+        """Close idle connections, connections in use are closed when returned"""
+        with self.condition:
+            idle, self.idle = self.idle, deque()
+            self.max_lifetime = 0
+        for pooled in idle:
+            self._close(pooled.connection)
+
+    def get_stats(self) -> dict:
+        with self.condition:
+            return {
+                "size": self.size,
+                "idle": len(self.idle),
+                "in_use": len(self.in_use),
+                "waiting": self.waiting,
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                "requests": self.stats["requests"],
+                "waits": self.stats["waits"],
+                "wait_ms": round(self.stats["wait_ms"], 3),
+                "wait_ms_max": round(self.stats["wait_ms_max"], 3),
+                "timeouts": self.stats["timeouts"],
+                "connections_opened": self.stats["connections_opened"],
+                "connections_closed": self.stats["connections_closed"],
+                "connections_lost": self.stats["connections_lost"],
+            }
+
+    def _take_idle(self) -> PooledConnection | None:
+        """Newest idle connection, expired idle connections above min_size are closed. Called with lock"""
+        now = time.monotonic()
+        while len(self.idle) > self.min_size and now - self.idle[0].returned_at > self.max_idle:
+            expired = self.idle.popleft()
+            self.stats["connections_closed"] += 1
+            # Connection is idle, close doesn't block on server
+            expired.connection.close()
+
+        while self.idle:
+            pooled = self.idle.pop()
+            if not pooled.connection.closed:
+                return pooled
+            self.stats["connections_lost"] += 1
+        return None
+
+    def _open(self) -> PooledConnection:
+        try:
+            connection = self.connect()
+        except BaseException:
+            with self.condition:
+                self.opening -= 1
+                self.condition.notify()
+            raise
+
+        now = time.monotonic()
+        pooled = PooledConnection(connection=connection, created_at=now, returned_at=now)
+        with self.condition:
+            self.opening -= 1
+            self.in_use[id(connection)] = pooled
+            self.stats["connections_opened"] += 1
+        return pooled
+
+    def _reset(self, connection) -> bool:
+        """Rollback transaction that is left open, False if connection is broken"""
+        if connection.closed:
+            self.stats["connections_lost"] += 1
+            return False
+
+        status = connection.get_transaction_status()
+        if status == TRANSACTION_STATUS_IDLE:
+            return True
+        if status == TRANSACTION_STATUS_UNKNOWN:
+            return False
+
+        try:
+            connection.rollback()
+        except Exception:
+            return False
+        return True
+
+    def _is_usable(self, connection) -> bool:
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            connection.rollback()
+        except Exception:
+            self.stats["connections_lost"] += 1
+            return False
+        return True
+
+    def _close(self, connection):
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def _discard(self, connection):
+        self._close(connection)
+        with self.condition:
+            self.stats["connections_closed"] += 1
+            self.condition.notify()
+
+
+def get_pool(key: tuple, create: Callable[[], ConnectionPool]) -> ConnectionPool:
+    """Pool of current process by key, it's created on first use"""
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                pool = _pools[key] = create()
+    return pool
+
+
+def close_pools(alias: str | None = None, database: str | None = None):
+    """Close idle connections of pools and remove pools, filtered by database alias and name"""
+    with _pools_lock:
+        keys = [
+            key for key in _pools if (alias is None or key[0] == alias) and (database is None or key[1] == database)
+        ]
+        pools = [_pools.pop(key) for key in keys]
+
+    for pool in pools:
+        pool.close()
+
+
+def get_pools_stats() -> dict[str, dict]:
+    """Stats of pools of current process, by database alias
+
+    Returns:
+        dict: like {"default": {"size": 4, "idle": 3, "in_use": 1, "waits": 10, "wait_ms": 53.2, ...}}
+    """
+    with _pools_lock:
+        pools = list(_pools.items())
+    return {key[0]: pool.get_stats() for key, pool in pools}
+
+
+def set_process_type(value: str):
+    """Set type of current process, pools that are already opened are recreated with sizes of new type"""
+    global process_type
+
+    if value != process_type:
+        process_type = value
+        close_pools()
+
+
+def reset_after_fork():
+    """Forked process starts with empty pools, inherited connections are kept but never used"""
+    global _pools_lock
+
+    # Lock could be held by other thread of parent during fork
+    _pools_lock = threading.Lock()
+    for pool in _pools.values():
+        _inherited.extend(pooled.connection for pooled in pool.idle)
+        _inherited.extend(pooled.connection for pooled in pool.in_use.values())
+    _pools.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=reset_after_fork)
@@ -0,0 +1,66 @@
+from django.conf import settings
+from django.db.backends.postgresql import base
+from django.db.backends.postgresql.creation import DatabaseCreation as PostgresDatabaseCreation
+from django.utils.asyncio import async_unsafe
+
+from apps.base.db import pool
+
+
+class DatabaseCreation(PostgresDatabaseCreation):
+    def _destroy_test_db(self, test_database_name, verbosity):
+        # Idle pooled connections to test database would block DROP DATABASE
+        pool.close_pools(self.connection.alias, test_database_name)
+        super()._destroy_test_db(test_database_name, verbosity)
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """PostgreSQL backend with pool of connections in every process.
+
+    Django closes connection at the end of request and Celery task (CONN_MAX_AGE is 0), pooled backend
+    returns it to pool of process instead, so new connection is opened only when pool grows.
+    Pool options are set by "POOL" key of database settings, pool size depends on process type
+    and is set by settings.DATABASE_POOL_SIZES.
+
+    Examples:
+        DATABASES = {
+            "default": {
+                "ENGINE": "apps.base.db.postgresql_pool",
+                ...
+                "POOL": {"timeout": 10, "max_lifetime": 3600, "max_idle": 600, "check": False},
+            }
+        }
+    """
+
+    creation_class = DatabaseCreation
+
+    def get_pool_options(self) -> dict:
+        return {
+            **self.settings_dict.get("POOL", {}),
+            **settings.DATABASE_POOL_SIZES.get(pool.process_type, {}),
+        }
+
+    def get_pool(self, conn_params: dict | None = None) -> pool.ConnectionPool:
+        def create() -> pool.ConnectionPool:
+            params = self.get_connection_params() if conn_params is None else conn_params
+            return pool.ConnectionPool(
+                connect=lambda: super(DatabaseWrapper, self).get_new_connection(params), **self.get_pool_options()
+            )
+
+        return pool.get_pool((self.alias, self.settings_dict["NAME"]), create)
+
+    @async_unsafe
+    def get_new_connection(self, conn_params):
+        connection = self.get_pool(conn_params).getconn()
+        self.isolation_level = base.IsolationLevel(
+            self.settings_dict["OPTIONS"].get("isolation_level", base.IsolationLevel.READ_COMMITTED)
+        )
+        return connection
+
+    def _close(self):
+        if self.connection is not None:
+            with self.wrap_database_errors:
+                self.get_pool().putconn(self.connection)
+
+    def close_pool(self):
+        """Close idle connections of pool of this database"""
+        pool.close_pools(self.alias, self.settings_dict["NAME"])
@@ -0,0 +1,108 @@
+import json
+
+from django.conf import settings
+from django.core.paginator import EmptyPage, Page, Paginator
+from django.db import connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+
+
+def get_table_estimate(queryset: QuerySet) -> int | None:
+    """Rows of model table by PostgreSQL statistics (pg_class.reltuples), updated by VACUUM and ANALYZE
+
+    Returns:
+        int|None: None if table was never analyzed
+    """
+    connection = connections[queryset.db]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+            [connection.ops.quote_name(queryset.model._meta.db_table)],
+        )
+        row = cursor.fetchone()
+    return row[0] if row is not None and row[0] >= 0 else None
+
+
+def get_plan_estimate(queryset: QuerySet) -> int:
+    """Rows of queryset estimated by PostgreSQL planner, EXPLAIN doesn't run query"""
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def estimate_count(queryset) -> int | None:
+    """Estimated number of objects without scan of table: statistics of table for unfiltered queryset,
+    planner estimate for filtered one
+
+    Returns:
+        int|None: None if database can't estimate, like not PostgreSQL database or not queryset
+    """
+    if not isinstance(queryset, QuerySet) or connections[queryset.db].vendor != "postgresql":
+        return None
+
+    query = queryset.query
+    if not query.where and not query.distinct and not query.combinator and not query.is_sliced:
+        estimate = get_table_estimate(queryset)
+        if estimate is not None:
+            return estimate
+    return get_plan_estimate(queryset)
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator that doesn't count rows of big querysets, COUNT(*) scans whole table or index.
+
+    Database estimate is used when it's at least estimate_threshold rows, smaller querysets are counted exactly.
+    Estimate is often lower than real count (after bulk inserts, before ANALYZE), so with estimated count
+    pages are not limited by number of pages: page reads one more object to know if next page exists,
+    and count grows to objects that are seen. When estimate is higher than real count, pages after the end
+    are empty. Number of pages is approximate, orphans are not merged into last page.
+    """
+
+    # Exact count below this number of rows, settings.ESTIMATED_COUNT_THRESHOLD by default
+    estimate_threshold: int | None = None
+    count_is_estimated = False
+
+    @cached_property
+    def count(self) -> int:
+        threshold = (
+            self.estimate_threshold if self.estimate_threshold is not None else settings.ESTIMATED_COUNT_THRESHOLD
+        )
+        estimate = estimate_count(self.object_list)
+        if estimate is not None and estimate >= threshold:
+            self.count_is_estimated = True
+            return estimate
+        return super().count
+
+    def set_count(self, count: int):
+        self.count = count
+        # Number of pages is computed from count
+        self.__dict__.pop("num_pages", None)
+
+    def validate_number(self, number) -> int:
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            # Page after estimated number of pages can have objects
+            if not self.count_is_estimated or int(number) < 1:
+                raise
+            return int(number)
+
+    def page(self, number) -> Page:
+        if not self.count or not self.count_is_estimated:
+            return super().page(number)
+
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        # One more object shows that next page exists
+        top = bottom + self.per_page + 1
+        objects = list(self.object_list[bottom:top])
+        has_next = len(objects) > self.per_page
+        seen = bottom + len(objects)
+        if seen > self.count or (objects and not has_next):
+            # More objects than estimated, or the last page is found and count is exact
+            self.set_count(seen)
+        return self._get_page(objects[: self.per_page], number, self)
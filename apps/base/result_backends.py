@@ -0,0 +1,73 @@
+from datetime import timedelta
+
+from celery.utils.time import maybe_timedelta
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django_celery_results.backends import CacheBackend as DjangoCacheBackend
+from django_celery_results.backends import DatabaseBackend as DjangoDatabaseBackend
+from django_celery_results.models import GroupResult, TaskResult
+
+from apps.base.task_results import EXTENDED, get_result_policy
+
+# Fields of result meta of Celery key-value backends that are stored only by EXTENDED policy
+EXTENDED_META_FIELDS = ("args", "kwargs", "worker", "retries", "queue")
+
+
+def prune_task_results(expires: timedelta | float, chunk_size: int | None = None) -> int:
+    """Delete task and group results older than expires, in chunks with short transactions.
+    Chunks are selected by index of date_done, result table isn't locked by one long delete
+
+    Args:
+        expires (timedelta|float): age of results, timedelta or seconds
+        chunk_size (int|None): rows deleted in one transaction, settings.TASK_RESULT_PRUNE_CHUNK_SIZE by default
+
+    Returns:
+        int: number of deleted task results
+    """
+    chunk_size = chunk_size or settings.TASK_RESULT_PRUNE_CHUNK_SIZE
+    cutoff = timezone.now() - maybe_timedelta(expires)
+
+    deleted = {TaskResult: 0, GroupResult: 0}
+    for model in deleted:
+        expired = model._default_manager.filter(date_done__lt=cutoff).order_by("date_done")
+        while True:
+            with transaction.atomic(using=model._default_manager.db):
+                pks = list(expired.values_list("pk", flat=True)[:chunk_size])
+                if pks:
+                    deleted[model] += model._default_manager.filter(pk__in=pks).delete()[0]
+            if len(pks) < chunk_size:
+                break
+    return deleted[TaskResult]
+
+
+class DatabaseBackend(DjangoDatabaseBackend):
+    """django-celery-results database backend with result policies of tasks, see ResultPolicyTask.
+    Arguments of tasks are stored only by EXTENDED policy, expired results are deleted in chunks.
+    """
+
+    def _get_extended_properties(self, request, traceback) -> dict:
+        properties = super()._get_extended_properties(request, traceback)
+        if request is not None and get_result_policy(self.app, request) != EXTENDED:
+            properties.update(periodic_task_name=None, task_args=None, task_kwargs=None, worker=None)
+        return properties
+
+    def cleanup(self):
+        """Delete expired results, it's called by celery.backend_cleanup task"""
+        prune_task_results(self.expires)
+
+
+class CacheBackend(DjangoCacheBackend):
+    """django-celery-results backend that stores results in Django cache (CELERY_CACHE_BACKEND alias),
+    like Redis cache. Results expire by cache timeout, without writes to database.
+    Result policies of tasks are applied like in DatabaseBackend.
+    """
+
+    supports_autoexpire = True
+
+    def _get_result_meta(self, result, state, traceback, request, format_date=True, encode=False) -> dict:
+        meta = super()._get_result_meta(result, state, traceback, request, format_date=format_date, encode=encode)
+        if request is not None and get_result_policy(self.app, request) != EXTENDED:
+            for name in EXTENDED_META_FIELDS:
+                meta.pop(name, None)
+        return meta
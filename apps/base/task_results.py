@@ -0,0 +1,39 @@
+from celery import Celery, Task
+from django.conf import settings
+
+# Result is not stored, for fire-and-forget tasks like emails
+IGNORE = "ignore"
+# Status, result, task name and traceback are stored, without arguments and worker
+COMPACT = "compact"
+# Arguments of task, worker and periodic task name are stored too, see CELERY_RESULT_EXTENDED
+EXTENDED = "extended"
+RESULT_POLICIES = (IGNORE, COMPACT, EXTENDED)
+
+
+class ResultPolicyTask(Task):
+    """Base task class with result_policy option, what is stored in result backend.
+    Tasks without option use settings.TASK_RESULT_POLICY.
+
+    Examples:
+        @celery_app.task(result_policy=IGNORE)
+        def send_template_emails_task(emails: list[dict]) -> int:
+            ...
+    """
+
+    result_policy: str | None = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.result_policy is not None and cls.result_policy not in RESULT_POLICIES:
+            raise ValueError(f"Unknown result policy {cls.result_policy!r}, use one of {RESULT_POLICIES}")
+        if cls.result_policy == IGNORE:
+            cls.ignore_result = True
+
+
+def get_result_policy(app: Celery, request) -> str:
+    """Result policy of task of request, COMPACT or EXTENDED"""
+    # Results are stored by workers, where app is finalized. Otherwise (eager call, result stored by client)
+    # registry is read without finalization of app, that evaluates pending tasks in result path
+    tasks = app.tasks if app.finalized else app._tasks
+    task = tasks.get(getattr(request, "task", None) or "")
+    return getattr(task, "result_policy", None) or settings.TASK_RESULT_POLICY
@@ -0,0 +1,27 @@
+from celery.utils.time import get_exponential_backoff_interval
+from django.conf import settings
+
+from apps.base.result_backends import prune_task_results
+from apps.base.task_results import IGNORE
+from apps.utils.email import TemplateEmailsError, send_template_emails
+from settings import celery_app
+
+
+@celery_app.task(bind=True, max_retries=5, result_policy=IGNORE)
+def send_template_emails_task(self, emails: list[dict]) -> int:
+    """Render and send batch of template emails through one SMTP connection.
+    On SMTP error task is retried with exponential backoff only for emails which were not sent yet
+    """
+    try:
+        return send_template_emails(emails)
+    except TemplateEmailsError as exc:
+        countdown = get_exponential_backoff_interval(
+            factor=1, retries=self.request.retries, maximum=600, full_jitter=True
+        )
+        raise self.retry(args=(exc.unsent,), exc=exc.__cause__, countdown=countdown)
+
+
+@celery_app.task(result_policy=IGNORE)
+def prune_task_results_task() -> int:
+    """Delete task results older than settings.CELERY_RESULT_EXPIRES, run by Celery beat"""
+    return prune_task_results(settings.CELERY_RESULT_EXPIRES)
@@ -0,0 +1,103 @@
+from unittest import mock
+
+import pytest
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.base.api.cache import (
+    VERSION_KEY_FORMAT,
+    cache_response,
+    get_response_cache_stats,
+    response_cache_stats,
+)
+from apps.base.api.transactions import NONE, READ_ONLY, transaction_policy, transaction_policy_context
+from apps.base.api.views import ApiGenericViewSet
+
+
+class CachedViewSet(ApiGenericViewSet):
+    calls = 0
+
+    @cache_response(dependencies=[Group])
+    @transaction_policy(READ_ONLY)
+    def list(self, request):
+        CachedViewSet.calls += 1
+        return self.create_successful_response(data={"calls": CachedViewSet.calls})
+
+
+@pytest.mark.django_db
+class TestCacheResponse:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        cache.clear()
+        response_cache_stats.clear()
+        CachedViewSet.calls = 0
+
+    def get(self, user, params: dict = None):
+        request = APIRequestFactory().get("/", params or {})
+        force_authenticate(request, user)
+        return CachedViewSet.as_view({"get": "list"})(request)
+
+    def test_hit_skips_handler(self, user):
+        assert self.get(user)["X-Response-Cache"] == "miss"
+        response = self.get(user)
+
+        assert response["X-Response-Cache"] == "hit"
+        assert response.data.data == {"calls": 1}
+        assert CachedViewSet.calls == 1
+
+        stats = get_response_cache_stats()
+        assert stats[f"{__name__}.CachedViewSet.list"] == {"hits": 1, "misses": 1}
+
+    def test_key_covers_user_and_params(self, user, user_factory):
+        self.get(user)
+        self.get(user, {"fields": '["email"]'})
+        self.get(user_factory())
+
+        assert CachedViewSet.calls == 3
+
+    def test_invalidation_by_signals(self, user):
+        self.get(user)
+
+        user.save()
+        assert self.get(user).data.data == {"calls": 2}
+
+        Group.objects.create(name="staff")
+        assert self.get(user).data.data == {"calls": 3}
+
+        Group.objects.all().delete()
+        assert self.get(user).data.data == {"calls": 4}
+        assert self.get(user).data.data == {"calls": 4}
+
+    def test_hit_skips_transaction(self, user, monkeypatch):
+        policies = []
+
+        def recording_context(policy, action, using=None):
+            policies.append(policy)
+            return transaction_policy_context(policy, action, using=using)
+
+        monkeypatch.setattr("apps.base.api.views.transaction_policy_context", recording_context)
+
+        self.get(user)
+        assert policies == [NONE, READ_ONLY]
+
+        policies.clear()
+        assert self.get(user)["X-Response-Cache"] == "hit"
+        assert policies == [NONE]
+
+    def test_eviction_of_version_does_not_revive_entries(self, user):
+        self.get(user)
+        Group.objects.create(name="staff")
+        self.get(user)
+
+        # Only version key is evicted, entries of first versions are still in cache
+        cache.delete(VERSION_KEY_FORMAT % "auth.group")
+        assert self.get(user)["X-Response-Cache"] == "miss"
+        assert CachedViewSet.calls == 3
+
+    def test_cache_unavailable(self, user):
+        with mock.patch.object(cache, "get_many", return_value={}), mock.patch.object(cache, "get", return_value=None):
+            assert not self.get(user).has_header("X-Response-Cache")
+            assert not self.get(user).has_header("X-Response-Cache")
+
+        assert CachedViewSet.calls == 2
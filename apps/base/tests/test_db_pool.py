@@ -0,0 +1,202 @@
+import threading
+
+import pytest
+from django.db import connection
+from django.db.backends.postgresql import base
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE, TRANSACTION_STATUS_INERROR, TRANSACTION_STATUS_UNKNOWN
+
+from apps.base.db import pool
+from apps.base.db.pool import ConnectionPool, PoolTimeout
+from apps.base.db.postgresql_pool.base import DatabaseWrapper
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = 0
+        self.status = TRANSACTION_STATUS_IDLE
+        self.rollbacks = 0
+
+    def get_transaction_status(self):
+        return self.status
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.status = TRANSACTION_STATUS_IDLE
+
+    def close(self):
+        self.closed = 1
+
+
+class TestConnectionPool:
+    @pytest.fixture
+    def connections(self) -> list[FakeConnection]:
+        return []
+
+    @pytest.fixture
+    def connect(self, connections: list[FakeConnection]):
+        def connect():
+            connections.append(FakeConnection())
+            return connections[-1]
+
+        return connect
+
+    def test_connection_reused(self, connect, connections):
+        connection_pool = ConnectionPool(connect, max_size=2)
+
+        connection = connection_pool.getconn()
+        connection_pool.putconn(connection)
+
+        assert connection_pool.getconn() is connection
+        assert len(connections) == 1
+        stats = connection_pool.get_stats()
+        assert stats["requests"] == 2
+        assert stats["connections_opened"] == 1
+        assert stats["in_use"] == 1
+
+    def test_connection_reset(self, connect, connections):
+        connection_pool = ConnectionPool(connect)
+
+        connection = connection_pool.getconn()
+        connection.status = TRANSACTION_STATUS_INERROR
+        connection_pool.putconn(connection)
+        assert connection.rollbacks == 1
+        assert connection_pool.getconn() is connection
+
+        connection.status = TRANSACTION_STATUS_UNKNOWN
+        connection_pool.putconn(connection)
+        assert connection.closed
+
+        assert connection_pool.getconn() is not connection
+        assert connection_pool.get_stats()["connections_closed"] == 1
+
+    def test_wait_for_connection(self, connect):
+        connection_pool = ConnectionPool(connect, max_size=1, timeout=5)
+        connection = connection_pool.getconn()
+        timer = threading.Timer(0.05, connection_pool.putconn, [connection])
+        timer.start()
+
+        assert connection_pool.getconn() is connection
+        timer.join()
+
+        stats = connection_pool.get_stats()
+        assert stats["waits"] == 1
+        assert stats["wait_ms"] > 0
+        assert stats["size"] == 1
+
+    def test_timeout(self, connect):
+        connection_pool = ConnectionPool(connect, max_size=1, timeout=0.01)
+        connection_pool.getconn()
+
+        with pytest.raises(PoolTimeout):
+            connection_pool.getconn()
+        assert connection_pool.get_stats()["timeouts"] == 1
+
+    def test_connect_error_releases_slot(self, connect):
+        def broken_connect():
+            raise PoolTimeout("server is down")
+
+        connection_pool = ConnectionPool(broken_connect, max_size=1, timeout=0.01)
+        with pytest.raises(PoolTimeout):
+            connection_pool.getconn()
+
+        connection_pool.connect = connect
+        assert connection_pool.getconn() is not None
+
+    def test_expired_connections(self, connect, connections, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(pool.time, "monotonic", lambda: now[0])
+        connection_pool = ConnectionPool(connect, min_size=1, max_size=3, max_lifetime=100, max_idle=10)
+
+        first, second = connection_pool.getconn(), connection_pool.getconn()
+        connection_pool.putconn(first)
+        connection_pool.putconn(second)
+
+        now[0] += 20
+        # Idle connection above min_size is closed
+        assert connection_pool.getconn() is second
+        assert first.closed
+
+        now[0] += 100
+        connection_pool.putconn(second)
+        assert second.closed
+        assert connection_pool.get_stats()["connections_closed"] == 2
+
+    def test_closed_idle_connection_skipped(self, connect):
+        connection_pool = ConnectionPool(connect)
+        connection = connection_pool.getconn()
+        connection_pool.putconn(connection)
+        connection.closed = 2
+
+        assert connection_pool.getconn() is not connection
+        assert connection_pool.get_stats()["connections_lost"] == 1
+
+
+class TestPools:
+    @pytest.fixture(autouse=True)
+    def clean_pools(self):
+        pool.close_pools()
+        yield
+        pool.close_pools()
+        pool.set_process_type(pool.WEB)
+
+    def test_pools_by_key(self):
+        connection = FakeConnection()
+        default = pool.get_pool(("default", "mysite"), lambda: ConnectionPool(lambda: connection))
+        assert pool.get_pool(("default", "mysite"), ConnectionPool) is default
+
+        default.putconn(default.getconn())
+        assert pool.get_pools_stats()["default"]["idle"] == 1
+
+        pool.close_pools("default", "other")
+        assert not connection.closed
+        pool.close_pools("default", "mysite")
+        assert connection.closed
+        assert pool.get_pools_stats() == {}
+
+    def test_process_type_recreates_pools(self):
+        pool.get_pool(("default", "mysite"), lambda: ConnectionPool(FakeConnection))
+
+        pool.set_process_type(pool.CELERY)
+        assert pool.process_type == pool.CELERY
+        assert pool.get_pools_stats() == {}
+
+    def test_reset_after_fork(self):
+        connection_pool = pool.get_pool(("default", "mysite"), lambda: ConnectionPool(FakeConnection))
+        connection = connection_pool.getconn()
+
+        pool.reset_after_fork()
+        assert pool.get_pools_stats() == {}
+
+        # Inherited connection is not closed in child, it's still used by parent
+        new_pool = pool.get_pool(("default", "mysite"), lambda: ConnectionPool(FakeConnection))
+        new_pool.putconn(connection)
+        assert not connection.closed
+
+
+class TestDatabaseWrapper:
+    @pytest.fixture
+    def wrapper(self, settings, monkeypatch):
+        monkeypatch.setattr(base.DatabaseWrapper, "get_new_connection", lambda self, conn_params: FakeConnection())
+        settings.DATABASE_POOL_SIZES = {"web": {"min_size": 1, "max_size": 3}}
+        settings_dict = {
+            **connection.settings_dict,
+            "NAME": "mysite",
+            "OPTIONS": {},
+            "POOL": {"timeout": 5, "max_size": 1},
+        }
+        yield DatabaseWrapper(settings_dict, alias="pooled")
+        pool.close_pools("pooled")
+
+    def test_pool_options(self, wrapper):
+        assert wrapper.get_pool_options() == {"timeout": 5, "min_size": 1, "max_size": 3}
+
+    def test_connection_returned_to_pool(self, wrapper):
+        wrapper.connection = wrapper.get_new_connection({})
+        pooled_connection = wrapper.connection
+        wrapper._close()
+
+        stats = pool.get_pools_stats()["pooled"]
+        assert stats["idle"] == 1
+        assert stats["max_size"] == 3
+        assert not pooled_connection.closed
+        assert wrapper.get_new_connection({}) is pooled_connection
@@ -0,0 +1,93 @@
+import json
+from unittest import mock
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.base.api.filters import JsonSelectFilter, parse_selected_fields, select_fields_registry
+from apps.base.api.serializers import DynamicFieldModelSerializer
+from apps.base.api.views import ApiGenericViewSet
+
+User = get_user_model()
+
+
+class UserListSerializer(DynamicFieldModelSerializer):
+    class Meta:
+        model = User
+        fields = ["id", "email", "name", "is_verified"]
+
+
+class UserListViewSet(ApiGenericViewSet):
+    queryset = User.objects.all()
+    serializer_class = UserListSerializer
+    filter_backends = [JsonSelectFilter]
+
+
+class StaffEmailSerializer(UserListSerializer):
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.context.get("request")
+        if request is not None and not request.user.is_staff:
+            del fields["email"]
+        return fields
+
+
+class StaffEmailViewSet(UserListViewSet):
+    serializer_class = StaffEmailSerializer
+
+
+class TestJsonSelectFilter:
+    @pytest.fixture(autouse=True)
+    def clear_registry(self):
+        select_fields_registry.clear()
+        parse_selected_fields.cache_clear()
+
+    def make_request(self, fields: list | str) -> Request:
+        params = fields if isinstance(fields, str) else json.dumps(fields)
+        return Request(APIRequestFactory().get("/", {"fields": params}))
+
+    def filter_queryset(self, request: Request):
+        view = UserListViewSet()
+        return view, JsonSelectFilter().filter_queryset(request, User.objects.all(), view)
+
+    def test_select_fields(self):
+        view, queryset = self.filter_queryset(self.make_request(["name", "email", "unknown"]))
+
+        assert view.selected_fields == ["email", "name"]
+        assert queryset.query.deferred_loading == ({"email", "name"}, False)
+
+    def test_no_valid_fields(self):
+        view, queryset = self.filter_queryset(self.make_request(["unknown"]))
+
+        assert view.selected_fields is None
+
+    def test_wrong_format(self):
+        with pytest.raises(ValidationError):
+            self.filter_queryset(self.make_request("email"))
+
+    def test_registry_built_once(self):
+        with mock.patch.object(
+            JsonSelectFilter, "build_registry_entry", wraps=JsonSelectFilter().build_registry_entry
+        ) as build_registry_entry:
+            for __ in range(3):
+                self.filter_queryset(self.make_request(["email"]))
+                self.filter_queryset(self.make_request(["name"]))
+
+        assert build_registry_entry.call_count == 1
+        assert parse_selected_fields.cache_info().currsize == 2
+
+    def test_registry_independent_of_first_request(self):
+        anonymous_request = self.make_request(["name"])
+        anonymous_request.user = AnonymousUser()
+        staff_request = self.make_request(["email"])
+        staff_request.user = User(is_staff=True)
+
+        for request in (anonymous_request, staff_request):
+            view = StaffEmailViewSet(request=request)
+            JsonSelectFilter().filter_queryset(request, User.objects.all(), view)
+
+        assert view.selected_fields == ["email"]
@@ -0,0 +1,81 @@
+import io
+import json
+
+import msgpack
+import pytest
+from drf_spectacular.generators import SchemaGenerator
+from rest_framework import status
+from rest_framework.exceptions import ParseError
+from rest_framework.reverse import reverse
+from rest_framework.test import APIClient
+
+from apps.base.api.msgpack import MessagePackParser, MessagePackRenderer
+from apps.base.response import ActionResponse
+
+
+@pytest.mark.django_db
+class TestMessagePackNegotiation:
+    @pytest.fixture
+    def api_client(self) -> APIClient:
+        return APIClient()
+
+    def get_both(self, api_client: APIClient, url: str, params: dict = None) -> tuple:
+        json_response = api_client.get(url, params, HTTP_ACCEPT="application/json")
+        msgpack_response = api_client.get(url, params, HTTP_ACCEPT="application/msgpack")
+
+        assert msgpack_response["Content-Type"] == "application/msgpack"
+        assert json_response.status_code == msgpack_response.status_code
+        return json.loads(json_response.content), msgpack.unpackb(msgpack_response.content)
+
+    def test_paginated_list_equals_json(self, user, user_factory, api_client: APIClient):
+        user_factory.create_batch(3)
+        user.is_staff = True
+        user.save()
+        api_client.force_authenticate(user)
+
+        json_data, msgpack_data = self.get_both(api_client, reverse("v1:user-list"), {"page_size": 2})
+
+        assert json_data == msgpack_data
+        assert len(msgpack_data["data"]["results"]) == 2
+        assert msgpack_data["data"]["next"]
+
+    def test_error_equals_json(self, api_client: APIClient):
+        json_data, msgpack_data = self.get_both(api_client, reverse("v1:user-list"))
+
+        assert json_data == msgpack_data
+        assert msgpack_data["status"] == "client_error"
+
+    def test_parse_request(self, api_client: APIClient):
+        data = {"email": "jonhndoe@gmail.com", "password": "qwerty123451", "password2": "qwerty123451"}
+        response = api_client.post(
+            reverse("v1:user-register"),
+            data=msgpack.packb(data),
+            content_type="application/msgpack",
+            HTTP_ACCEPT="application/msgpack",
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert msgpack.unpackb(response.content)["data"]["email"] == data["email"]
+
+    def test_schema(self):
+        schema = SchemaGenerator().get_schema(request=None, public=True)
+        operation = schema["paths"][reverse("v1:user-register")]["post"]
+
+        assert "application/msgpack" in operation["requestBody"]["content"]
+        assert "application/msgpack" in operation["responses"]["200"]["content"]
+
+
+class TestMessagePackRenderer:
+    def test_round_trip(self):
+        data = ActionResponse(message="Done", status="success", data={"results": [{"id": 1}], "next": None})
+        content = MessagePackRenderer().render(data)
+
+        assert MessagePackParser().parse(io.BytesIO(content)) == {
+            "message": "Done",
+            "status": "success",
+            "data": {"results": [{"id": 1}], "next": None},
+        }
+
+    def test_parse_error(self):
+        with pytest.raises(ParseError):
+            MessagePackParser().parse(io.BytesIO(b"\xc1"))
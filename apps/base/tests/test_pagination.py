@@ -0,0 +1,116 @@
+import datetime
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.utils import timezone
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.base.api.pagination import EstimatedCountPagination, KeysetPagination
+from apps.base.paginator import EstimatedCountPaginator, estimate_count
+from apps.users.api.serializers import UserListSerializer
+
+User = get_user_model()
+
+
+class TestKeysetPagination:
+    @pytest.fixture
+    def users(self, user_factory) -> list[User]:
+        date_joined = timezone.now()
+        # Users with same date_joined, to check that id breaks ties
+        return [user_factory(date_joined=date_joined + datetime.timedelta(seconds=number // 2)) for number in range(7)]
+
+    def get_pages(self, paginate) -> list[list]:
+        pages, params = [], {"page_size": 3}
+        while True:
+            paginator = KeysetPagination()
+            request = Request(APIRequestFactory().get("/users/", params))
+            pages.append(paginate(paginator, request))
+            next_link = paginator.get_paginated_data([])["next"]
+            if next_link is None:
+                return pages
+            params["cursor"] = Request(APIRequestFactory().get(next_link)).query_params["cursor"]
+
+    @pytest.mark.django_db
+    def test_paginate_queryset(self, users: list[User]):
+        pages = self.get_pages(
+            lambda paginator, request: paginator.paginate_queryset(User.objects.only("email"), request)
+        )
+
+        assert [[user.id for user in page] for page in pages] == [
+            [user.id for user in users[start:end]] for start, end in [(0, 3), (3, 6), (6, 7)]
+        ]
+
+    @pytest.mark.django_db
+    def test_paginate_compiled(self, users: list[User]):
+        compiled_serializer = UserListSerializer.get_compiled_serializer(["email"])
+        pages = self.get_pages(
+            lambda paginator, request: paginator.paginate_compiled(User.objects.all(), request, compiled_serializer)
+        )
+
+        assert pages == [
+            [{"id": user.id, "email": user.email} for user in users[start:end]]
+            for start, end in [(0, 3), (3, 6), (6, 7)]
+        ]
+
+    @pytest.mark.django_db
+    def test_invalid_cursor(self):
+        request = Request(APIRequestFactory().get("/users/", {"cursor": "not-signed"}))
+
+        with pytest.raises(NotFound):
+            KeysetPagination().paginate_queryset(User.objects.all(), request)
+
+
+@pytest.mark.django_db
+class TestEstimatedCountPagination:
+    @pytest.fixture
+    def users(self, user_factory) -> list[User]:
+        return [user_factory() for __ in range(5)]
+
+    def paginate(self, params: dict) -> tuple[list, dict]:
+        paginator = EstimatedCountPagination()
+        request = Request(APIRequestFactory().get("/users/", params))
+        page = paginator.paginate_queryset(User.objects.order_by("id"), request)
+        return page, paginator.get_paginated_data([user.id for user in page])
+
+    def test_exact_count_below_threshold(self, users, monkeypatch, settings):
+        settings.ESTIMATED_COUNT_THRESHOLD = 1000
+        monkeypatch.setattr("apps.base.paginator.estimate_count", lambda queryset: 900)
+
+        page, data = self.paginate({"page_size": 2, "page": 2})
+
+        assert data["count"] == 5
+        assert data["results"] == [user.id for user in users[2:4]]
+        assert data["next"] is not None and data["previous"] is not None
+
+    def test_estimated_count(self, users, monkeypatch, settings):
+        settings.ESTIMATED_COUNT_THRESHOLD = 1000
+        monkeypatch.setattr("apps.base.paginator.estimate_count", lambda queryset: 1200)
+
+        page, data = self.paginate({"page_size": 2})
+        assert data["count"] == 1200
+
+    def test_pages_after_low_estimate(self, users, monkeypatch):
+        monkeypatch.setattr("apps.base.paginator.estimate_count", lambda queryset: 3)
+        paginator = EstimatedCountPaginator(User.objects.order_by("id"), 2)
+        paginator.estimate_threshold = 1
+        assert (paginator.count, paginator.num_pages) == (3, 2)
+
+        page = paginator.page(2)
+        assert page.has_next()
+        assert paginator.count == 5
+
+        page = paginator.page(3)
+        assert [user.id for user in page] == [users[4].id]
+        assert not page.has_next()
+        assert (paginator.count, paginator.num_pages) == (5, 3)
+
+    def test_estimate_count(self, users):
+        if connection.vendor == "postgresql":
+            assert estimate_count(User.objects.all()) >= 0
+            assert estimate_count(User.objects.filter(is_active=True)) >= 0
+        else:
+            assert estimate_count(User.objects.all()) is None
+        assert estimate_count(list(users)) is None
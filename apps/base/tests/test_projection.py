@@ -0,0 +1,77 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from rest_framework import serializers
+
+from apps.base.api.projection import build_query_plan, get_serializer_field_paths
+
+User = get_user_model()
+
+
+class PermissionSerializer(serializers.ModelSerializer):
+    model = serializers.CharField(source="content_type.model")
+
+    class Meta:
+        model = Permission
+        fields = ["codename", "model"]
+
+
+class UserPermissionsSerializer(serializers.ModelSerializer):
+    groups = serializers.SlugRelatedField(slug_field="name", many=True, read_only=True)
+    user_permissions = PermissionSerializer(many=True)
+
+    class Meta:
+        model = User
+        fields = ["email", "groups", "user_permissions"]
+
+
+class TestQueryPlan:
+    def test_serializer_field_paths(self):
+        fields = UserPermissionsSerializer().fields
+
+        assert get_serializer_field_paths(fields["groups"], "groups") == ("groups__name",)
+        assert get_serializer_field_paths(fields["user_permissions"], "user_permissions") == (
+            "user_permissions__codename",
+            "user_permissions__content_type__model",
+        )
+
+    def test_build_query_plan(self):
+        plan = build_query_plan(
+            User, ["email", "groups__name", "user_permissions__codename", "user_permissions__content_type__model"]
+        )
+
+        assert plan.only == ("email",)
+        assert plan.select_related == ()
+        groups_plan = dict(plan.prefetch)["groups"]
+        assert groups_plan.only == ("name",)
+        permissions_plan = dict(plan.prefetch)["user_permissions"]
+        assert permissions_plan.only == ("codename", "content_type", "content_type__model")
+        assert permissions_plan.select_related == ("content_type",)
+
+    def test_not_model_field_loads_all_columns(self):
+        plan = build_query_plan(User, ["email", "groups__natural_key"])
+
+        assert dict(plan.prefetch)["groups"].only is None
+
+    @pytest.mark.django_db
+    def test_number_of_queries_does_not_depend_on_page_size(self, user_factory, django_assert_num_queries):
+        group = Group.objects.create(name="staff")
+        permissions = list(Permission.objects.all()[:3])
+        for __ in range(5):
+            user = user_factory()
+            user.groups.add(group)
+            user.user_permissions.add(*permissions)
+
+        paths = [
+            path
+            for name, field in UserPermissionsSerializer().fields.items()
+            for path in get_serializer_field_paths(field, name)
+        ]
+        queryset = build_query_plan(User, paths).apply(User.objects.all())
+
+        with django_assert_num_queries(3):
+            data = UserPermissionsSerializer(queryset, many=True).data
+
+        assert len(data) == 5
+        assert data[0]["groups"] == ["staff"]
+        assert len(data[0]["user_permissions"]) == 3
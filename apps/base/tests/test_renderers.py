@@ -0,0 +1,51 @@
+import io
+import json
+from decimal import Decimal
+
+import pytest
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ParseError
+
+from apps.base.api.parsers import ORJSONParser
+from apps.base.api.renderers import ORJSONRenderer
+from apps.base.response import ActionResponse, ErrorField, ErrorResponse
+
+
+class TestORJSONRenderer:
+    def render(self, data, accepted_media_type=None) -> dict:
+        return json.loads(ORJSONRenderer().render(data, accepted_media_type))
+
+    def test_render_action_response(self):
+        data = ActionResponse(message=_("Done"), status="success", data={"price": Decimal("1.5"), 1: [None]})
+
+        assert self.render(data) == {"message": "Done", "status": "success", "data": {"price": 1.5, "1": [None]}}
+
+    def test_render_error_response(self):
+        data = ErrorResponse(
+            message=_("Invalid input."),
+            status="validation_error",
+            errors=[ErrorField(code="required", message="This field is required.", field="email")],
+        )
+
+        assert self.render(data) == {
+            "message": "Invalid input.",
+            "status": "validation_error",
+            "errors": [{"code": "required", "message": "This field is required.", "field": "email"}],
+        }
+
+    def test_render_options(self):
+        renderer = ORJSONRenderer()
+
+        assert renderer.render(None) == b""
+        assert renderer.render({"a": 1}, "application/json; indent=4") == b'{\n  "a": 1\n}'
+        assert renderer.render(["\u2028\u2029"]) == b'["\\u2028\\u2029"]'
+
+
+class TestORJSONParser:
+    def test_parse(self):
+        assert ORJSONParser().parse(io.BytesIO('{"name": "Jöhn"}'.encode())) == {"name": "Jöhn"}
+
+    @pytest.mark.parametrize("body", [b"{", b'{"a": NaN}', b"\xff"])
+    def test_parse_error(self, body: bytes):
+        with pytest.raises(ParseError):
+            ORJSONParser().parse(io.BytesIO(body))
@@ -0,0 +1,94 @@
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework import serializers
+
+from apps.base.api.serializers import DynamicFieldModelSerializer
+
+User = get_user_model()
+
+
+class UserSerializer(DynamicFieldModelSerializer):
+    display_name = serializers.CharField(source="name")
+
+    class Meta:
+        model = User
+        fields = ["id", "email", "name", "display_name", "is_verified", "date_joined"]
+
+
+class CachedUserSerializer(UserSerializer):
+    cache_selected_fields_classes = True
+
+
+class TestDynamicFieldModelSerializer:
+    @pytest.mark.django_db
+    @pytest.mark.parametrize("serializer_class", [UserSerializer, CachedUserSerializer])
+    def test_selected_fields(self, user: User, serializer_class):
+        serializer = serializer_class(user, context={"selected_fields": ["email", "display_name"]})
+
+        assert serializer.data == {"id": user.id, "email": user.email, "display_name": user.name}
+
+    @pytest.mark.django_db
+    def test_all_fields_without_selection(self, user: User):
+        assert CachedUserSerializer(user).data == UserSerializer(user).data
+
+    def test_selected_fields_class_cached(self):
+        context = {"selected_fields": ["email", "display_name"]}
+        serializer = CachedUserSerializer(context=context)
+
+        assert isinstance(serializer, CachedUserSerializer)
+        assert type(serializer) is not CachedUserSerializer
+        same_fields_serializer = CachedUserSerializer(context={"selected_fields": ["display_name", "email"]})
+        assert same_fields_serializer.__class__ is serializer.__class__
+        assert list(type(serializer)._declared_fields) == ["display_name"]
+
+    def test_unknown_selected_fields_not_cached(self):
+        serializer = CachedUserSerializer(context={"selected_fields": ["email", "unknown"]})
+
+        assert serializer.__class__ is CachedUserSerializer(context={"selected_fields": ["email"]}).__class__
+        assert CachedUserSerializer.get_selected_fields_class.cache_info().maxsize == 256
+
+    @pytest.mark.django_db
+    def test_many(self, user_factory):
+        users = [user_factory(), user_factory()]
+
+        data = CachedUserSerializer(users, many=True, context={"selected_fields": ["email"]}).data
+
+        assert data == [{"id": user.id, "email": user.email} for user in users]
+
+
+class CompiledUserSerializer(UserSerializer):
+    compiled_read = True
+
+
+class CompiledUserWithMethodSerializer(CompiledUserSerializer):
+    greeting = serializers.SerializerMethodField()
+
+    class Meta(UserSerializer.Meta):
+        fields = UserSerializer.Meta.fields + ["greeting"]
+
+    def get_greeting(self, user: User) -> str:
+        return f"Hello {user.name}"
+
+
+class TestCompiledSerializer:
+    @pytest.mark.django_db
+    @pytest.mark.parametrize("selected_fields", [None, ["email", "date_joined"]])
+    def test_same_data_as_serializer(self, user_factory, selected_fields):
+        user_factory.create_batch(3)
+        queryset = User.objects.order_by("id")
+
+        compiled_serializer = CompiledUserSerializer.get_compiled_serializer(selected_fields)
+        data = compiled_serializer.serialize(queryset)
+
+        assert data == UserSerializer(queryset, many=True, context={"selected_fields": selected_fields}).data
+
+    def test_not_compiled_fields(self):
+        assert CompiledUserWithMethodSerializer.get_compiled_serializer() is None
+        assert CompiledUserWithMethodSerializer.get_compiled_serializer(["email"]) is not None
+        assert UserSerializer.get_compiled_serializer() is None
+
+    def test_compiled_serializer_cached(self):
+        compiled_serializer = CompiledUserSerializer.get_compiled_serializer(["email", "name"])
+
+        assert CompiledUserSerializer.get_compiled_serializer(["name", "email", "unknown"]) is compiled_serializer
+        assert CompiledUserSerializer.compile_selected_fields.cache_info().maxsize == 256
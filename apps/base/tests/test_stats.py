@@ -0,0 +1,21 @@
+import pytest
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APIClient
+
+
+@pytest.mark.django_db
+def test_stats(user, user_factory):
+    api_client = APIClient()
+    api_client.force_authenticate(user)
+    url = reverse("v1:stats-list")
+
+    assert api_client.get(url).status_code == status.HTTP_403_FORBIDDEN
+
+    api_client.force_authenticate(user_factory(is_staff=True))
+    api_client.get(reverse("v1:user-list"))
+    response = api_client.get(url)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data.data["response_cache"]["apps.users.api.views.UserViewSet.list"]["misses"] >= 1
+    assert "db_pools" in response.data.data
@@ -0,0 +1,55 @@
+import json
+
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework import serializers
+from rest_framework.test import APIRequestFactory
+
+from apps.base.api.streaming import stream_json_envelope
+from apps.base.api.views import ApiGenericViewSet
+from apps.base.response import ActionResponse
+
+User = get_user_model()
+
+
+class UserEmailSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = User
+        fields = ["id", "email"]
+
+
+class StreamingUserViewSet(ApiGenericViewSet):
+    queryset = User.objects.order_by("id")
+    serializer_class = UserEmailSerializer
+    streaming_list = True
+    stream_chunk_size = 2
+
+    def list(self, request):
+        return self.create_list_response()
+
+
+def test_stream_json_envelope():
+    envelope = ActionResponse(message="[]", status="success")
+    content = b"".join(stream_json_envelope(envelope, [[{"id": 1}, {"id": 2}], [], [{"id": 3}]]))
+
+    assert json.loads(content) == {"message": "[]", "status": "success", "data": [{"id": 1}, {"id": 2}, {"id": 3}]}
+    assert json.loads(b"".join(stream_json_envelope(envelope, []))) == {
+        "message": "[]",
+        "status": "success",
+        "data": [],
+    }
+
+
+@pytest.mark.django_db
+def test_streaming_list(user_factory):
+    users = user_factory.create_batch(5)
+    view = StreamingUserViewSet.as_view({"get": "list"})
+
+    response = view(APIRequestFactory().get("/", {"stream": "true"}))
+    assert response.streaming
+    assert json.loads(b"".join(response.streaming_content))["data"] == [
+        {"id": user.id, "email": user.email} for user in users
+    ]
+
+    response = view(APIRequestFactory().get("/"))
+    assert not response.streaming
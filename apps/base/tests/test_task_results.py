@@ -0,0 +1,75 @@
+import uuid
+from datetime import timedelta
+
+import pytest
+from celery import states
+from celery.app.task import Context
+from django.utils import timezone
+from django_celery_results.models import TaskResult
+
+from apps.base.result_backends import CacheBackend, DatabaseBackend, prune_task_results
+from apps.base.task_results import COMPACT, EXTENDED, IGNORE, ResultPolicyTask
+from apps.base.tasks import send_template_emails_task
+from apps.users.tasks import get_users_count
+from settings import celery_app
+
+TASK_NAME = get_users_count.name
+
+
+def get_request(task_id: str) -> Context:
+    return Context(
+        id=task_id, task=TASK_NAME, args=[1], kwargs={"a": 1}, argsrepr="[1]", kwargsrepr="{'a': 1}", hostname="w1"
+    )
+
+
+class TestResultPolicies:
+    def test_task_options(self):
+        assert send_template_emails_task.ignore_result
+        assert send_template_emails_task.result_policy == IGNORE
+        assert not get_users_count.ignore_result
+
+        with pytest.raises(ValueError):
+            type("UnknownPolicyTask", (ResultPolicyTask,), {"result_policy": "all"})
+
+    @pytest.mark.django_db
+    @pytest.mark.parametrize("policy", [COMPACT, EXTENDED])
+    def test_database_backend(self, policy: str, settings):
+        settings.TASK_RESULT_POLICY = policy
+        task_id = str(uuid.uuid4())
+
+        DatabaseBackend(app=celery_app).store_result(task_id, 42, states.SUCCESS, request=get_request(task_id))
+
+        task_result = TaskResult.objects.get(task_id=task_id)
+        assert task_result.task_name == TASK_NAME
+        assert task_result.result == "42"
+        if policy == EXTENDED:
+            assert (task_result.task_args, task_result.worker) == ('"[1]"', "w1")
+        else:
+            assert (task_result.task_args, task_result.task_kwargs, task_result.worker) == (None, None, None)
+
+    @pytest.mark.parametrize("policy", [COMPACT, EXTENDED])
+    def test_cache_backend(self, policy: str, settings):
+        settings.TASK_RESULT_POLICY = policy
+        task_id = str(uuid.uuid4())
+        backend = CacheBackend(app=celery_app)
+
+        backend.store_result(task_id, 42, states.SUCCESS, request=get_request(task_id))
+
+        meta = backend.get_task_meta(task_id)
+        assert (meta["result"], meta["name"]) == (42, TASK_NAME)
+        assert ("args" in meta) is (policy == EXTENDED)
+
+
+@pytest.mark.django_db
+def test_prune_task_results():
+    old = timezone.now() - timedelta(days=10)
+    for number in range(5):
+        TaskResult.objects.create(task_id=f"old-{number}", status=states.SUCCESS)
+    TaskResult.objects.update(date_done=old)
+    TaskResult.objects.create(task_id="new", status=states.SUCCESS)
+
+    assert prune_task_results(timedelta(days=7), chunk_size=2) == 5
+    assert list(TaskResult.objects.values_list("task_id", flat=True)) == ["new"]
+
+    DatabaseBackend(app=celery_app).cleanup()
+    assert TaskResult.objects.count() == 1
@@ -0,0 +1,62 @@
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from rest_framework.test import APIRequestFactory
+
+from apps.base.api.throttling import AnonTokenBucketRateThrottle, get_token_bucket_store
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestAnonTokenBucketRateThrottle:
+    @pytest.fixture
+    def timer(self) -> FakeTimer:
+        return FakeTimer()
+
+    @pytest.fixture
+    def throttle_class(self, timer: FakeTimer) -> type[AnonTokenBucketRateThrottle]:
+        cache.clear()
+
+        class Throttle(AnonTokenBucketRateThrottle):
+            scope = "test"
+            rate = "3/minute"
+
+        Throttle.timer = timer
+        return Throttle
+
+    @pytest.fixture
+    def anon_request(self):
+        request = APIRequestFactory().get("/")
+        request.user = AnonymousUser()
+        return request
+
+    def test_bucket_capacity(self, throttle_class, anon_request):
+        assert all(throttle_class().allow_request(anon_request, None) for __ in range(3))
+
+        throttle = throttle_class()
+        assert throttle.allow_request(anon_request, None) is False
+        assert throttle.wait() == pytest.approx(20)
+
+    def test_bucket_refill(self, throttle_class, anon_request, timer: FakeTimer):
+        for __ in range(3):
+            throttle_class().allow_request(anon_request, None)
+        assert throttle_class().allow_request(anon_request, None) is False
+
+        timer.now += 20
+        assert throttle_class().allow_request(anon_request, None) is True
+        assert throttle_class().allow_request(anon_request, None) is False
+
+    def test_authenticated_user_not_throttled(self, throttle_class, user):
+        request = APIRequestFactory().get("/")
+        request.user = user
+
+        assert all(throttle_class().allow_request(request, None) for __ in range(10))
+
+    def test_store_created_once_per_cache(self):
+        assert get_token_bucket_store("default") is get_token_bucket_store("default")
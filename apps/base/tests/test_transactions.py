@@ -0,0 +1,118 @@
+import logging
+
+import pytest
+from django.contrib.auth.models import Group
+from django.db import connection, transaction
+from django.db.transaction import TransactionManagementError
+from django.urls import include, path
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import AllowAny
+from rest_framework.test import APIRequestFactory
+
+from apps.base.api.transactions import (
+    ATOMIC,
+    NONE,
+    READ_ONLY,
+    transaction_policy,
+    transaction_policy_context,
+)
+from apps.base.api.views import ApiGenericViewSet
+from apps.base.checks import check_transaction_policies
+from apps.utils.router import SimpleApiRouter
+
+
+class PolicyViewSet(ApiGenericViewSet):
+    permission_classes = [AllowAny]
+
+    def create(self, request):
+        Group.objects.create(name="created")
+        raise ValidationError("invalid")
+
+    @transaction_policy(NONE)
+    def list(self, request):
+        Group.objects.create(name="first")
+        Group.objects.create(name="second")
+        return self.create_successful_response()
+
+    @transaction_policy(READ_ONLY)
+    @action(methods=["post"], detail=False)
+    def read(self, request):
+        return self.create_successful_response()
+
+
+router = SimpleApiRouter()
+router.register("policies", PolicyViewSet, basename="policy")
+urlpatterns = [path("", include(router.urls))]
+
+
+def test_transaction_policy_of_action():
+    viewset = PolicyViewSet()
+
+    assert viewset.get_transaction_policy("create") == ATOMIC
+    assert viewset.get_transaction_policy("list") == NONE
+    assert viewset.get_transaction_policy("read") == READ_ONLY
+    assert viewset.get_transaction_policy(None) == ATOMIC
+
+    with pytest.raises(ValueError):
+        transaction_policy("serializable")
+
+
+@pytest.mark.django_db
+class TestTransactionPolicy:
+    def test_error_response_rolls_back_atomic_action(self):
+        response = PolicyViewSet.as_view({"post": "create"})(APIRequestFactory().post("/"))
+
+        assert response.status_code == 400
+        assert not Group.objects.exists()
+
+    def test_several_writes_without_transaction_logged(self, settings, caplog):
+        settings.API_TRANSACTION_WRITE_CHECK_STRICT = False
+
+        with caplog.at_level(logging.WARNING, logger="apps.base.api.transactions"):
+            response = PolicyViewSet.as_view({"get": "list"})(APIRequestFactory().get("/"))
+
+        assert response.status_code == 200
+        assert Group.objects.count() == 2
+        assert "PolicyViewSet.list without transaction issued several writes" in caplog.text
+
+    def test_several_writes_without_transaction_rejected_in_strict_mode(self):
+        with pytest.raises(TransactionManagementError):
+            with transaction_policy_context(NONE, "import"):
+                Group.objects.create(name="first")
+                Group.objects.create(name="second")
+
+    def test_writes_in_own_transaction_not_counted(self, caplog):
+        with caplog.at_level(logging.WARNING, logger="apps.base.api.transactions"):
+            with transaction_policy_context(NONE, "import"):
+                Group.objects.create(name="single")
+                with transaction.atomic():
+                    Group.objects.create(name="first")
+                    Group.objects.create(name="second")
+
+        assert not caplog.text
+
+    def test_write_in_read_only_action_rejected(self):
+        with pytest.raises(TransactionManagementError):
+            with transaction_policy_context(READ_ONLY, "read"):
+                Group.objects.create(name="created")
+
+    def test_write_check_off(self, settings):
+        settings.API_TRANSACTION_WRITE_CHECK = False
+
+        with transaction_policy_context(READ_ONLY, "read") as in_transaction:
+            assert in_transaction
+            Group.objects.create(name="created")
+
+        with transaction_policy_context(ATOMIC, "create"):
+            assert connection.in_atomic_block
+
+
+@pytest.mark.urls(__name__)
+def test_check_transaction_policies(monkeypatch):
+    errors = check_transaction_policies(None)
+    assert [error.id for error in errors] == ["base.W001"]
+    assert "PolicyViewSet.read handles POST requests in read only transaction" in errors[0].msg
+
+    monkeypatch.setattr(PolicyViewSet, "transaction_policy", "serializable")
+    assert "base.E001" in [error.id for error in check_transaction_policies(None)]
@@ -1,5 +1,4 @@
-from dataclasses import asdict
-
+from django.conf import settings
 from drf_standardized_errors.formatter import ExceptionFormatter
 from drf_standardized_errors.settings import package_settings
 from drf_standardized_errors.types import ErrorType
@@ -26,16 +25,23 @@ class ApiResponseExceptionFormatter(ExceptionFormatter):
         Account for validation errors in nested serializers by returning a list
         of errors instead of a nested dict
         """
-        return flatten_errors(self.exc.detail)
+        return flatten_errors(self.exc.detail, max_errors=settings.API_MAX_ERRORS)
 
-    def format_error_response(self, error_response: ErrorResponse):
-        return asdict(error_response)
+    def format_error_response(self, error_response: ErrorResponse) -> ErrorResponse:
+        """Error response is rendered as is, renderer serializes dataclasses without deep copy by asdict()"""
+        return error_response
 
 
-def flatten_errors(detail: list | dict | exceptions.ErrorDetail, attr=None, index=None) -> list[ErrorField]:
+def flatten_errors(
+    detail: list | dict | exceptions.ErrorDetail, attr=None, index=None, max_errors: int | None = None
+) -> list[ErrorField]:
     """The code and flow was taken from https://github.com/ghazi-git/drf-standardized-errors
     but for the project needed only flatten_errors function. Just to reduce dependencies and size of project
 
+    Errors tree is walked with explicit stack instead of recursion, so big bulk payloads
+    do not hit recursion limit and flattening is linear in number of errors.
+    With max_errors set, walk stops after max_errors errors were collected.
+
     Examples:
         convert this:
         {
@@ -71,24 +77,41 @@ def flatten_errors(detail: list | dict | exceptions.ErrorDetail, attr=None, inde
         }
     """
 
-    if not detail:
-        return []
-
-    elif isinstance(detail, list):
-        first_item, *rest = detail
-        if not isinstance(first_item, exceptions.ErrorDetail):
-            index = 0 if index is None else index + 1
-            if attr:
-                new_attr = f"{attr}{package_settings.NESTED_FIELD_SEPARATOR}{index}"
-            else:
-                new_attr = str(index)
-            return flatten_errors(first_item, new_attr, index) + flatten_errors(rest, attr, index)
+    errors = []
+    # Stack of (detail, attr, index) in reverse order, so errors keep the same order as in recursive walk
+    stack = [(detail, attr, index)]
+
+    while stack:
+        if max_errors is not None and len(errors) >= max_errors:
+            break
+
+        detail, attr, index = stack.pop()
+
+        if not detail:
+            continue
+
+        elif isinstance(detail, list):
+            children = []
+            for item in detail:
+                if not isinstance(item, exceptions.ErrorDetail):
+                    index = 0 if index is None else index + 1
+                    if attr:
+                        children.append((item, f"{attr}{package_settings.NESTED_FIELD_SEPARATOR}{index}", index))
+                    else:
+                        children.append((item, str(index), index))
+                else:
+                    children.append((item, attr, index))
+            stack.extend(reversed(children))
+
+        elif isinstance(detail, dict):
+            children = []
+            for key, value in detail.items():
+                if attr:
+                    key = f"{attr}{package_settings.NESTED_FIELD_SEPARATOR}{key}"
+                children.append((value, key, None))
+            stack.extend(reversed(children))
+
         else:
-            return flatten_errors(first_item, attr, index) + flatten_errors(rest, attr, index)
-    elif isinstance(detail, dict):
-        (key, value), *rest = list(detail.items())
-        if attr:
-            key = f"{attr}{package_settings.NESTED_FIELD_SEPARATOR}{key}"
-        return flatten_errors(value, key) + flatten_errors(dict(rest), attr)
-    else:
-        return [ErrorField(code=detail.code, message=str(detail), field=attr)]
+            errors.append(ErrorField(code=detail.code, message=str(detail), field=attr))
+
+    return errors
@@ -0,0 +1,44 @@
+from drf_standardized_errors.formatter import flatten_errors as recursive_flatten_errors
+from rest_framework.exceptions import ErrorDetail
+
+from apps.core.exception_handler import flatten_errors
+
+
+def make_detail(message: str, code: str = "invalid") -> ErrorDetail:
+    return ErrorDetail(message, code=code)
+
+
+ERRORS_TREE = {
+    "password": [
+        make_detail("This password is too short.", "password_too_short"),
+        make_detail("The password is too similar to the username.", "password_too_similar"),
+    ],
+    "linked_accounts": [
+        {},
+        {"email": [make_detail("Enter a valid email address.")]},
+        {"phones": {0: [make_detail("Invalid phone.")], 2: [make_detail("Invalid phone.")]}},
+    ],
+    "tags": [[make_detail("Nested list error.")], [], [make_detail("Second nested list error.")]],
+    "non_field_errors": [make_detail("Fields does not match.", "password_mismatch")],
+}
+
+
+class TestFlattenErrors:
+    def test_same_output_as_recursive_flatten(self):
+        expected = [(error.code, error.detail, error.attr) for error in recursive_flatten_errors(ERRORS_TREE)]
+        result = [(error.code, error.message, error.field) for error in flatten_errors(ERRORS_TREE)]
+
+        assert result == expected
+
+    def test_max_errors(self):
+        errors = flatten_errors(ERRORS_TREE, max_errors=3)
+
+        assert [error.field for error in errors] == ["password", "password", "linked_accounts.1.email"]
+
+    def test_big_payload(self):
+        detail = [{"email": [make_detail("Enter a valid email address.")]} for __ in range(20_000)]
+
+        errors = flatten_errors(detail)
+
+        assert len(errors) == 20_000
+        assert errors[-1].field == "19999.email"
@@ -9,6 +9,7 @@ class JwtAPIClient(APIClient):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self.refresh_token = None
 
     def jwt_login(self, email: str, password: str):
         """Helper function for login in system for tests
@@ -25,13 +26,16 @@ class JwtAPIClient(APIClient):
             return response
 
         self.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access']}")
+        self.refresh_token = response.data["refresh"]
         return response
 
-    def jwt_logout(self) -> None:
-        """Helper method. Call logout url in system
+    def jwt_logout(self):
+        """Helper method. Call logout url in system, access and refresh tokens of login are revoked
 
         Returns:
-            None
+            Response: response of logout
         """
-        self.get(self.logout_action)
+        response = self.post(self.logout_action, data={"refresh": self.refresh_token} if self.refresh_token else {})
         super().logout()
+        self.credentials()
+        return response
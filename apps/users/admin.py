@@ -3,13 +3,15 @@ from django.contrib.auth import admin as auth_admin
 from django.contrib.auth import get_user_model
 from django.utils.translation import gettext_lazy as _
 
+from apps.base.admin import TrigramSearchMixin
+from apps.base.paginator import EstimatedCountPaginator
 from apps.users.forms import UserAdminChangeForm, UserAdminCreationForm
 
 User = get_user_model()
 
 
 @admin.register(User)
-class UserAdmin(auth_admin.UserAdmin):
+class UserAdmin(TrigramSearchMixin, auth_admin.UserAdmin):
     form = UserAdminChangeForm
     add_form = UserAdminCreationForm
     fieldsets = (
@@ -30,8 +32,12 @@ class UserAdmin(auth_admin.UserAdmin):
         (_("Important dates"), {"fields": ("last_login", "date_joined")}),
     )
     list_display = ["email", "name", "is_superuser"]
-    search_fields = ["name"]
+    # Searched by trigram indexes of users table
+    search_fields = ["name", "email"]
     ordering = ["id"]
+    # Users table is not counted on every page view
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     add_fieldsets = (
         (
             None,
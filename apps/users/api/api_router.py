@@ -1,5 +1,6 @@
 from django.conf import settings
 
+from apps.users.api.async_views import AsyncUserViewSet
 from apps.users.api.views import UserViewSet
 from apps.utils.router import DefaultApiRouter, SimpleApiRouter
 
@@ -10,4 +11,4 @@ else:
 
 URL_VERSION = r"^(?P<version>v[1])"
 
-router.register("v1/users", UserViewSet)
+router.register("v1/users", AsyncUserViewSet if settings.API_ASYNC_VIEWS else UserViewSet, basename="user")
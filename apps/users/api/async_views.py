@@ -0,0 +1,120 @@
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.contrib.auth.tokens import default_token_generator
+from django.http import Http404
+from django.utils.translation import gettext_lazy as _
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from apps.base.api.async_views import AsyncApiViewMixin, async_action
+from apps.users.api.services import asend_forget_password_email, asend_verification_email_after_registration
+from apps.users.api.views import UserViewSet
+from apps.utils import passwords
+
+User = get_user_model()
+
+
+class AsyncUserViewSet(AsyncApiViewMixin, UserViewSet):
+    """Async version of UserViewSet for ASGI server, enabled by settings.API_ASYNC_VIEWS.
+
+    Sync actions (list, import) run in thread in transaction by their policies.
+    Users are loaded and saved with async ORM, passwords are hashed in password hashing pool
+    and emails are delivered without blocking event loop. Serializer validation that may use sync ORM
+    (unique email, current password check) runs in thread.
+    """
+
+    @async_action(UserViewSet.ping)
+    async def ping(self, request):
+        return Response(data="pong")
+
+    @staticmethod
+    async def aget_user_by_token_and_uid(uid64: str, token: str) -> User:
+        """Async version of get_user_by_token_and_uid()
+
+        Raises:
+            ValidationError: in case if no such user found in db or not valid token
+        """
+        try:
+            user = await User.objects.aget_by_uid(uid64)
+        except (User.DoesNotExist, ValueError, UnicodeDecodeError):
+            raise ValidationError(_("Verify token is invalid"))
+
+        if not default_token_generator.check_token(user, token):
+            raise ValidationError(_("Verify token is invalid"))
+
+        return user
+
+    async def avalidate_serializer(self, *args, **kwargs):
+        serializer = self.get_serializer(*args, **kwargs)
+        await sync_to_async(serializer.is_valid)(raise_exception=True)
+        return serializer
+
+    @async_action(UserViewSet.register)
+    async def register(self, request):
+        serializer = await self.avalidate_serializer(data=request.data)
+        validated_data = serializer.validated_data
+
+        user = User(email=User.objects.normalize_email(validated_data["email"]))
+        user.password = await passwords.amake_password(validated_data["password"])
+
+        def insert_user():
+            with serializer.unique_email_insert():
+                user.save()
+
+        await sync_to_async(insert_user)()
+        await asend_verification_email_after_registration(user, request=request)
+
+        serializer.instance = user
+        return self.create_successful_response(
+            data=serializer.data, status_code=status.HTTP_201_CREATED, message_code="user_registered"
+        )
+
+    @async_action(UserViewSet.verify)
+    async def verify(self, request, uid64, token):
+        user = await self.aget_user_by_token_and_uid(uid64, token)
+        user.is_verified = True
+        await user.asave()
+
+        return self.create_successful_response(status_code=status.HTTP_200_OK, message_code="verification_successful")
+
+    async def aget_object(self):
+        """Async version of UserViewSet.get_object()"""
+        if self.lookup_field != "email":
+            return await super().aget_object()
+
+        queryset = self.filter_queryset(self.get_queryset())
+        try:
+            user = await queryset.filter_by_email(self.kwargs[self.lookup_url_kwarg or self.lookup_field]).aget()
+        except User.DoesNotExist:
+            raise Http404
+
+        self.check_object_permissions(self.request, user)
+        return user
+
+    @async_action(UserViewSet.forget_password)
+    async def forget_password(self, request, email):
+        user = await self.aget_object()
+        await asend_forget_password_email(user, request)
+        return self.create_successful_response(
+            status_code=status.HTTP_200_OK, message_code="password_change_link_send"
+        )
+
+    async def asave_password(self, user: User, password: str):
+        user.password = await passwords.amake_password(password)
+        await user.asave()
+
+    @async_action(UserViewSet.set_new_password)
+    async def set_new_password(self, request, uid64, token):
+        user = await self.aget_user_by_token_and_uid(uid64, token)
+        serializer = await self.avalidate_serializer(instance=user, data=request.data)
+        await self.asave_password(user, serializer.validated_data["password"])
+        return self.create_successful_response(status_code=status.HTTP_200_OK, message_code="new_password_set")
+
+    @async_action(UserViewSet.change_password)
+    async def change_password(self, request):
+        serializer = await self.avalidate_serializer(instance=request.user, data=request.data)
+        await self.asave_password(request.user, serializer.validated_data["password"])
+        return self.create_successful_response(
+            status_code=status.HTTP_200_OK, message_code="password_change_successful"
+        )
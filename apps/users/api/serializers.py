@@ -1,8 +1,11 @@
+from contextlib import contextmanager, nullcontext
+
 from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
-from rest_framework.validators import UniqueValidator
 
+from apps.base.api.serializers import DynamicFieldModelSerializer
 from apps.base.serializers.fields import CurrentUserPasswordField, PasswordField
 from apps.users.api.services import send_verification_email_after_registration
 from apps.users.api.validators import FieldMatchValidator
@@ -28,18 +31,52 @@ class PasswordMatchMixin(metaclass=serializers.SerializerMetaclass):
         validators = [FieldMatchValidator("password", "password2", error_code="password_mismatch")]
 
 
+class UserListSerializer(DynamicFieldModelSerializer):
+    cache_selected_fields_classes = True
+    compiled_read = True
+
+    class Meta:
+        model = User
+        fields = ["id", "email", "name", "is_verified", "is_active", "date_joined"]
+
+
 class RegisterUserSerializer(PasswordMatchMixin, serializers.ModelSerializer):
+    """Email is not checked for uniqueness before insert: user is inserted at once and insert
+    into unique index of email fails for registered email, in any case. It's one query instead of two
+    and concurrent registrations of the same email can't both pass the check.
+    """
+
     email = serializers.EmailField(
-        validators=[UniqueValidator(queryset=User.objects.all(), message=_("This email already registered"))],
         max_length=256,
         required=True,
         allow_null=False,
     )
 
+    # Unique index of email field and case insensitive unique index of email
+    email_unique_constraints = frozenset(["users_user_email_key", "users_user_email_lower_uniq"])
+
+    @classmethod
+    @contextmanager
+    def unique_email_insert(cls):
+        """Insert of user with registered email raises validation error of email field,
+        other integrity errors are raised as is
+        """
+        # Failed insert in outer transaction is rolled back to savepoint, outer transaction stays usable
+        in_transaction = transaction.get_connection().in_atomic_block
+        try:
+            with transaction.atomic() if in_transaction else nullcontext():
+                yield
+        except IntegrityError as error:
+            diag = getattr(error.__cause__, "diag", None)
+            if getattr(diag, "constraint_name", None) not in cls.email_unique_constraints:
+                raise
+            raise serializers.ValidationError({"email": [_("This email already registered")]}, code="unique")
+
     def create(self, validated_data):
         del validated_data["password2"]
 
-        user = User.objects.create_user(**validated_data)
+        with self.unique_email_insert():
+            user = User.objects.create_user(**validated_data)
         send_verification_email_after_registration(user, request=self.context["request"])
         return user
 
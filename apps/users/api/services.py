@@ -1,3 +1,5 @@
+from collections.abc import Callable, Iterable
+
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.tokens import default_token_generator
@@ -6,7 +8,7 @@ from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_encode
 from rest_framework.request import Request
 
-from apps.utils.email import send_from_template_email
+from apps.utils.email import adeliver_template_emails, deliver_template_emails
 
 User = get_user_model()
 
@@ -36,6 +38,41 @@ def generate_uid_and_token_from_user(user: User) -> dict:
     }
 
 
+def build_verify_email(
+    email_template_html: str,
+    email_template_subject: str,
+    view_action: str,
+    user: User,
+    build_absolute_uri: Callable[[str], str],
+) -> dict:
+    """Build key arguments of template email with verification link for user
+
+    Args:
+        email_template_html (str): template for email body
+        email_template_subject (str): template for email subject
+        view_action (str): name of url for verification link
+        user (User): recipient
+        build_absolute_uri (Callable): converts path of verification link to absolute url
+
+    Returns:
+        dict: key arguments for render_template_email
+    """
+    action_params = generate_uid_and_token_from_user(user)
+    verification_link = reverse(view_action, kwargs=action_params)
+    user_email = getattr(user, User.get_email_field_name())
+
+    return {
+        "subject_template_name": email_template_subject,
+        "email_template_name": email_template_html,
+        "context": {
+            "verification_absolute_url": build_absolute_uri(verification_link),
+            "domain": settings.PROJECT_NAME,
+        },
+        "from_email": settings.WEBSITE_EMAIL,
+        "to_email": user_email,
+    }
+
+
 def send_verify_email(
     email_template_html: str, email_template_subject: str, view_action: str, user: User, request: Request
 ) -> None:
@@ -51,20 +88,40 @@ def send_verify_email(
     Returns:
 
     """
+    email = build_verify_email(
+        email_template_html, email_template_subject, view_action, user, build_absolute_uri=request.build_absolute_uri
+    )
+    deliver_template_emails([email])
 
-    action_params = generate_uid_and_token_from_user(user)
-    verification_link = reverse(view_action, kwargs=action_params)
-    full_url_verification_url = request.build_absolute_uri(verification_link)
-    user_email = getattr(user, User.get_email_field_name())
 
-    template_email_context = {"verification_absolute_url": full_url_verification_url, "domain": settings.PROJECT_NAME}
+async def asend_verify_email(
+    email_template_html: str, email_template_subject: str, view_action: str, user: User, request: Request
+) -> None:
+    """Async version of send_verify_email()"""
+    email = build_verify_email(
+        email_template_html, email_template_subject, view_action, user, build_absolute_uri=request.build_absolute_uri
+    )
+    await adeliver_template_emails([email])
 
-    send_from_template_email(
-        subject_template_name=email_template_subject,
-        email_template_name=email_template_html,
-        context=template_email_context,
-        from_email=settings.WEBSITE_EMAIL,
-        to_email=user_email,
+
+def send_verification_emails(users: Iterable[User], build_absolute_uri: Callable[[str], str]) -> None:
+    """Deliver verification emails to many users at once, emails are queued in batches
+
+    Args:
+        users (Iterable[User]): registered users
+        build_absolute_uri (Callable): converts path of verification link to absolute url
+    """
+    deliver_template_emails(
+        [
+            build_verify_email(
+                view_action=EMAIL_VERIFICATION_ACTION,
+                email_template_html=EMAIL_VERIFICATION_TEMPLATE,
+                email_template_subject=EMAIL_VERIFICATION_SUBJECT,
+                user=user,
+                build_absolute_uri=build_absolute_uri,
+            )
+            for user in users
+        ]
     )
 
 
@@ -104,3 +161,23 @@ def send_forget_password_email(user: User, request: Request) -> None:
         user=user,
         request=request,
     )
+
+
+async def asend_verification_email_after_registration(user: User, request: Request) -> None:
+    return await asend_verify_email(
+        view_action=EMAIL_VERIFICATION_ACTION,
+        email_template_html=EMAIL_VERIFICATION_TEMPLATE,
+        email_template_subject=EMAIL_VERIFICATION_SUBJECT,
+        user=user,
+        request=request,
+    )
+
+
+async def asend_forget_password_email(user: User, request: Request) -> None:
+    return await asend_verify_email(
+        view_action=EMAIL_RESET_PASSWORD_ACTION,
+        email_template_html=EMAIL_RESET_PASSWORD_TEMPLATE,
+        email_template_subject=EMAIL_RESET_PASSWORD_SUBJECT,
+        user=user,
+        request=request,
+    )
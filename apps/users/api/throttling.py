@@ -1,5 +1,6 @@
-from rest_framework.throttling import AnonRateThrottle
+from apps.base.api.throttling import AnonTokenBucketRateThrottle
 
 
-class EmailVerifyAndPasswordResetRateThrottle(AnonRateThrottle):
+class EmailVerifyAndPasswordResetRateThrottle(AnonTokenBucketRateThrottle):
+    scope = "email_verify_and_password_reset"
     rate = "5/minute"
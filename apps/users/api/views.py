@@ -1,27 +1,44 @@
 from django.contrib.auth import get_user_model
 from django.contrib.auth.tokens import default_token_generator
+from django.shortcuts import get_object_or_404
 from django.utils.translation import gettext_lazy as _
 from rest_framework import status
 from rest_framework.decorators import action
-from rest_framework.exceptions import ValidationError
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.exceptions import UnsupportedMediaType, ValidationError
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 
-from apps.base.api.views import ApiGenericViewSet
+from apps.base.api.cache import cache_response
+from apps.base.api.filters import JsonSelectFilter
+from apps.base.api.pagination import KeysetPagination
+from apps.base.api.transactions import NONE, READ_ONLY, transaction_policy
+from apps.base.api.views import ApiGenericViewSet, DynamicFieldApiViewMixin
 from apps.core.constants import HttpMethods
-from apps.users.api.serializers import ChangeCurrentPasswordSerializer, RegisterUserSerializer, ResetPasswordSerializer
+from apps.users.api.serializers import (
+    ChangeCurrentPasswordSerializer,
+    RegisterUserSerializer,
+    ResetPasswordSerializer,
+    UserListSerializer,
+)
 from apps.users.api.services import send_forget_password_email
 from apps.users.api.throttling import EmailVerifyAndPasswordResetRateThrottle
+from apps.users.importer import CSV, NDJSON, UserImporter, iter_import_rows
 
 User = get_user_model()
 
 
-class UserViewSet(ApiGenericViewSet):
+class UserViewSet(DynamicFieldApiViewMixin, ApiGenericViewSet):
     """User view set that represents common actions for basic user actions.
     Like: registration, verification, and password reset
     """
 
     queryset = User.objects.all()
+    serializer_class = UserListSerializer
+    filter_backends = [JsonSelectFilter]
+    pagination_class = KeysetPagination
+    keyset_ordering = ("date_joined", "id")
+    conditional_list = True
+    streaming_list = True
 
     messages = {
         "verification_successful": _("Email successful verified"),
@@ -29,8 +46,45 @@ class UserViewSet(ApiGenericViewSet):
         "password_change_link_send": _("Reset link was send to user email"),
         "new_password_set": _("New password set successful"),
         "user_registered": _("User registered. Please verify user through email"),
+        "users_imported": _("Users imported"),
     }
+    # Content types of import_users request body
+    import_formats = {
+        "application/x-ndjson": NDJSON,
+        "application/jsonl": NDJSON,
+        "text/csv": CSV,
+    }
+
+    def get_permissions(self):
+        if self.action == "list":
+            return [IsAdminUser()]
+        return super().get_permissions()
+
+    def get_object(self):
+        """User by email in any case for actions with email lookup, see UserQuerySet.filter_by_email()"""
+        if self.lookup_field != "email":
+            return super().get_object()
+
+        queryset = self.filter_queryset(self.get_queryset())
+        user = get_object_or_404(queryset.filter_by_email(self.kwargs[self.lookup_url_kwarg or self.lookup_field]))
+        self.check_object_permissions(self.request, user)
+        return user
+
+    @cache_response(timeout=300)
+    @transaction_policy(READ_ONLY)
+    def list(self, request):
+        """List of users for admins. Supports selection of fields and keyset pagination.
+        With `?stream=true` all users are streamed without pagination.
 
+        Args:
+            request (Request): Django request object
+
+        Returns:
+            Response: Django Response object
+        """
+        return self.create_list_response()
+
+    @transaction_policy(NONE)
     @action(methods=[HttpMethods.GET], detail=False)
     def ping(self, request):
         return Response(data="pong")
@@ -76,6 +130,7 @@ class UserViewSet(ApiGenericViewSet):
         serializer.save()
         return serializer
 
+    @transaction_policy(NONE)
     @action(methods=[HttpMethods.POST], detail=False, serializer_class=RegisterUserSerializer)
     def register(self, request):
         """Register a new user for the system
@@ -91,6 +146,33 @@ class UserViewSet(ApiGenericViewSet):
             data=serializer.data, status_code=status.HTTP_201_CREATED, message_code="user_registered"
         )
 
+    @transaction_policy(NONE)
+    @action(methods=[HttpMethods.POST], detail=False, permission_classes=[IsAdminUser], url_path="import")
+    def import_users(self, request):
+        """Bulk registration of users for admins.
+        Body is NDJSON or CSV with email, password and name columns, it is read line by line while importing.
+        New users get verification emails, already registered emails are skipped.
+
+        Args:
+            request (Request): Django request object
+
+        Raises:
+            UnsupportedMediaType: if content type is not NDJSON or CSV
+
+        Returns:
+            Response: numbers of created, skipped and invalid rows
+        """
+        media_type = request.content_type.split(";")[0].strip()
+        file_format = self.import_formats.get(media_type)
+        if file_format is None:
+            raise UnsupportedMediaType(media_type)
+
+        # Passwords are hashed in shared hashing pool, own process pool would fork web worker
+        importer = UserImporter(build_absolute_uri=request.build_absolute_uri, shared_pool=True)
+        result = importer.run(iter_import_rows(request.stream or [], file_format))
+        return self.create_successful_response(data=result, message_code="users_imported")
+
+    @transaction_policy(NONE)
     @action(methods=[HttpMethods.GET], detail=False, url_path=r"verify/(?P<uid64>[0-9A-Za-z]+)-(?P<token>.+)")
     def verify(self, request, uid64, token):
         """Method verify user email. Verification url send on registration phase, on user email.
@@ -109,6 +191,7 @@ class UserViewSet(ApiGenericViewSet):
 
         return self.create_successful_response(status_code=status.HTTP_200_OK, message_code="verification_successful")
 
+    @transaction_policy(NONE)
     @action(
         methods=[HttpMethods.GET],
         detail=False,
@@ -119,6 +202,7 @@ class UserViewSet(ApiGenericViewSet):
     def resend_verify(self, request):
         pass
 
+    @transaction_policy(NONE)
     @action(
         methods=[HttpMethods.GET],
         detail=False,
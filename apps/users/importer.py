@@ -0,0 +1,222 @@
+import csv
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+
+import orjson
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import transaction
+from django.utils import timezone
+
+from apps.base.api.cache import invalidate_model_responses
+from apps.base.api.streaming import iter_chunks
+from apps.users.api.services import send_verification_emails
+from apps.utils.passwords import get_hashing_executor
+
+User = get_user_model()
+
+NDJSON = "ndjson"
+CSV = "csv"
+IMPORT_FORMATS = (NDJSON, CSV)
+# Columns of import file, only email is required
+IMPORT_FIELDS = ("email", "password", "name")
+NAME_MAX_LENGTH = User._meta.get_field("name").max_length
+
+
+@dataclass
+class UserImportResult:
+    created: int = 0
+    # Users which email is already registered or repeated in import
+    skipped: int = 0
+    invalid: int = 0
+    # Errors of first invalid rows, like {"line": 3, "errors": {"email": "Enter a valid email address."}}
+    errors: list[dict] = field(default_factory=list)
+
+
+def iter_lines(lines: Iterable[bytes | str]) -> Iterator[str]:
+    for line in lines:
+        yield line.decode() if isinstance(line, bytes) else line
+
+
+def iter_import_rows(lines: Iterable[bytes | str], file_format: str) -> Iterator[tuple[int, dict | None]]:
+    """Read rows of import file line by line, whole file is never loaded in memory
+
+    Args:
+        lines (Iterable[bytes|str]): lines of NDJSON or CSV file, CSV has header row
+        file_format (str): "ndjson" or "csv"
+
+    Yields:
+        tuple[int, dict|None]: line number and row, None if line can't be parsed
+    """
+    if file_format == CSV:
+        reader = csv.DictReader(iter_lines(lines))
+        for row in reader:
+            yield reader.line_num, row
+        return
+
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            row = None
+        yield line_number, row if isinstance(row, dict) else None
+
+
+def clean_import_row(row: dict | None) -> tuple[dict, dict]:
+    """Validate row of import file
+
+    Returns:
+        tuple[dict, dict]: cleaned data and errors by field
+    """
+    if row is None:
+        return {}, {"non_field_errors": "Row is not a valid object."}
+
+    data, errors = {}, {}
+    for name in IMPORT_FIELDS:
+        value = row.get(name)
+        if value is not None and not isinstance(value, str):
+            errors[name] = "Not a valid string."
+        data[name] = value or ""
+
+    email = User.objects.normalize_email(data["email"].strip())
+    try:
+        validate_email(email)
+    except ValidationError as error:
+        errors.setdefault("email", error.messages[0])
+    data["email"] = email
+
+    if len(data["name"]) > NAME_MAX_LENGTH:
+        errors.setdefault("name", f"Ensure this field has no more than {NAME_MAX_LENGTH} characters.")
+
+    return data, errors
+
+
+class UserImporter:
+    """Bulk import of users.
+
+    Rows are processed in batches: passwords of batch are hashed in parallel by process pool,
+    users are inserted by one bulk_create() and verification emails of batch are queued together.
+    Emails that are already registered in any case are skipped, conflicts with concurrent registrations are resolved
+    by database with ON CONFLICT DO NOTHING. Password validators are not applied to imported passwords,
+    rows without password get unusable password.
+
+    Examples:
+        with open("users.ndjson", "rb") as file:
+            result = UserImporter().run(iter_import_rows(file, "ndjson"))
+    """
+
+    max_errors = 100
+
+    def __init__(
+        self,
+        batch_size: int | None = None,
+        workers: int | None = None,
+        build_absolute_uri: Callable[[str], str] | None = None,
+        shared_pool: bool = False,
+    ):
+        """
+        Args:
+            batch_size (int|None): users in one insert, settings.USER_IMPORT_BATCH_SIZE by default
+            workers (int|None): processes of own pool for password hashing, settings.USER_IMPORT_WORKERS by default
+            build_absolute_uri (Callable|None): builds absolute verification url, None - do not send emails
+            shared_pool (bool): hash passwords in password hashing pool of process (apps.utils.passwords)
+                instead of own pool. Use it in web workers: own pool forks server process with its threads
+                and database connections
+        """
+        self.batch_size = batch_size or settings.USER_IMPORT_BATCH_SIZE
+        self.shared_pool = shared_pool
+        if shared_pool:
+            self.workers = settings.PASSWORD_HASHING_WORKERS
+        else:
+            self.workers = settings.USER_IMPORT_WORKERS if workers is None else workers
+        self.build_absolute_uri = build_absolute_uri
+        self.result = UserImportResult()
+
+    def get_executor(self) -> Executor | nullcontext:
+        if self.shared_pool:
+            # Shared pool is not shut down after import
+            return nullcontext(get_hashing_executor())
+        if self.workers > 0:
+            return ProcessPoolExecutor(max_workers=self.workers)
+        return nullcontext()
+
+    def hash_passwords(self, passwords: list[str], executor: Executor | None) -> list[str]:
+        # Empty password is stored as unusable, like for create_user(password=None)
+        passwords = [password or None for password in passwords]
+        if executor is None:
+            return [make_password(password) for password in passwords]
+
+        chunksize = max(1, len(passwords) // (self.workers * 4))
+        return list(executor.map(make_password, passwords, chunksize=chunksize))
+
+    def add_error(self, line_number: int, errors: dict):
+        self.result.invalid += 1
+        if len(self.result.errors) < self.max_errors:
+            self.result.errors.append({"line": line_number, "errors": errors})
+
+    def import_batch(self, rows: list[tuple[int, dict | None]], executor: Executor | None):
+        new_users = {}
+        for line_number, row in rows:
+            data, errors = clean_import_row(row)
+            if errors:
+                self.add_error(line_number, errors)
+            elif data["email"].lower() in new_users:
+                self.result.skipped += 1
+            else:
+                new_users[data["email"].lower()] = data
+
+        # Emails are unique in any case, new users are keyed by lowercase email
+        registered = {
+            email.lower() for email in User.objects.filter_by_emails(new_users).values_list("email", flat=True)
+        }
+        for email in registered:
+            del new_users[email]
+        self.result.skipped += len(registered)
+
+        if not new_users:
+            return
+
+        passwords = self.hash_passwords([data["password"] for data in new_users.values()], executor)
+        # Users of batch have the same join time, it finds inserted users among concurrently registered
+        date_joined = timezone.now()
+        users = [
+            User(email=data["email"], name=data["name"], password=password, date_joined=date_joined)
+            for data, password in zip(new_users.values(), passwords)
+        ]
+
+        with transaction.atomic():
+            User.objects.bulk_create(users, batch_size=len(users), ignore_conflicts=True)
+            inserted = User.objects.filter_by_emails(new_users).filter(date_joined=date_joined)
+
+            if self.build_absolute_uri is None:
+                created = inserted.count()
+            else:
+                # Fields of verification token
+                inserted = list(inserted.only("id", "email", "password", "last_login"))
+                send_verification_emails(inserted, self.build_absolute_uri)
+                created = len(inserted)
+
+        self.result.created += created
+        self.result.skipped += len(users) - created
+
+    def run(self, rows: Iterable[tuple[int, dict | None]]) -> UserImportResult:
+        """Import rows, see iter_import_rows()
+
+        Returns:
+            UserImportResult: numbers of created, skipped and invalid rows
+        """
+        with self.get_executor() as executor:
+            for batch in iter_chunks(rows, self.batch_size):
+                self.import_batch(batch, executor)
+
+        if self.result.created:
+            # bulk_create() does not send post_save signals
+            invalidate_model_responses(User._meta.label_lower)
+        return self.result
@@ -0,0 +1,46 @@
+import sys
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.users.importer import CSV, IMPORT_FORMATS, NDJSON, UserImporter, iter_import_rows
+
+
+class Command(BaseCommand):
+    help = "Import users from NDJSON or CSV file with email, password and name columns"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help='Path to import file, "-" to read from stdin')
+        parser.add_argument("--format", choices=IMPORT_FORMATS, help="Format of file, by default from file extension")
+        parser.add_argument("--batch-size", type=int, help="Users inserted by one query")
+        parser.add_argument("--workers", type=int, help="Processes for password hashing, 0 - no process pool")
+        parser.add_argument(
+            "--base-url",
+            help="Base url of site, like https://example.com. If set, verification emails are sent to new users",
+        )
+
+    def handle(self, *args, path: str, **options):
+        file_format = options["format"] or (CSV if path.endswith(".csv") else NDJSON)
+
+        base_url = options["base_url"]
+        build_absolute_uri = (lambda location: base_url.rstrip("/") + location) if base_url else None
+        importer = UserImporter(
+            batch_size=options["batch_size"], workers=options["workers"], build_absolute_uri=build_absolute_uri
+        )
+
+        if path == "-":
+            result = importer.run(iter_import_rows(sys.stdin, file_format))
+        else:
+            try:
+                file = Path(path).open(newline="", encoding="utf-8")
+            except OSError as error:
+                raise CommandError(f"Can't open import file: {error}")
+            with file:
+                result = importer.run(iter_import_rows(file, file_format))
+
+        for error in result.errors:
+            self.stderr.write(f"Line {error['line']}: {error['errors']}")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Created: {result.created}, skipped: {result.skipped}, invalid: {result.invalid}")
+        )
@@ -0,0 +1,43 @@
+from datetime import timedelta
+from pathlib import Path
+
+import orjson
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.users.purge import get_unverified_users, purge_unverified_users
+
+
+class Command(BaseCommand):
+    help = "Delete users that did not verify email, in chunks with short transactions"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, help="Age of unverified users in days, by default from settings")
+        parser.add_argument("--chunk-size", type=int, help="Users deleted in one transaction")
+        parser.add_argument(
+            "--archive", help="Append deleted users to NDJSON file, it can be imported back by import_users command"
+        )
+        parser.add_argument("--dry-run", action="store_true", help="Only count users that would be deleted")
+
+    def handle(self, *args, **options):
+        older_than = timedelta(days=options["days"]) if options["days"] is not None else None
+
+        if options["dry_run"]:
+            count = get_unverified_users(older_than).count()
+            self.stdout.write(f"Unverified users to delete: {count}")
+            return
+
+        if not options["archive"]:
+            deleted = purge_unverified_users(older_than, options["chunk_size"])
+        else:
+            try:
+                file = Path(options["archive"]).open("ab")
+            except OSError as error:
+                raise CommandError(f"Can't open archive file: {error}")
+
+            def archive(users: list[dict]):
+                file.writelines(orjson.dumps(user, option=orjson.OPT_APPEND_NEWLINE) for user in users)
+
+            with file:
+                deleted = purge_unverified_users(older_than, options["chunk_size"], archive=archive)
+
+        self.stdout.write(self.style.SUCCESS(f"Deleted unverified users: {deleted}"))
@@ -1,14 +1,30 @@
-from django.contrib.auth.hashers import make_password
+from collections.abc import Iterable
+
 from django.contrib.auth.models import UserManager as DjangoUserManager
 from django.db import models
+from django.db.models.functions import Lower
 from django.utils.http import urlsafe_base64_decode
 
+from apps.utils import passwords
+
 
 class UserQuerySet(models.QuerySet):
+    def filter_by_email(self, email: str):
+        """Users with email in any case, lookup uses unique index of lowercase email"""
+        return self.alias(email_lower=Lower("email")).filter(email_lower=email.lower())
+
+    def filter_by_emails(self, emails: Iterable[str]):
+        """Users with any of emails in any case, like filter_by_email()"""
+        return self.alias(email_lower=Lower("email")).filter(email_lower__in=[email.lower() for email in emails])
+
     def get_by_uid(self, uid64):
         uid = urlsafe_base64_decode(uid64).decode()
         return self.get(pk=uid)
 
+    async def aget_by_uid(self, uid64):
+        uid = urlsafe_base64_decode(uid64).decode()
+        return await self.aget(pk=uid)
+
 
 class UserManager(DjangoUserManager):
     """Custom manager for the User model."""
@@ -24,7 +40,7 @@ class UserManager(DjangoUserManager):
             raise ValueError("The given email must be set")
         email = self.normalize_email(email)
         user = self.model(email=email, **extra_fields)
-        user.password = make_password(password)
+        user.password = passwords.make_password(password)
         user.save(using=self._db)
         return user
 
@@ -45,5 +61,21 @@ class UserManager(DjangoUserManager):
 
         return self._create_user(email, password, **extra_fields)
 
+    def filter_by_email(self, email: str):
+        return self.get_queryset().filter_by_email(email)
+
+    def filter_by_emails(self, emails: Iterable[str]):
+        return self.get_queryset().filter_by_emails(emails)
+
+    def get_by_natural_key(self, username: str):
+        """User by email in any case, it's used by authentication backend"""
+        return self.filter_by_email(username).get()
+
+    async def aget_by_natural_key(self, username: str):
+        return await self.filter_by_email(username).aget()
+
     def get_by_uid(self, pk):
         return self.get_queryset().get_by_uid(pk)
+
+    async def aget_by_uid(self, pk):
+        return await self.get_queryset().aget_by_uid(pk)
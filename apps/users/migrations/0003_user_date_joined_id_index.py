@@ -0,0 +1,20 @@
+# Generated by Django 4.2 on 2026-10-18 03:27
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Index is built without locking users table for writes
+    atomic = False
+
+    dependencies = [
+        ("users", "0002_user_is_verified"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="user",
+            index=models.Index(fields=["date_joined", "id"], name="users_user_date_joined_id_idx"),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2 on 2026-10-18 04:02
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("users", "0003_user_date_joined_id_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, verbose_name="updated at"),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2 on 2026-10-18 12:10
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Index is built without locking users table for writes
+    atomic = False
+
+    dependencies = [
+        ("users", "0004_user_updated_at"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="user",
+            index=models.Index(
+                condition=models.Q(("is_verified", False)),
+                fields=["date_joined"],
+                name="users_user_unverified_idx",
+            ),
+        ),
+    ]
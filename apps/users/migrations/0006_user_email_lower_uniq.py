@@ -0,0 +1,35 @@
+# Generated by Django 4.2 on 2026-10-18 12:40
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Index is built without locking users table for writes.
+    # Build fails if emails that differ only in case are already registered, they must be merged first
+    atomic = False
+
+    dependencies = [
+        ("users", "0005_user_unverified_idx"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    'CREATE UNIQUE INDEX CONCURRENTLY "users_user_email_lower_uniq" ON "users_user" (LOWER("email"))',
+                    reverse_sql='DROP INDEX CONCURRENTLY "users_user_email_lower_uniq"',
+                ),
+            ],
+            state_operations=[
+                migrations.AddConstraint(
+                    model_name="user",
+                    constraint=models.UniqueConstraint(
+                        django.db.models.functions.text.Lower("email"),
+                        name="users_user_email_lower_uniq",
+                        violation_error_message="This email already registered",
+                    ),
+                ),
+            ],
+        ),
+    ]
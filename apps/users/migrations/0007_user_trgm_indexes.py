@@ -0,0 +1,55 @@
+# Generated by Django 4.2 on 2026-10-18 13:05
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # Indexes are built without locking users table for writes
+    atomic = False
+
+    dependencies = [
+        ("users", "0006_user_email_lower_uniq"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        # Django 4.2 renders OpClass of expression in GIN index as invalid SQL (extra parentheses),
+        # so indexes are created by SQL, and state gets the same indexes as model Meta
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    'CREATE INDEX CONCURRENTLY IF NOT EXISTS "users_user_name_trgm_idx" '
+                    'ON "users_user" USING gin (UPPER("name") gin_trgm_ops)',
+                    reverse_sql='DROP INDEX CONCURRENTLY IF EXISTS "users_user_name_trgm_idx"',
+                ),
+                migrations.RunSQL(
+                    'CREATE INDEX CONCURRENTLY IF NOT EXISTS "users_user_email_trgm_idx" '
+                    'ON "users_user" USING gin (UPPER("email") gin_trgm_ops)',
+                    reverse_sql='DROP INDEX CONCURRENTLY IF EXISTS "users_user_email_trgm_idx"',
+                ),
+            ],
+            state_operations=[
+                migrations.AddIndex(
+                    model_name="user",
+                    index=django.contrib.postgres.indexes.GinIndex(
+                        django.contrib.postgres.indexes.OpClass(
+                            django.db.models.functions.text.Upper("name"), name="gin_trgm_ops"
+                        ),
+                        name="users_user_name_trgm_idx",
+                    ),
+                ),
+                migrations.AddIndex(
+                    model_name="user",
+                    index=django.contrib.postgres.indexes.GinIndex(
+                        django.contrib.postgres.indexes.OpClass(
+                            django.db.models.functions.text.Upper("email"), name="gin_trgm_ops"
+                        ),
+                        name="users_user_email_trgm_idx",
+                    ),
+                ),
+            ],
+        ),
+    ]
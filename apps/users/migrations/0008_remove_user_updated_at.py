@@ -0,0 +1,16 @@
+# Generated by Django 4.2 on 2026-10-18 14:20
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("users", "0007_user_trgm_indexes"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="user",
+            name="updated_at",
+        ),
+    ]
@@ -1,10 +1,12 @@
-from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import AbstractUser
-from django.db.models import BooleanField, CharField, EmailField
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db.models import BooleanField, CharField, EmailField, Index, Q, UniqueConstraint
+from django.db.models.functions import Lower, Upper
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
 from apps.users.managers import UserManager
+from apps.utils import passwords
 
 
 class User(AbstractUser):
@@ -22,6 +24,27 @@ class User(AbstractUser):
 
     objects = UserManager()
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Keyset pagination of users list
+            Index(fields=["date_joined", "id"], name="users_user_date_joined_id_idx"),
+            # Purge of unverified users, partial index is small: most users are verified
+            Index(fields=["date_joined"], condition=Q(is_verified=False), name="users_user_unverified_idx"),
+            # Admin search by substring of name and email, see TrigramSearchMixin. Expressions match
+            # icontains and istartswith lookups: UPPER(field) LIKE UPPER(term). Created by SQL in migration 0007,
+            # Django 4.2 renders them with invalid SQL, so changes of them need RunSQL too
+            GinIndex(OpClass(Upper("name"), name="gin_trgm_ops"), name="users_user_name_trgm_idx"),
+            GinIndex(OpClass(Upper("email"), name="gin_trgm_ops"), name="users_user_email_trgm_idx"),
+        ]
+        constraints = [
+            # Email is unique in any case, lookups by email use this index, see UserQuerySet.filter_by_email()
+            UniqueConstraint(
+                Lower("email"),
+                name="users_user_email_lower_uniq",
+                violation_error_message=_("This email already registered"),
+            ),
+        ]
+
     def get_absolute_url(self) -> str:
         """Get URL for user's detail view.
 
@@ -31,5 +54,23 @@ class User(AbstractUser):
         """
         return reverse("users:detail", kwargs={"pk": self.pk})
 
+    def set_password(self, raw_password: str | None):
+        """Hash password in password hashing process pool, see apps.utils.passwords"""
+        self.password = passwords.make_password(raw_password)
+        self._password = raw_password
+
+    def check_password(self, raw_password: str) -> bool:
+        """Check password in password hashing process pool. Used by authentication backend for JWT token obtain"""
+        return passwords.check_password(raw_password, self.password, self.update_password_hash)
+
+    async def acheck_password(self, raw_password: str) -> bool:
+        return await passwords.acheck_password(raw_password, self.password, self.update_password_hash)
+
+    def update_password_hash(self, raw_password: str):
+        """Save password hashed by preferred hasher, if hasher settings were changed"""
+        self.set_password(raw_password)
+        self._password = None
+        self.save(update_fields=["password"])
+
     def update_password(self, new_password: str):
-        self.password = make_password(new_password)
+        self.password = passwords.make_password(new_password)
@@ -0,0 +1,67 @@
+from collections.abc import Callable
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
+
+User = get_user_model()
+
+# Fields of purged users that are passed to archive, in format of user import
+ARCHIVE_FIELDS = ("email", "name", "date_joined")
+
+
+def get_unverified_users(older_than: timedelta | None = None):
+    """Users that did not verify email in given time after registration, settings.USER_PURGE_UNVERIFIED_AFTER_DAYS
+    by default. Query uses partial index of unverified users by date_joined
+    """
+    older_than = older_than or timedelta(days=settings.USER_PURGE_UNVERIFIED_AFTER_DAYS)
+    return User.objects.filter(is_verified=False, date_joined__lt=timezone.now() - older_than)
+
+
+def purge_unverified_users(
+    older_than: timedelta | None = None,
+    chunk_size: int | None = None,
+    archive: Callable[[list[dict]], None] | None = None,
+) -> int:
+    """Delete users that did not verify email.
+
+    Users are deleted in chunks by primary key range, every chunk in own short transaction,
+    so locks are held only for one chunk and other requests are not blocked. Unverified users of chunk
+    are locked with SELECT FOR UPDATE before archive and delete, so user that verifies email during purge
+    is either skipped by chunk or waits for chunk commit and finds own row deleted.
+
+    Args:
+        older_than (timedelta|None): age of unverified users, settings.USER_PURGE_UNVERIFIED_AFTER_DAYS by default
+        chunk_size (int|None): users deleted in one transaction, settings.USER_PURGE_CHUNK_SIZE by default
+        archive (Callable|None): called with ARCHIVE_FIELDS of users of chunk before delete
+
+    Returns:
+        int: number of deleted users
+    """
+    chunk_size = chunk_size or settings.USER_PURGE_CHUNK_SIZE
+    candidates = get_unverified_users(older_than).order_by("pk")
+
+    deleted = 0
+    last_pk = None
+    while True:
+        chunk_candidates = candidates if last_pk is None else candidates.filter(pk__gt=last_pk)
+        pks = list(chunk_candidates.values_list("pk", flat=True)[:chunk_size])
+        if not pks:
+            break
+        last_pk = pks[-1]
+
+        with transaction.atomic():
+            # Rows are locked first, verification of user of chunk waits for commit of chunk. Row verified
+            # before lock is skipped: WHERE is checked again on locked row version
+            chunk_range = candidates.filter(pk__gte=pks[0], pk__lte=last_pk)
+            locked_pks = list(chunk_range.select_for_update().values_list("pk", flat=True))
+            chunk = candidates.filter(pk__in=locked_pks)
+            if archive is not None:
+                archive(list(chunk.values(*ARCHIVE_FIELDS)))
+            __, deleted_by_model = chunk.delete()
+
+        deleted += deleted_by_model.get(User._meta.label, 0)
+
+    return deleted
@@ -1,5 +1,6 @@
 from django.contrib.auth import get_user_model
 
+from apps.users.purge import purge_unverified_users
 from settings import celery_app
 
 User = get_user_model()
@@ -9,3 +10,10 @@ User = get_user_model()
 def get_users_count():
     """A pointless Celery task to demonstrate usage."""
     return User.objects.count()
+
+
+# Purge of big backlog takes longer than default limits, chunks that are deleted before limit stay deleted
+@celery_app.task(soft_time_limit=30 * 60, time_limit=35 * 60)
+def purge_unverified_users_task() -> int:
+    """Delete users that did not verify email in settings.USER_PURGE_UNVERIFIED_AFTER_DAYS, run by Celery beat"""
+    return purge_unverified_users()
@@ -0,0 +1,41 @@
+import pytest
+from django.contrib.admin.sites import site
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory
+from django.urls import reverse
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+class TestUserAdminSearch:
+    @pytest.fixture
+    def users(self, user_factory) -> list[User]:
+        return [
+            user_factory(email="anna@example.com", name="Anna Smith"),
+            user_factory(email="bob@example.org", name="Robert Annan"),
+            user_factory(email="carol@example.com", name="Carol"),
+        ]
+
+    def search(self, search_term: str) -> list[str]:
+        model_admin = site._registry[User]
+        queryset, may_have_duplicates = model_admin.get_search_results(
+            RequestFactory().get("/"), User.objects.order_by("id"), search_term
+        )
+        assert not may_have_duplicates
+        return [user.email for user in queryset]
+
+    def test_substring_of_name_and_email(self, users):
+        assert self.search("ANN") == ["anna@example.com", "bob@example.org"]
+        assert self.search("example.org") == ["bob@example.org"]
+        assert self.search("ann smith") == ["anna@example.com"]
+        assert self.search('"Anna Smith"') == ["anna@example.com"]
+
+    def test_short_term_is_prefix(self, users):
+        assert self.search("an") == ["anna@example.com"]
+        assert self.search("ro") == ["bob@example.org"]
+
+    def test_changelist(self, users, admin_client):
+        response = admin_client.get(reverse("admin:users_user_changelist"), {"q": "annan"})
+        assert response.status_code == 200
+        assert list(response.context["cl"].result_list) == [users[1]]
@@ -0,0 +1,120 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.urls import include, path
+from rest_framework import status
+from rest_framework.reverse import reverse
+
+from apps.api_authentication.api.async_views import AsyncAuthApiView
+from apps.base.api.transactions import READ_ONLY, transaction_policy_context
+from apps.conftest import TEST_USER_PASSWORD
+from apps.test_utils.api_client import JwtAPIClient
+from apps.users.api.async_views import AsyncUserViewSet
+from apps.users.api.services import generate_uid_and_token_from_user
+from apps.utils.router import SimpleApiRouter
+
+User = get_user_model()
+
+router = SimpleApiRouter()
+router.register("v1/auth", AsyncAuthApiView, basename="auth")
+router.register("v1/users", AsyncUserViewSet, basename="user")
+
+urlpatterns = [path("v1/api/", include((router.urls, "api"), namespace="v1"))]
+
+NEW_PASSWORD = "cGf!9Wj2O*36"
+
+
+@pytest.mark.urls(__name__)
+@pytest.mark.django_db
+class TestAsyncViews:
+    @pytest.fixture
+    def api_client(self) -> JwtAPIClient:
+        return JwtAPIClient()
+
+    def test_view_is_async(self):
+        view = AsyncUserViewSet.as_view({"get": "list"})
+
+        assert view.__code__.co_flags & 0x80  # CO_COROUTINE
+        assert view.cls is AsyncUserViewSet
+        assert view.csrf_exempt
+
+    def test_register_and_verify(self, api_client: JwtAPIClient):
+        email = "jonhndoe@gmail.com"
+        data = {"email": email, "password": "qwerty123451", "password2": "qwerty123451"}
+
+        response = api_client.post(reverse("v1:user-register"), data=data)
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data.data == {"email": email}
+
+        user = User.objects.get(email=email)
+        assert user.check_password("qwerty123451")
+        verification_link = reverse("v1:user-verify", kwargs=generate_uid_and_token_from_user(user))
+        assert verification_link in mail.outbox[0].body
+
+        response = api_client.post(reverse("v1:user-register"), data=data)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        assert api_client.get(verification_link).status_code == status.HTTP_200_OK
+        user.refresh_from_db()
+        assert user.is_verified
+
+        response = api_client.get(reverse("v1:user-verify", kwargs={"uid64": "MTIzNDU2", "token": "wrong"}))
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_login_and_change_password(self, user: User, api_client: JwtAPIClient):
+        response = api_client.jwt_login(email=user.email, password="wrong")
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+        response = api_client.jwt_login(email=user.email, password=TEST_USER_PASSWORD)
+        assert response.status_code == status.HTTP_200_OK
+        assert set(response.data) == {"access", "refresh"}
+
+        response = api_client.post(
+            reverse("v1:user-change-password"),
+            data={"current_password": TEST_USER_PASSWORD, "password": NEW_PASSWORD, "password2": NEW_PASSWORD},
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        user.refresh_from_db()
+        assert user.check_password(NEW_PASSWORD)
+
+    def test_forget_and_set_new_password(self, user: User, api_client: JwtAPIClient):
+        response = api_client.get(reverse("v1:user-forget-password", kwargs={"email": user.email}))
+        assert response.status_code == status.HTTP_200_OK
+        assert len(mail.outbox) == 1
+
+        url = reverse("v1:user-set-new-password", kwargs=generate_uid_and_token_from_user(user))
+        response = api_client.post(url, data={"password": NEW_PASSWORD, "password2": NEW_PASSWORD})
+        assert response.status_code == status.HTTP_200_OK
+
+        user.refresh_from_db()
+        assert user.check_password(NEW_PASSWORD)
+
+        response = api_client.get(reverse("v1:user-forget-password", kwargs={"email": "nobody@gmail.com"}))
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_sync_action_and_permissions(self, user: User, api_client: JwtAPIClient):
+        assert api_client.get(reverse("v1:user-ping")).data == "pong"
+        assert api_client.get(reverse("v1:user-list")).status_code == status.HTTP_403_FORBIDDEN
+
+        user.is_staff = True
+        user.save()
+        api_client.force_authenticate(user)
+        response = api_client.get(reverse("v1:user-list"))
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data.data["results"]) == 1
+
+    def test_sync_action_runs_by_transaction_policy(self, user: User, api_client: JwtAPIClient, monkeypatch):
+        policies = []
+
+        def recording_context(policy, action, using=None):
+            policies.append((action, policy))
+            return transaction_policy_context(policy, action, using=using)
+
+        monkeypatch.setattr("apps.base.api.views.transaction_policy_context", recording_context)
+        user.is_staff = True
+        user.save()
+        api_client.force_authenticate(user)
+
+        assert api_client.get(reverse("v1:user-list")).status_code == status.HTTP_200_OK
+        assert policies == [("AsyncUserViewSet.list", READ_ONLY)]
@@ -0,0 +1,107 @@
+import io
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.management import call_command
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APIClient
+
+from apps.users.importer import CSV, NDJSON, UserImporter, iter_import_rows
+
+User = get_user_model()
+
+NDJSON_BODY = b"""{"email": "one@example.com", "password": "secret-1", "name": "One"}
+{"email": "two@example.com"}
+
+{"email": "one@example.com", "password": "other"}
+{"email": "not an email"}
+not json
+{"email": "registered@example.com"}
+"""
+
+CSV_BODY = """email,password,name
+one@example.com,secret-1,One
+two@example.com,,
+not an email,,
+"""
+
+
+@pytest.mark.django_db
+class TestUserImporter:
+    def test_import_ndjson(self, user_factory):
+        user_factory(email="registered@example.com")
+        importer = UserImporter(batch_size=2, build_absolute_uri=lambda location: f"https://example.com{location}")
+
+        result = importer.run(iter_import_rows(io.BytesIO(NDJSON_BODY), NDJSON))
+
+        assert (result.created, result.skipped, result.invalid) == (2, 2, 2)
+        assert [error["line"] for error in result.errors] == [5, 6]
+
+        one = User.objects.get(email="one@example.com")
+        assert one.name == "One"
+        assert one.check_password("secret-1")
+        assert not User.objects.get(email="two@example.com").has_usable_password()
+
+        assert sorted(message.to[0] for message in mail.outbox) == ["one@example.com", "two@example.com"]
+        assert "https://example.com/" in mail.outbox[0].body
+
+    def test_import_csv(self):
+        result = UserImporter().run(iter_import_rows(io.StringIO(CSV_BODY), CSV))
+
+        assert (result.created, result.skipped, result.invalid) == (2, 0, 1)
+        assert result.errors[0]["line"] == 4
+        assert len(mail.outbox) == 0
+
+    def test_process_pool(self):
+        lines = [f'{{"email": "user{number}@example.com", "password": "pass{number}"}}' for number in range(10)]
+        result = UserImporter(workers=2).run(iter_import_rows(lines, NDJSON))
+
+        assert result.created == 10
+        assert User.objects.get(email="user7@example.com").check_password("pass7")
+
+    def test_emails_in_other_case_skipped(self, user_factory):
+        user_factory(email="Registered@example.com")
+        lines = ['{"email": "registered@EXAMPLE.com"}', '{"email": "New@example.com"}', '{"email": "new@example.com"}']
+
+        result = UserImporter().run(iter_import_rows(lines, NDJSON))
+
+        assert (result.created, result.skipped) == (1, 2)
+        assert User.objects.filter_by_email("new@example.com").get().email == "New@example.com"
+
+    def test_command(self, tmp_path):
+        path = tmp_path / "users.csv"
+        path.write_text(CSV_BODY)
+        stdout = io.StringIO()
+
+        call_command(
+            "import_users", str(path), "--base-url", "https://example.com", stdout=stdout, stderr=io.StringIO()
+        )
+
+        assert "Created: 2, skipped: 0, invalid: 1" in stdout.getvalue()
+        assert len(mail.outbox) == 2
+
+
+@pytest.mark.django_db
+def test_import_users_action(user: User, monkeypatch):
+    def fail_process_pool(*args, **kwargs):
+        raise AssertionError("Web worker must use shared password hashing pool")
+
+    monkeypatch.setattr("apps.users.importer.ProcessPoolExecutor", fail_process_pool)
+    api_client = APIClient()
+    api_client.force_authenticate(user)
+    url = reverse("v1:user-import-users")
+
+    response = api_client.post(url, data=NDJSON_BODY, content_type="application/x-ndjson")
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    user.is_staff = True
+    user.save()
+
+    response = api_client.post(url, data=NDJSON_BODY, content_type="application/x-ndjson")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data.data.created == 3
+
+    response = api_client.post(url, data=b"{}", content_type="application/json")
+    assert response.status_code == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
@@ -0,0 +1,79 @@
+import io
+from datetime import timedelta
+from unittest import mock
+
+import orjson
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from apps.users.purge import purge_unverified_users
+from apps.users.tasks import purge_unverified_users_task
+
+User = get_user_model()
+
+
+@pytest.fixture
+def users(user_factory) -> dict[str, User]:
+    old = timezone.now() - timedelta(days=40)
+    users = {
+        "old_unverified_1": user_factory(email="old1@example.com", is_verified=False),
+        "old_unverified_2": user_factory(email="old2@example.com", is_verified=False),
+        "old_verified": user_factory(email="verified@example.com", is_verified=True),
+        "old_unverified_3": user_factory(email="old3@example.com", is_verified=False),
+        "new_unverified": user_factory(email="new@example.com", is_verified=False),
+    }
+    User.objects.exclude(pk=users["new_unverified"].pk).update(date_joined=old)
+    return users
+
+
+@pytest.mark.django_db
+class TestPurgeUnverifiedUsers:
+    def test_purge(self, users, settings):
+        settings.USER_PURGE_UNVERIFIED_AFTER_DAYS = 30
+        archived = []
+
+        deleted = purge_unverified_users(chunk_size=2, archive=archived.extend)
+
+        assert deleted == 3
+        assert set(User.objects.values_list("email", flat=True)) == {"verified@example.com", "new@example.com"}
+        assert [row["email"] for row in archived] == ["old1@example.com", "old2@example.com", "old3@example.com"]
+
+    def test_user_verified_during_purge_is_kept(self, users):
+        def archive(rows):
+            # User of next chunk verifies email after chunk ids are selected
+            User.objects.filter(pk=users["old_unverified_3"].pk).update(is_verified=True)
+
+        deleted = purge_unverified_users(timedelta(days=30), chunk_size=10, archive=archive)
+
+        assert deleted == 2
+        assert User.objects.filter(pk=users["old_unverified_3"].pk).exists()
+
+    def test_chunk_locked_before_delete(self, users):
+        select_for_update = QuerySet.select_for_update
+
+        with mock.patch.object(QuerySet, "select_for_update", autospec=True, side_effect=select_for_update) as lock:
+            assert purge_unverified_users(timedelta(days=30), chunk_size=2) == 3
+
+        assert lock.call_count == 2
+
+    def test_task(self, users):
+        assert purge_unverified_users_task() == 3
+
+    def test_command(self, users, tmp_path):
+        path = tmp_path / "purged.ndjson"
+        stdout = io.StringIO()
+
+        call_command("purge_unverified_users", "--dry-run", stdout=stdout)
+        assert "Unverified users to delete: 3" in stdout.getvalue()
+        assert User.objects.count() == 5
+
+        call_command("purge_unverified_users", "--days", "50", stdout=stdout)
+        assert User.objects.count() == 5
+
+        call_command("purge_unverified_users", "--chunk-size", "1", "--archive", str(path), stdout=stdout)
+        assert "Deleted unverified users: 3" in stdout.getvalue()
+        rows = [orjson.loads(line) for line in path.read_bytes().splitlines()]
+        assert sorted(row["email"] for row in rows) == ["old1@example.com", "old2@example.com", "old3@example.com"]
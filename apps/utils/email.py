@@ -1,17 +1,163 @@
-from django.core.mail import EmailMultiAlternatives
+import weakref
+from smtplib import SMTPException
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
 from django.template import loader
 
 
-def send_from_template_email(
+class TemplateEmailsError(Exception):
+    """Delivery of template emails interrupted by backend error. Emails before `unsent` were delivered"""
+
+    def __init__(self, unsent: list[dict], sent: int):
+        super().__init__(f"{len(unsent)} template emails not sent")
+        self.unsent = unsent
+        self.sent = sent
+
+
+class TemplateEmailBatch:
+    """On commit callback with list of template emails.
+    All emails queued in the same transaction are added to one batch and delivered by one Celery task
+    """
+
+    def __init__(self):
+        self.emails = []
+        self.dispatched = False
+
+    def __call__(self):
+        self.dispatched = True
+        dispatch_template_emails(self.emails)
+
+
+# Open email batches, by database connection and savepoint ids of transaction.
+# Only on_commit() keeps batch alive, so batch of rolled back transaction or savepoint disappears with it
+template_email_batches = weakref.WeakKeyDictionary()
+
+
+def render_template_email(
     subject_template_name: str, email_template_name: str, context: dict, from_email: str, to_email: str
-):
+) -> EmailMultiAlternatives:
+    """Render email message from templates. Email template rendered once and used for body and html alternative
+
+    Args:
+        subject_template_name (str): template for email subject
+        email_template_name (str): template for email body
+        context (dict): context for both templates
+        from_email (str): sender email
+        to_email (str): recipient email
+
+    Returns:
+        EmailMultiAlternatives: email message ready to send
+    """
     subject = loader.render_to_string(subject_template_name, context)
     # Email subject *must not* contain newlines
     subject = "".join(subject.splitlines())
     body = loader.render_to_string(email_template_name, context)
 
     email_message = EmailMultiAlternatives(subject, body, from_email, [to_email])
-    html_email = loader.render_to_string(email_template_name, context)
-    email_message.attach_alternative(html_email, "text/html")
+    email_message.attach_alternative(body, "text/html")
+    return email_message
+
+
+def send_template_emails(emails: list[dict]) -> int:
+    """Render and send list of template emails through one email backend connection.
+    Messages are sent one by one, so on backend error it is known which of them were delivered
+
+    Args:
+        emails (list[dict]): key arguments for render_template_email
+
+    Raises:
+        TemplateEmailsError: SMTP or network error, with emails which were not sent
+
+    Returns:
+        int: number of sent emails
+    """
+    messages = [render_template_email(**email) for email in emails]
+    connection = get_connection()
+    sent = index = 0
+    try:
+        connection.open()
+        for index, message in enumerate(messages):
+            sent += connection.send_messages([message]) or 0
+    except (SMTPException, OSError) as exc:
+        raise TemplateEmailsError(emails[index:], sent) from exc
+    finally:
+        connection.close()
+    return sent
+
 
-    email_message.send()
+def dispatch_template_emails(emails: list[dict]) -> None:
+    """Send emails to Celery in batches of settings.EMAIL_BATCH_SIZE
+
+    Args:
+        emails (list[dict]): key arguments for render_template_email
+    """
+    from apps.base.tasks import send_template_emails_task
+
+    batch_size = settings.EMAIL_BATCH_SIZE
+    for start in range(0, len(emails), batch_size):
+        end = start + batch_size
+        send_template_emails_task.delay(emails[start:end])
+
+
+def queue_template_emails(emails: list[dict], using: str | None = None) -> None:
+    """Queue emails for delivery after current transaction commit.
+    If transaction rolls back, emails are dropped together with it.
+
+    Args:
+        emails (list[dict]): key arguments for render_template_email
+        using (str|None): database alias of transaction
+    """
+    connection = transaction.get_connection(using)
+    if not connection.in_atomic_block:
+        dispatch_template_emails(emails)
+        return
+
+    batches = template_email_batches.setdefault(connection, weakref.WeakValueDictionary())
+    savepoint_ids = tuple(connection.savepoint_ids)
+    batch = batches.get(savepoint_ids)
+    if batch is None or batch.dispatched:
+        batch = TemplateEmailBatch()
+        batches[savepoint_ids] = batch
+        transaction.on_commit(batch, using=using)
+
+    batch.emails.extend(emails)
+
+
+def deliver_template_emails(emails: list[dict]) -> None:
+    """Queue emails for delivery by Celery after commit, or send them at once if async delivery is off
+
+    Args:
+        emails (list[dict]): key arguments for render_template_email
+    """
+    # Synchronous mode, for tests with locmem email backend
+    if not settings.EMAIL_ASYNC_DELIVERY:
+        send_template_emails(emails)
+        return
+
+    queue_template_emails(emails)
+
+
+async def adeliver_template_emails(emails: list[dict]) -> None:
+    """Async version of deliver_template_emails(). Broker or SMTP calls run in thread, event loop is not blocked.
+    Thread is the one of other sync code of request, so emails are queued in transaction of its connection
+
+    Args:
+        emails (list[dict]): key arguments for render_template_email
+    """
+    await sync_to_async(deliver_template_emails)(emails)
+
+
+def send_from_template_email(
+    subject_template_name: str, email_template_name: str, context: dict, from_email: str, to_email: str
+) -> None:
+    email = {
+        "subject_template_name": subject_template_name,
+        "email_template_name": email_template_name,
+        "context": context,
+        "from_email": from_email,
+        "to_email": to_email,
+    }
+    deliver_template_emails([email])
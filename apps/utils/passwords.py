@@ -0,0 +1,134 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import django
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import hashers
+
+_executor: ProcessPoolExecutor | None = None
+_executor_pid: int | None = None
+_executor_lock = threading.Lock()
+
+
+def check_password_in_worker(password: str, encoded: str) -> tuple[bool, bool]:
+    """Check password in worker process
+
+    Returns:
+        tuple[bool, bool]: password is correct, hash should be updated with preferred hasher
+    """
+    must_update = []
+    is_correct = hashers.check_password(password, encoded, setter=lambda raw_password: must_update.append(True))
+    return is_correct, bool(must_update)
+
+
+def get_hashing_executor() -> ProcessPoolExecutor | None:
+    """Process pool for password hashing, created on first use in every process.
+    Workers are spawned, not forked, so threads and connections of server are not copied to them.
+
+    Returns:
+        ProcessPoolExecutor|None: None if settings.PASSWORD_HASHING_WORKERS is 0, hashing runs in current process
+    """
+    global _executor, _executor_pid
+
+    if settings.PASSWORD_HASHING_WORKERS <= 0:
+        return None
+
+    with _executor_lock:
+        if _executor is None or _executor_pid != os.getpid():
+            _executor = ProcessPoolExecutor(
+                max_workers=settings.PASSWORD_HASHING_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=django.setup,
+            )
+            _executor_pid = os.getpid()
+        return _executor
+
+
+def shutdown_hashing_executor(wait: bool = True):
+    global _executor
+
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=wait, cancel_futures=True)
+            _executor = None
+
+
+def submit(function: Callable, *args) -> Future | None:
+    executor = get_hashing_executor()
+    if executor is None:
+        return None
+
+    try:
+        return executor.submit(function, *args)
+    except BrokenProcessPool:
+        # Worker was killed, next call creates new pool
+        shutdown_hashing_executor(wait=False)
+        return None
+
+
+def make_password(password: str | None) -> str:
+    """Hash password in worker process. Request thread waits for result without holding the GIL.
+
+    Args:
+        password (str|None): raw password, None gives unusable password
+
+    Returns:
+        str: encoded password
+    """
+    future = submit(hashers.make_password, password)
+    if future is None:
+        return hashers.make_password(password)
+    return future.result()
+
+
+def check_password(password: str, encoded: str, setter: Callable[[str], None] | None = None) -> bool:
+    """Check password in worker process, like django.contrib.auth.hashers.check_password
+
+    Args:
+        password (str): raw password
+        encoded (str): encoded password from database
+        setter (Callable|None): called with raw password if password is correct and hash should be updated
+
+    Returns:
+        bool: password is correct
+    """
+    if password is None or not hashers.is_password_usable(encoded):
+        return False
+
+    future = submit(check_password_in_worker, password, encoded)
+    is_correct, must_update = check_password_in_worker(password, encoded) if future is None else future.result()
+
+    if setter and is_correct and must_update:
+        setter(password)
+    return is_correct
+
+
+async def amake_password(password: str | None) -> str:
+    """Async version of make_password(), event loop is not blocked while password is hashed"""
+    future = submit(hashers.make_password, password)
+    if future is None:
+        return await sync_to_async(hashers.make_password, thread_sensitive=False)(password)
+    return await asyncio.wrap_future(future)
+
+
+async def acheck_password(password: str, encoded: str, setter: Callable[[str], None] | None = None) -> bool:
+    """Async version of check_password(). Setter is called in sync context"""
+    if password is None or not hashers.is_password_usable(encoded):
+        return False
+
+    future = submit(check_password_in_worker, password, encoded)
+    if future is None:
+        result = sync_to_async(check_password_in_worker, thread_sensitive=False)(password, encoded)
+    else:
+        result = asyncio.wrap_future(future)
+    is_correct, must_update = await result
+
+    if setter and is_correct and must_update:
+        await sync_to_async(setter)(password)
+    return is_correct
@@ -0,0 +1,113 @@
+import threading
+from smtplib import SMTPServerDisconnected
+from unittest import mock
+
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from celery.exceptions import Retry
+from django.core import mail
+from django.db import transaction
+
+from apps.base.tasks import send_template_emails_task
+from apps.users.api.services import EMAIL_VERIFICATION_SUBJECT, EMAIL_VERIFICATION_TEMPLATE
+from apps.utils.email import (
+    TemplateEmailsError,
+    adeliver_template_emails,
+    send_from_template_email,
+    send_template_emails,
+)
+
+
+def make_email(to_email: str) -> dict:
+    return {
+        "subject_template_name": EMAIL_VERIFICATION_SUBJECT,
+        "email_template_name": EMAIL_VERIFICATION_TEMPLATE,
+        "context": {"verification_absolute_url": "http://testserver/verify/", "domain": "MySite"},
+        "from_email": "mysite@gmail.com",
+        "to_email": to_email,
+    }
+
+
+class TestTemplateEmails:
+    def test_send_template_emails(self):
+        assert send_template_emails([make_email("one@gmail.com"), make_email("two@gmail.com")]) == 2
+
+        assert len(mail.outbox) == 2
+        message = mail.outbox[0]
+        assert "\n" not in message.subject
+        assert message.alternatives == [(message.body, "text/html")]
+
+    @pytest.mark.django_db
+    def test_emails_in_transaction_sent_in_one_batch(self, settings, django_capture_on_commit_callbacks):
+        settings.EMAIL_ASYNC_DELIVERY = True
+
+        with mock.patch("apps.base.tasks.send_template_emails_task.delay") as delay:
+            with django_capture_on_commit_callbacks(execute=True) as callbacks:
+                with transaction.atomic():
+                    send_from_template_email(**make_email("one@gmail.com"))
+                    send_from_template_email(**make_email("two@gmail.com"))
+
+                assert delay.call_count == 0
+
+        assert len(callbacks) == 1
+        delay.assert_called_once_with([make_email("one@gmail.com"), make_email("two@gmail.com")])
+        assert len(mail.outbox) == 0
+
+    def test_send_template_emails_error(self):
+        emails = [make_email("one@gmail.com"), make_email("two@gmail.com"), make_email("three@gmail.com")]
+        send_messages = mock.Mock(side_effect=[1, SMTPServerDisconnected()])
+
+        with mock.patch("django.core.mail.backends.locmem.EmailBackend.send_messages", send_messages):
+            with pytest.raises(TemplateEmailsError) as exc_info:
+                send_template_emails(emails)
+
+        assert exc_info.value.sent == 1
+        assert exc_info.value.unsent == emails[1:]
+
+    def test_task_retries_only_unsent_emails(self):
+        emails = [make_email("one@gmail.com"), make_email("two@gmail.com")]
+        error = TemplateEmailsError(emails[1:], 1)
+
+        with mock.patch("apps.base.tasks.send_template_emails", side_effect=error):
+            with mock.patch.object(send_template_emails_task, "retry", side_effect=Retry) as retry:
+                with pytest.raises(Retry):
+                    send_template_emails_task(emails)
+
+        assert retry.call_args.kwargs["args"] == (emails[1:],)
+
+    @pytest.mark.django_db
+    def test_emails_of_rolled_back_savepoint_dropped(self, settings, django_capture_on_commit_callbacks):
+        settings.EMAIL_ASYNC_DELIVERY = True
+
+        with mock.patch("apps.base.tasks.send_template_emails_task.delay") as delay:
+            with django_capture_on_commit_callbacks(execute=True):
+                with transaction.atomic():
+                    send_from_template_email(**make_email("one@gmail.com"))
+                    try:
+                        with transaction.atomic():
+                            send_from_template_email(**make_email("two@gmail.com"))
+                            raise ValueError
+                    except ValueError:
+                        pass
+                    with transaction.atomic():
+                        send_from_template_email(**make_email("three@gmail.com"))
+
+        assert delay.call_args_list == [
+            mock.call([make_email("one@gmail.com")]),
+            mock.call([make_email("three@gmail.com")]),
+        ]
+
+    def test_async_delivery_in_thread_of_sync_code(self, settings):
+        settings.EMAIL_ASYNC_DELIVERY = True
+        queue_threads = []
+
+        async def deliver() -> int:
+            await adeliver_template_emails([make_email("one@gmail.com")])
+            return await sync_to_async(threading.get_ident)()
+
+        with mock.patch(
+            "apps.utils.email.queue_template_emails", lambda emails: queue_threads.append(threading.get_ident())
+        ):
+            sync_thread = async_to_sync(deliver)()
+
+        assert queue_threads == [sync_thread]
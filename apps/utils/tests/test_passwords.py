@@ -0,0 +1,60 @@
+import asyncio
+import os
+from unittest import mock
+
+import pytest
+
+from apps.conftest import TEST_USER_PASSWORD
+from apps.utils import passwords
+
+
+class TestPasswords:
+    def test_make_and_check_password(self):
+        encoded = passwords.make_password("secret")
+
+        assert passwords.check_password("secret", encoded)
+        assert not passwords.check_password("wrong", encoded)
+        assert not passwords.check_password("secret", passwords.make_password(None))
+
+    def test_setter_on_hasher_change(self, settings):
+        encoded = passwords.make_password("secret")
+        settings.PASSWORD_HASHERS = [
+            "django.contrib.auth.hashers.SHA1PasswordHasher",
+            "django.contrib.auth.hashers.MD5PasswordHasher",
+        ]
+        setter = mock.Mock()
+
+        assert not passwords.check_password("wrong", encoded, setter)
+        setter.assert_not_called()
+        assert passwords.check_password("secret", encoded, setter)
+        setter.assert_called_once_with("secret")
+
+    def test_async(self):
+        async def run():
+            encoded = await passwords.amake_password("secret")
+            return await passwords.acheck_password("secret", encoded), await passwords.acheck_password("x", encoded)
+
+        assert asyncio.run(run()) == (True, False)
+
+    def test_process_pool(self, settings):
+        settings.PASSWORD_HASHING_WORKERS = 1
+        try:
+            encoded = passwords.make_password("secret")
+
+            assert passwords.check_password("secret", encoded)
+            assert not passwords.check_password("wrong", encoded)
+            assert passwords.submit(os.getpid).result() != os.getpid()
+        finally:
+            passwords.shutdown_hashing_executor()
+
+
+@pytest.mark.django_db
+def test_user_check_password_upgrades_hash(user, settings):
+    settings.PASSWORD_HASHERS = [
+        "django.contrib.auth.hashers.SHA1PasswordHasher",
+        "django.contrib.auth.hashers.MD5PasswordHasher",
+    ]
+
+    assert user.check_password(TEST_USER_PASSWORD)
+    user.refresh_from_db()
+    assert user.password.startswith("sha1$")
@@ -0,0 +1,118 @@
+"""Compare throughput of sync and async user views under ASGI server with concurrent clients.
+
+Every mode runs uvicorn with one worker in subprocess, `API_ASYNC_VIEWS` switches viewsets.
+Requires uvicorn and httpx from development requirements.
+
+Run:
+    python -m benchmarks.async_views
+"""
+
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+
+from benchmarks.utils import setup_django, test_database
+
+setup_django()
+
+from django.conf import settings  # noqa: E402
+from django.contrib.auth import get_user_model  # noqa: E402
+from django.urls import reverse  # noqa: E402
+
+User = get_user_model()
+
+PASSWORD = "cGf!9Wj2O*36"
+CONCURRENCY = [1, 16, 64]
+REQUESTS = 400
+
+
+def get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port: int, async_views: bool, db_name: str) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "API_ASYNC_VIEWS": str(async_views),
+        "DEFAULT_DB_NAME": db_name,
+        "DJANGO_SETTINGS_MODULE": settings.SETTINGS_MODULE,
+    }
+    command = [
+        sys.executable,
+        "-m",
+        "uvicorn",
+        "settings.asgi:application",
+        "--port",
+        str(port),
+        "--log-level",
+        "error",
+    ]
+    return subprocess.Popen(command, env=env)
+
+
+async def wait_for_server(client: httpx.AsyncClient, url: str) -> None:
+    for __ in range(100):
+        try:
+            await client.get(url)
+            return
+        except httpx.TransportError:
+            await asyncio.sleep(0.1)
+    raise RuntimeError("Server is not started")
+
+
+async def run(client: httpx.AsyncClient, name: str, concurrency: int, send) -> None:
+    queue = asyncio.Queue()
+    for __ in range(REQUESTS):
+        queue.put_nowait(None)
+
+    async def worker():
+        while not queue.empty():
+            queue.get_nowait()
+            response = await send(client)
+            assert response.status_code == 200, response.text
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for __ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    print(f"  {name:<8} concurrency={concurrency:<3} {REQUESTS / elapsed:8.1f} req/s")
+
+
+async def benchmark(base_url: str) -> None:
+    ping_url = reverse("v1:user-ping")
+    token_url = reverse("v1:auth-token")
+
+    limits = httpx.Limits(max_connections=max(CONCURRENCY))
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        await wait_for_server(client, ping_url)
+        for concurrency in CONCURRENCY:
+            await run(client, "ping", concurrency, lambda client: client.get(ping_url))
+            await run(
+                client,
+                "token",
+                concurrency,
+                lambda client: client.post(token_url, json={"email": "user@example.com", "password": PASSWORD}),
+            )
+
+
+if __name__ == "__main__":
+    with test_database() as connection:
+        User.objects.create_user(email="user@example.com", password=PASSWORD, is_verified=True)
+        # Server connects to test database, data must be visible for it
+        connection.close()
+
+        for async_views in (False, True):
+            port = get_free_port()
+            server = start_server(port, async_views, connection.settings_dict["NAME"])
+            print("async views" if async_views else "sync views")
+            try:
+                asyncio.run(benchmark(f"http://127.0.0.1:{port}"))
+            finally:
+                server.terminate()
+                server.wait()
@@ -0,0 +1,53 @@
+"""Compare rows/second of standard serializer and compiled read path on 100k users.
+
+Run:
+    python -m benchmarks.compiled_serializer
+"""
+
+import time
+
+from benchmarks.utils import setup_django, test_database
+
+setup_django()
+
+from django.contrib.auth import get_user_model  # noqa: E402
+
+from apps.base.api.serializers import DynamicFieldModelSerializer  # noqa: E402
+
+User = get_user_model()
+
+ROWS = 100_000
+SELECTED_FIELDS = ["email", "name", "is_verified", "date_joined"]
+
+
+class UserSerializer(DynamicFieldModelSerializer):
+    compiled_read = True
+
+    class Meta:
+        model = User
+        fields = ["id", "email", "name", "is_verified", "is_active", "date_joined", "last_login"]
+
+
+def create_users() -> None:
+    User.objects.bulk_create(
+        (User(email=f"user{number}@example.com", name=f"User {number}") for number in range(ROWS)),
+        batch_size=5000,
+    )
+
+
+def run(name: str, serialize) -> None:
+    start = time.perf_counter()
+    data = serialize()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<10} {len(data) / elapsed:>12,.0f} rows/s  {elapsed:6.2f} s")
+
+
+if __name__ == "__main__":
+    with test_database():
+        create_users()
+        queryset = User.objects.only(*SELECTED_FIELDS).order_by("id")
+        context = {"selected_fields": SELECTED_FIELDS}
+        compiled_serializer = UserSerializer.get_compiled_serializer(SELECTED_FIELDS)
+
+        run("standard", lambda: UserSerializer(queryset.all(), many=True, context=context).data)
+        run("compiled", lambda: compiled_serializer.serialize(queryset.all()))
@@ -0,0 +1,58 @@
+"""Compare connection churn of PostgreSQL backend without pool and pooled backend.
+
+Every simulated request runs one query and ends like Django request: connection is closed
+by close_old_connections(). Requires PostgreSQL from DEFAULT_DB_* env.
+
+Run:
+    python -m benchmarks.db_connections
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.utils import setup_django
+
+setup_django()
+
+from django.conf import settings  # noqa: E402
+from django.db.utils import ConnectionHandler  # noqa: E402
+
+from apps.base.db import pool  # noqa: E402
+
+REQUESTS = 2000
+THREADS = [1, 8, 32]
+ENGINES = {
+    "direct": "django.db.backends.postgresql",
+    "pooled": "apps.base.db.postgresql_pool",
+}
+
+
+def run(connections: ConnectionHandler, alias: str, threads: int) -> float:
+    def request(__):
+        connection = connections[alias]
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        connection.close_if_unusable_or_obsolete()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(request, range(REQUESTS)))
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    database = {**settings.DATABASES["default"], "ATOMIC_REQUESTS": False, "CONN_MAX_AGE": 0}
+    connections = ConnectionHandler({alias: {**database, "ENGINE": engine} for alias, engine in ENGINES.items()})
+
+    for threads in THREADS:
+        print(f"threads={threads}")
+        for alias in ENGINES:
+            elapsed = run(connections, alias, threads)
+            print(f"  {alias:<8} {REQUESTS / elapsed:8.0f} req/s  {elapsed * 1e3 / REQUESTS:6.2f} ms/request")
+
+        stats = pool.get_pools_stats()["pooled"]
+        print(
+            f"  pool: opened {stats['connections_opened']} connections, {stats['waits']} waits, "
+            f"wait max {stats['wait_ms_max']:.2f} ms"
+        )
+        pool.close_pools("pooled")
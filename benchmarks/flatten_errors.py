@@ -0,0 +1,44 @@
+"""Compare recursive flatten_errors from drf-standardized-errors with iterative flatten_errors.
+
+Run:
+    python -m benchmarks.flatten_errors
+"""
+
+import time
+
+from benchmarks.utils import setup_django
+
+setup_django()
+
+from drf_standardized_errors.formatter import flatten_errors as recursive_flatten_errors  # noqa: E402
+from rest_framework.exceptions import ErrorDetail  # noqa: E402
+
+from apps.core.exception_handler import flatten_errors  # noqa: E402
+
+SIZES = [500, 2_000, 10_000, 50_000]
+
+
+def make_errors_tree(size: int) -> list:
+    """Bulk payload errors: list of objects with field errors and nested list of objects"""
+    error = ErrorDetail("Enter a valid email address.", code="invalid")
+    return [
+        {"email": [error], "linked_accounts": [{}, {"email": [error]}]} if number % 2 else {} for number in range(size)
+    ]
+
+
+def run(function, detail) -> str:
+    start = time.perf_counter()
+    try:
+        errors = function(detail)
+    except RecursionError:
+        return "RecursionError"
+    elapsed = time.perf_counter() - start
+    return f"{len(errors):>7} errors {elapsed * 1000:10.1f} ms"
+
+
+if __name__ == "__main__":
+    for size in SIZES:
+        detail = make_errors_tree(size)
+        print(f"size={size}")
+        print(f"  recursive  {run(recursive_flatten_errors, detail)}")
+        print(f"  iterative  {run(flatten_errors, detail)}")
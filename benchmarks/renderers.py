@@ -0,0 +1,69 @@
+"""Compare DRF JSONRenderer of envelope converted by dataclasses.asdict() with ORJSONRenderer of dataclass.
+
+Run:
+    python -m benchmarks.renderers
+"""
+
+import time
+import tracemalloc
+from dataclasses import asdict
+
+from benchmarks.utils import setup_django
+
+setup_django()
+
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from apps.base.api.renderers import ORJSONRenderer  # noqa: E402
+from apps.base.response import ActionResponse, ErrorField, ErrorResponse  # noqa: E402
+
+ROUNDS = 2_000
+
+
+def make_list_response(size: int) -> ActionResponse:
+    results = [
+        {"id": number, "email": f"user{number}@example.com", "name": f"User {number}", "is_verified": True}
+        for number in range(size)
+    ]
+    return ActionResponse(message=None, status="success", data={"next": None, "results": results})
+
+
+def make_error_response(size: int) -> ErrorResponse:
+    errors = [
+        ErrorField(code="invalid", message="Enter a valid email address.", field=f"{n}.email") for n in range(size)
+    ]
+    return ErrorResponse(message="Invalid input.", status="validation_error", errors=errors)
+
+
+def drf_render(data) -> bytes:
+    return JSONRenderer().render(asdict(data))
+
+
+def orjson_render(data) -> bytes:
+    return ORJSONRenderer().render(data)
+
+
+def run(function, data) -> str:
+    start = time.perf_counter()
+    for __ in range(ROUNDS):
+        function(data)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    function(data)
+    __, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return f"{ROUNDS / elapsed:>10.0f} renders/s  peak {peak / 1024:8.1f} KiB"
+
+
+if __name__ == "__main__":
+    for name, data in [
+        ("list response, 50 objects", make_list_response(50)),
+        ("list response, 500 objects", make_list_response(500)),
+        ("error response, 100 errors", make_error_response(100)),
+    ]:
+        assert JSONRenderer().render(asdict(data)).replace(b" ", b"") == orjson_render(data).replace(b" ", b"")
+        print(name)
+        print(f"  json + asdict  {run(drf_render, data)}")
+        print(f"  orjson         {run(orjson_render, data)}")
@@ -0,0 +1,50 @@
+"""Memory and check time of registry of revoked tokens.
+
+Run:
+    python -m benchmarks.revocation
+"""
+
+import time
+import tracemalloc
+import uuid
+
+from benchmarks.utils import setup_django
+
+setup_django()
+
+from apps.api_authentication.api.revocation import RevocationStore, RevokedTokens  # noqa: E402
+
+SIZES = [10_000, 100_000, 1_000_000]
+CHECKS = 1_000_000
+
+
+class EmptyStore(RevocationStore):
+    def revoke(self, jti: str, exp: int, now: float):
+        pass
+
+    def get_revoked(self, since: float) -> list:
+        return []
+
+
+if __name__ == "__main__":
+    exp = int(time.time()) + 3600
+    for size in SIZES:
+        jtis = [uuid.uuid4().hex for __ in range(size)]
+        revoked_tokens = RevokedTokens(EmptyStore(), sync_interval=3600)
+
+        tracemalloc.start()
+        for jti in jtis:
+            revoked_tokens.revoke(jti, exp)
+        __, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        checked = [jtis[number % size] if number % 2 else uuid.uuid4().hex for number in range(1000)]
+        start = time.perf_counter()
+        for number in range(CHECKS):
+            revoked_tokens.is_revoked(checked[number % 1000])
+        elapsed = time.perf_counter() - start
+
+        print(
+            f"tokens={size:<9} {peak / size:6.1f} bytes/token  {peak / 1024 / 1024:7.1f} MiB  "
+            f"{elapsed * 1e9 / CHECKS:6.0f} ns/check"
+        )
@@ -0,0 +1,65 @@
+"""Compare peak memory of list response with all users and streaming list response.
+
+Run:
+    python -m benchmarks.streaming
+"""
+
+import time
+import tracemalloc
+
+from benchmarks.utils import setup_django, test_database
+
+setup_django()
+
+from django.contrib.auth import get_user_model  # noqa: E402
+from rest_framework.test import APIRequestFactory, force_authenticate  # noqa: E402
+
+from apps.users.api.views import UserViewSet  # noqa: E402
+
+User = get_user_model()
+
+SIZES = [10_000, 50_000, 100_000]
+
+
+class AllUsersViewSet(UserViewSet):
+    pagination_class = None
+
+    def list(self, request):
+        # Without response cache
+        return self.create_list_response()
+
+
+def create_users(start: int, stop: int) -> None:
+    User.objects.bulk_create(
+        (User(email=f"user{number}@example.com", name=f"User {number}") for number in range(start, stop)),
+        batch_size=5000,
+    )
+
+
+def run(name: str, admin, params: dict) -> None:
+    request = APIRequestFactory().get("/", params)
+    force_authenticate(request, admin)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    response = AllUsersViewSet.as_view({"get": "list"})(request)
+    size = (
+        sum(len(part) for part in response.streaming_content) if response.streaming else len(response.render().content)
+    )
+    elapsed = time.perf_counter() - start
+    __, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"  {name:<10} {size / 1024 / 1024:7.1f} MiB body  peak {peak / 1024 / 1024:7.1f} MiB  {elapsed:6.2f} s")
+
+
+if __name__ == "__main__":
+    with test_database():
+        admin = User.objects.create(email="admin@example.com", is_staff=True)
+        created = 1
+        for size in SIZES:
+            create_users(created, size)
+            created = size
+            print(f"users={size}")
+            run("full", admin, {})
+            run("streaming", admin, {"stream": "true"})
@@ -0,0 +1,79 @@
+"""Compare DRF history list throttle with token bucket throttle, on LocMem cache and on Redis.
+Redis part needs server at REDIS_URL, redis://localhost:6379/0 by default.
+
+Run:
+    python -m benchmarks.throttling
+"""
+
+import os
+import time
+
+from benchmarks.utils import setup_django
+
+setup_django()
+
+from django.contrib.auth.models import AnonymousUser  # noqa: E402
+from django.core.cache import cache  # noqa: E402
+from django.test import override_settings  # noqa: E402
+from rest_framework.test import APIRequestFactory  # noqa: E402
+from rest_framework.throttling import AnonRateThrottle  # noqa: E402
+
+from apps.base.api.throttling import (  # noqa: E402
+    AnonTokenBucketRateThrottle,
+    get_token_bucket_store,
+    token_bucket_stores,
+)
+
+RATE = "5000/hour"
+REQUESTS = 20_000
+REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
+REDIS_CACHES = {
+    "default": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": REDIS_URL,
+        "OPTIONS": {"CLIENT_CLASS": "django_redis.client.DefaultClient"},
+    }
+}
+
+
+class HistoryThrottle(AnonRateThrottle):
+    rate = RATE
+
+
+class BucketThrottle(AnonTokenBucketRateThrottle):
+    rate = RATE
+
+
+def run(throttle_class: type) -> float:
+    cache.clear()
+    request = APIRequestFactory().get("/")
+    request.user = AnonymousUser()
+
+    start = time.perf_counter()
+    for __ in range(REQUESTS):
+        throttle_class().allow_request(request, None)
+    return time.perf_counter() - start
+
+
+def report(backend: str):
+    token_bucket_stores.clear()
+    print(f"{backend}, store {get_token_bucket_store().__class__.__name__}")
+    for throttle in (HistoryThrottle, BucketThrottle):
+        elapsed = run(throttle)
+        print(
+            f"  {throttle.__name__:<16} {REQUESTS / elapsed:>12,.0f} checks/s {elapsed * 1e6 / REQUESTS:8.1f} us/check"
+        )
+
+
+if __name__ == "__main__":
+    report("LocMem")
+
+    with override_settings(CACHES=REDIS_CACHES):
+        from redis.exceptions import ConnectionError
+
+        try:
+            cache.client.get_client().ping()
+        except ConnectionError:
+            print(f"Redis at {REDIS_URL} is not available, Redis benchmark skipped")
+        else:
+            report("Redis")
@@ -1,6 +1,7 @@
 from django.conf import settings
 
 from apps.api_authentication.api.api_router import router as auth_router
+from apps.base.api.api_router import router as base_router
 from apps.users.api.api_router import router as user_router
 from apps.utils.router import DefaultApiRouter, SimpleApiRouter
 
@@ -15,5 +16,8 @@ router.extend(auth_router)
 # User apis
 router.extend(user_router)
 
+# Runtime stats for admins
+router.extend(base_router)
+
 app_name = "api"
 urlpatterns = router.urls
@@ -1,11 +1,13 @@
 import os
 
 from celery import Celery
+from celery.signals import beat_init, worker_init
 
 # set the default Django settings module for the 'celery' program.
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings.config.development")
 
-app = Celery("django-rest-template")
+# Tasks have result_policy option, see apps.base.task_results
+app = Celery("django-rest-template", task_cls="apps.base.task_results:ResultPolicyTask")
 
 # Using a string here means the worker doesn't have to serialize
 # the configuration object to child processes.
@@ -15,3 +17,12 @@ app.config_from_object("django.conf:settings", namespace="CELERY")
 
 # Load task modules from all registered Django app configs.
 app.autodiscover_tasks()
+
+
+@worker_init.connect
+@beat_init.connect
+def use_celery_database_pool(**kwargs):
+    """Database pools of worker and beat processes have sizes of "celery" process type"""
+    from apps.base.db.pool import CELERY, set_process_type
+
+    set_process_type(CELERY)
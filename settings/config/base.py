@@ -10,9 +10,12 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.2/ref/settings/
 """
 
+import os
+from datetime import timedelta
 from pathlib import Path
 
 import environ
+from celery.schedules import crontab
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
@@ -34,14 +37,41 @@ env = environ.Env(
     DEFAULT_DB_NAME=(str, "mysite"),
     DEFAULT_DB_USER_NAME=(str, "mysite"),
     DEFAULT_DB_PASSWORD=(str, "mysite"),
+    # Pool of database connections in every process
+    DB_POOL_TIMEOUT=(float, 10),
+    DB_POOL_MAX_LIFETIME=(float, 3600),
+    DB_POOL_MAX_IDLE=(float, 600),
+    DB_POOL_CHECK=(bool, False),
+    DB_POOL_WEB_MIN_SIZE=(int, 2),
+    DB_POOL_WEB_MAX_SIZE=(int, 10),
+    DB_POOL_CELERY_MIN_SIZE=(int, 1),
+    DB_POOL_CELERY_MAX_SIZE=(int, 2),
     # Email settings
     EMAIL_HOST=(str, ""),
     EMAIL_PORT=(int, 1025),
     WEBSITE_EMAIL=(str, "mysite@gmail.com"),
+    EMAIL_ASYNC_DELIVERY=(bool, True),
+    EMAIL_BATCH_SIZE=(int, 100),
     # Project name
     PROJECT_NAME=(str, "MySite"),
     # Celery config
     CELERY_BROKER_URL=(str, ""),
+    # Result backend: database or Django cache, see apps.base.result_backends
+    CELERY_RESULT_BACKEND=(str, "apps.base.result_backends:DatabaseBackend"),
+    # Days that task results are kept
+    TASK_RESULT_RETENTION_DAYS=(int, 7),
+    # Redis for cache
+    REDIS_URL=(str, "redis://localhost:6379/0"),
+    # Bulk import of users
+    USER_IMPORT_BATCH_SIZE=(int, 1000),
+    USER_IMPORT_WORKERS=(int, os.cpu_count() or 1),
+    # Purge of users that did not verify email
+    USER_PURGE_UNVERIFIED_AFTER_DAYS=(int, 30),
+    USER_PURGE_CHUNK_SIZE=(int, 1000),
+    # Native async views of user and auth apis, for ASGI server
+    API_ASYNC_VIEWS=(bool, False),
+    # Processes that hash and check passwords for request workers
+    PASSWORD_HASHING_WORKERS=(int, 2),
 )
 
 # SECURITY WARNING: keep the secret key used in production secret!
@@ -115,13 +145,42 @@ WSGI_APPLICATION = "settings.wsgi.application"
 
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.postgresql_psycopg2",
+        # PostgreSQL with pool of connections, connections are returned to pool after request and task
+        "ENGINE": "apps.base.db.postgresql_pool",
         "NAME": env.str("DEFAULT_DB_NAME"),
         "USER": env.str("DEFAULT_DB_USER_NAME"),
         "PASSWORD": env.str("DEFAULT_DB_PASSWORD"),
         "HOST": env.str("DEFAULT_DB_HOST"),
         "PORT": env.str("DEFAULT_DB_PORT"),
         "ATOMIC_REQUESTS": True,
+        "POOL": {
+            "timeout": env.float("DB_POOL_TIMEOUT"),
+            "max_lifetime": env.float("DB_POOL_MAX_LIFETIME"),
+            "max_idle": env.float("DB_POOL_MAX_IDLE"),
+            "check": env.bool("DB_POOL_CHECK"),
+        },
+    }
+}
+# Pool size of every process by process type. Web process serves requests in threads,
+# Celery prefork child runs one task at a time (beat and workers have "celery" type).
+DATABASE_POOL_SIZES = {
+    "web": {"min_size": env.int("DB_POOL_WEB_MIN_SIZE"), "max_size": env.int("DB_POOL_WEB_MAX_SIZE")},
+    "celery": {"min_size": env.int("DB_POOL_CELERY_MIN_SIZE"), "max_size": env.int("DB_POOL_CELERY_MAX_SIZE")},
+}
+
+# CACHES
+# ------------------------------------------------------------------------------
+# https://docs.djangoproject.com/en/dev/ref/settings/#caches
+CACHES = {
+    "default": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": env.str("REDIS_URL"),
+        "OPTIONS": {
+            "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            # Mimicking memcache behavior.
+            # https://github.com/jazzband/django-redis#memcached-exceptions-behavior
+            "IGNORE_EXCEPTIONS": True,
+        },
     }
 }
 
@@ -173,12 +232,23 @@ REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
         "rest_framework.authentication.SessionAuthentication",
         "rest_framework.authentication.TokenAuthentication",
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.api_authentication.api.authentication.CachedJWTAuthentication",
     ),
     # "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
     # "DEFAULT_FILTER_BACKENDS": (
     #     'rest_framework_filters.backends.RestFrameworkFilterBackend'
     # ),
+    "DEFAULT_RENDERER_CLASSES": (
+        "apps.base.api.renderers.ORJSONRenderer",
+        "apps.base.api.msgpack.MessagePackRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "apps.base.api.parsers.ORJSONParser",
+        "apps.base.api.msgpack.MessagePackParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "EXCEPTION_HANDLER": "drf_standardized_errors.handler.exception_handler",
 }
@@ -203,9 +273,15 @@ if USE_TZ:
 # https://docs.celeryq.dev/en/stable/userguide/configuration.html#std:setting-broker_url
 CELERY_BROKER_URL = env.str("CELERY_BROKER_URL")
 # https://docs.celeryq.dev/en/stable/userguide/configuration.html#std:setting-result_backend
-CELERY_RESULT_BACKEND = "django-db"
+# "apps.base.result_backends:CacheBackend" keeps results in cache of CELERY_CACHE_BACKEND alias instead of database
+CELERY_RESULT_BACKEND = env.str("CELERY_RESULT_BACKEND")
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#std:setting-cache_backend
+CELERY_CACHE_BACKEND = "default"
 # https://docs.celeryq.dev/en/stable/userguide/configuration.html#result-extended
+# Extended results are stored only for tasks with "extended" result policy (see apps.base.task_results)
 CELERY_RESULT_EXTENDED = True
+# https://docs.celeryq.dev/en/stable/userguide/configuration.html#result-expires
+CELERY_RESULT_EXPIRES = timedelta(days=env.int("TASK_RESULT_RETENTION_DAYS"))
 # https://docs.celeryq.dev/en/stable/userguide/configuration.html#result-backend-always-retry
 # https://github.com/celery/celery/pull/6122
 CELERY_RESULT_BACKEND_ALWAYS_RETRY = True
@@ -225,6 +301,23 @@ CELERY_TASK_TIME_LIMIT = 5 * 60
 CELERY_TASK_SOFT_TIME_LIMIT = 60
 # https://docs.celeryq.dev/en/stable/userguide/configuration.html#beat-scheduler
 CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
+# https://docs.celeryq.dev/en/stable/userguide/periodic-tasks.html#beat-entries
+# DatabaseScheduler adds entries to database on start, schedule can be changed in admin
+CELERY_BEAT_SCHEDULE = {
+    "purge-unverified-users": {
+        "task": "apps.users.tasks.purge_unverified_users_task",
+        "schedule": crontab(hour=3, minute=30),
+    },
+    # Hourly prune keeps number of deleted results per run small
+    "prune-task-results": {
+        "task": "apps.base.tasks.prune_task_results_task",
+        "schedule": crontab(minute=15),
+    },
+}
+# Results of tasks without result_policy option: "compact" or "extended" (see apps.base.task_results)
+TASK_RESULT_POLICY = "compact"
+# Number of task results deleted in one transaction of prune
+TASK_RESULT_PRUNE_CHUNK_SIZE = 1000
 # https://docs.celeryq.dev/en/stable/userguide/configuration.html#worker-send-task-events
 CELERY_WORKER_SEND_TASK_EVENTS = True
 # https://docs.celeryq.dev/en/stable/userguide/configuration.html#std-setting-task_send_sent_event
@@ -272,6 +365,11 @@ EMAIL_BACKEND = env(
 # https://docs.djangoproject.com/en/dev/ref/settings/#email-timeout
 EMAIL_TIMEOUT = 5
 
+# Send emails from Celery worker after transaction commit. Emails from one transaction sent in one batch
+EMAIL_ASYNC_DELIVERY = env.bool("EMAIL_ASYNC_DELIVERY")
+# Max number of emails sent by one task through one SMTP connection
+EMAIL_BATCH_SIZE = env.int("EMAIL_BATCH_SIZE")
+
 # Default email for website. From this email Django will send emails
 WEBSITE_EMAIL = env.str("WEBSITE_EMAIL")
 
@@ -281,16 +379,50 @@ PROJECT_NAME = env.str("PROJECT_NAME")
 # Default user model
 AUTH_USER_MODEL = "users.User"
 
+# Processes of password hashing pool, requests wait for hashing without holding the GIL.
+# 0 - hash passwords in request thread
+PASSWORD_HASHING_WORKERS = env.int("PASSWORD_HASHING_WORKERS")
+
+# Number of users inserted by one query in bulk import
+USER_IMPORT_BATCH_SIZE = env.int("USER_IMPORT_BATCH_SIZE")
+# Processes that hash passwords in bulk import. 0 - hash in current process
+USER_IMPORT_WORKERS = env.int("USER_IMPORT_WORKERS")
+
+# Unverified users are deleted after this number of days since registration
+USER_PURGE_UNVERIFIED_AFTER_DAYS = env.int("USER_PURGE_UNVERIFIED_AFTER_DAYS")
+# Number of users deleted in one transaction of purge
+USER_PURGE_CHUNK_SIZE = env.int("USER_PURGE_CHUNK_SIZE")
+
 # Simple JWT settings
 
 SIMPLE_JWT = {
     "USER_AUTHENTICATION_RULE": "apps.api_authentication.api.user_authentication_rule"
     ".user_rule_auth_active_and_verified",
+    "TOKEN_OBTAIN_SERIALIZER": "apps.api_authentication.api.serializers.PasswordStampTokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "apps.api_authentication.api.serializers.RevocableTokenRefreshSerializer",
+    "TOKEN_VERIFY_SERIALIZER": "apps.api_authentication.api.serializers.RevocableTokenVerifySerializer",
+    "AUTH_TOKEN_CLASSES": ("apps.api_authentication.api.tokens.RevocableAccessToken",),
 }
+# Users of JWT authenticated requests are cached, cache is invalidated on save of user
+AUTH_USER_CACHE_ALIAS = "default"
+AUTH_USER_CACHE_TIMEOUT = 60
+# Revoked JWT tokens (logout) are shared through cache, every process reads new revocations once per interval
+JWT_REVOCATION_CACHE_ALIAS = "default"
+JWT_REVOCATION_SYNC_INTERVAL = 1
 
 # Django DRF Standardized Errors
 
 DRF_STANDARDIZED_ERRORS = {"EXCEPTION_FORMATTER_CLASS": "apps.core.exception_handler.ApiResponseExceptionFormatter"}
+# Max number of errors in error response. None - return all errors
+API_MAX_ERRORS = 1000
+# Check writes of api actions without transaction (see apps.base.api.transactions)
+API_TRANSACTION_WRITE_CHECK = DEBUG
+# Several writes of api action without transaction raise error instead of warning, on in tests
+API_TRANSACTION_WRITE_CHECK_STRICT = False
+# Register async versions of user and auth viewsets. Use it with ASGI server (settings.asgi)
+API_ASYNC_VIEWS = env.bool("API_ASYNC_VIEWS")
+# Paginated lists with more rows by database estimate are not counted exactly (see apps.base.paginator)
+ESTIMATED_COUNT_THRESHOLD = 10000
 
 # STATIC
 # ------------------------------------------------------------------------------